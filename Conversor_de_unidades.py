@@ -2,16 +2,12 @@
 # PROGRAMA PRINCIPAL - main.py
 # ============================================================================
 
-from conversiones.Area import convertir_area
-from conversiones.Concentracion import (necesita_parametros_adicionales, convertir_concentracion, obtener_datos_mezcla, calcular_fracciones_mezcla_binaria, convertir_fraccion_masa_a_molar, convertir_fraccion_molar_a_masa)
-from conversiones.Temperatura import convertir_temperatura
-from conversiones.Densidad import convertir_densidad
-from conversiones.Energia import convertir_energia
-from conversiones.Longitud import convertir_longitud
-from conversiones.Masa import convertir_masa
-from conversiones.Presion import convertir_presion
-from conversiones.Velocidad import convertir_velocidad
-from conversiones.Volumen import convertir_volumen
+import os
+import sys
+
+# Los módulos de conversión se importan al elegir cada opción del menú, de modo
+# que el menú aparece sin cargar todas las magnitudes.
+from conversiones.Cache import memorizar
 
 
 def mostrar_menu_principal():
@@ -31,6 +27,7 @@ def mostrar_menu_principal():
     print("9. Longitud")
     print("10. Área")
     print("11. Ayuda y ejemplos")
+    print("12. Tabla: una cantidad en todas las unidades")
     print("0. Salir")
     print("-" * 60)
 
@@ -76,6 +73,8 @@ def manejar_conversion_generica(tipo_conversion, funcion_convertir, unidades_dis
 
 def manejar_conversion_volumen():
     """Maneja la conversión de unidades de volumen."""
+    from conversiones.Volumen import convertir_volumen
+    
     unidades_disponibles = [
         "1. Litros (L)",
         "2. Mililitros (mL)",
@@ -104,10 +103,12 @@ def manejar_conversion_volumen():
         "16": "Yardas cúbicas"
     }
     
-    return manejar_conversion_generica("Volumen", convertir_volumen, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Volumen", memorizar("volumen", convertir_volumen), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_temperatura():
     """Maneja la conversión de unidades de temperatura."""
+    from conversiones.Temperatura import convertir_temperatura
+    
     unidades_disponibles = [
         "1. Celsius (°C)",
         "2. Fahrenheit (°F)",
@@ -121,10 +122,12 @@ def manejar_conversion_temperatura():
         "4": "Rankine", "5": "Réaumur"
     }
     
-    return manejar_conversion_generica("Temperatura", convertir_temperatura, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Temperatura", memorizar("temperatura", convertir_temperatura), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_densidad():
     """Maneja la conversión de unidades de densidad."""
+    from conversiones.Densidad import convertir_densidad
+    
     unidades_disponibles = [
         "1. kg/m³",
         "2. g/cm³",
@@ -138,10 +141,12 @@ def manejar_conversion_densidad():
         "4": "lb/ft³", "5": "lb/in³"
     }
     
-    return manejar_conversion_generica("Densidad", convertir_densidad, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Densidad", memorizar("densidad", convertir_densidad), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_velocidad():
     """Maneja la conversión de unidades de velocidad."""
+    from conversiones.Velocidad import convertir_velocidad
+    
     unidades_disponibles = [
         "1. m/s (metros por segundo)",
         "2. km/h (kilómetros por hora)",
@@ -155,10 +160,12 @@ def manejar_conversion_velocidad():
         "4": "ft/s", "5": "nudos"
     }
     
-    return manejar_conversion_generica("Velocidad", convertir_velocidad, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Velocidad", memorizar("velocidad", convertir_velocidad), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_masa():
     """Maneja la conversión de unidades de masa."""
+    from conversiones.Masa import convertir_masa
+    
     unidades_disponibles = [
         "1. Kilogramos (kg)",
         "2. Gramos (g)",
@@ -177,10 +184,12 @@ def manejar_conversion_masa():
         "7": "Piedras", "8": "Toneladas métricas", "9": "Toneladas cortas"
     }
     
-    return manejar_conversion_generica("Masa", convertir_masa, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Masa", memorizar("masa", convertir_masa), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_energia():
     """Maneja la conversión de unidades de energía."""
+    from conversiones.Energia import convertir_energia
+    
     unidades_disponibles = [
         "1. Joules (J)",
         "2. Calorías (cal)",
@@ -198,10 +207,12 @@ def manejar_conversion_energia():
         "7": "Vatios-hora", "8": "Kilovatios-hora"
     }
     
-    return manejar_conversion_generica("Energía", convertir_energia, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Energía", memorizar("energia", convertir_energia), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_presion():
     """Maneja la conversión de unidades de presión."""
+    from conversiones.Presion import convertir_presion
+    
     unidades_disponibles = [
         "1. Pascales (Pa)",
         "2. Kilopascales (kPa)",
@@ -223,10 +234,12 @@ def manejar_conversion_presion():
         "10": "inH2O", "11": "mmH2O"
     }
     
-    return manejar_conversion_generica("Presión", convertir_presion, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Presión", memorizar("presion", convertir_presion), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_longitud():
     """Maneja la conversión de unidades de longitud."""
+    from conversiones.Longitud import convertir_longitud
+    
     unidades_disponibles = [
         "1. Metros (m)",
         "2. Centímetros (cm)",
@@ -245,10 +258,12 @@ def manejar_conversion_longitud():
         "7": "Yardas", "8": "Millas", "9": "Micrómetros"
     }
     
-    return manejar_conversion_generica("Longitud", convertir_longitud, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Longitud", memorizar("longitud", convertir_longitud), unidades_disponibles, nombres_unidades)
 
 def manejar_conversion_area():
     """Maneja la conversión de unidades de área."""
+    from conversiones.Area import convertir_area
+    
     unidades_disponibles = [
         "1. Metros cuadrados (m²)",
         "2. Centímetros cuadrados (cm²)",
@@ -267,7 +282,7 @@ def manejar_conversion_area():
         "7": "yd²", "8": "Hectáreas", "9": "Acres"
     }
     
-    return manejar_conversion_generica("Área", convertir_area, unidades_disponibles, nombres_unidades)
+    return manejar_conversion_generica("Área", memorizar("area", convertir_area), unidades_disponibles, nombres_unidades)
 
 def mostrar_resultados_fraccion_binaria(resultado, cantidad, nombres_unidades, unidad_inicial, unidad_final):
     """Muestra los resultados detallados para conversiones de fracciones binarias."""
@@ -303,6 +318,9 @@ def mostrar_resultados_fraccion_binaria(resultado, cantidad, nombres_unidades, u
 
 def manejar_conversion_concentracion():
     """Maneja la conversión de unidades de concentración."""
+    from conversiones.Concentracion import (necesita_parametros_adicionales, convertir_concentracion,
+                                            obtener_datos_mezcla)
+    
     print("\nUnidades de concentración disponibles:")
     print("1. Molaridad (mol/L)")
     print("2. Molalidad (mol/kg)")
@@ -374,7 +392,7 @@ def manejar_conversion_concentracion():
                 print("💡 Para soluciones acuosas diluidas, use ~1.0 g/mL")
                 densidad = float(input("Ingrese la densidad de la solución (g/mL): ").strip())
         
-        resultado = convertir_concentracion(
+        resultado = memorizar("concentracion", convertir_concentracion)(
             unidad_inicial, unidad_final, cantidad, 
             masa_molar=masa_molar, densidad=densidad, datos_mezcla=datos_mezcla
         )
@@ -429,6 +447,58 @@ def manejar_conversion_concentracion():
         print(f"❌ Error inesperado: {e}")
         return None
 
+# Magnitudes del menú principal, para la tabla de todas las unidades
+MAGNITUDES_MENU = {
+    "1": "volumen", "2": "temperatura", "3": "concentracion", "4": "densidad",
+    "5": "velocidad", "6": "masa", "7": "energia", "8": "presion",
+    "9": "longitud", "10": "area"
+}
+
+def manejar_tabla_todas_unidades():
+    """Convierte una o varias cantidades a todas las unidades de una magnitud y muestra la tabla."""
+    from conversiones.Convertidores import convertir_a_todas, formatear_tabla
+    from conversiones.Registro import obtener_magnitud
+    
+    print("\nMagnitudes disponibles:")
+    for numero, nombre in MAGNITUDES_MENU.items():
+        print(f"{numero}. {nombre.capitalize()}")
+    magnitud = MAGNITUDES_MENU.get(input("Ingrese el número de la magnitud: ").strip())
+    if magnitud is None:
+        print("❌ Error: Magnitud no válida.")
+        return None
+    
+    print(f"\nUnidades de {magnitud} disponibles:")
+    for numero, unidad in enumerate(obtener_magnitud(magnitud).unidades, 1):
+        print(f"{numero}. {unidad}")
+    unidad_inicial = input("Ingrese el número, nombre o símbolo de la unidad inicial: ").strip()
+    
+    try:
+        texto = input("Ingrese la(s) cantidad(es) separadas por espacios: ").replace(",", " ")
+        valores = [float(valor) for valor in texto.split()]
+        if not valores:
+            raise ValueError("Debe ingresar al menos una cantidad.")
+        
+        parametros = {}
+        if magnitud == "concentracion":
+            masa_molar = input("Masa molar del soluto en g/mol (Enter para omitir): ").strip()
+            densidad = input("Densidad de la solución en g/mL (Enter para omitir): ").strip()
+            if masa_molar:
+                parametros["masa_molar"] = float(masa_molar)
+            if densidad:
+                parametros["densidad"] = float(densidad)
+        
+        unidades, matriz = convertir_a_todas(magnitud, unidad_inicial, valores, **parametros)
+        print()
+        print(formatear_tabla(unidades, valores, matriz))
+        return matriz
+        
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return None
+    except ImportError:
+        print("❌ Error: La tabla de todas las unidades requiere NumPy.")
+        return None
+
 def mostrar_ayuda():
     """Muestra ayuda y ejemplos de uso."""
     print("\n" + "=" * 60)
@@ -451,6 +521,7 @@ def mostrar_ayuda():
     print("• Área: 1 m² = 10,000 cm² = 10.76 ft²")
     print("• Energía: 1 kWh = 3.6 MJ = 860 kcal")
     print("• Densidad: 1 g/cm³ = 1000 kg/m³")
+    print("• Opción 12: una o varias cantidades en todas las unidades de una magnitud")
     
     print("\n🧪 CONCENTRACIONES ESPECIALES:")
     print("• Fracción molar: Proporción de moles de soluto respecto al total")
@@ -488,7 +559,8 @@ def conversion_unidades():
         "8": manejar_conversion_presion,
         "9": manejar_conversion_longitud,
         "10": manejar_conversion_area,
-        "11": mostrar_ayuda
+        "11": mostrar_ayuda,
+        "12": manejar_tabla_todas_unidades
     }
     
     print("🔧 Bienvenido al Conversor de Unidades Científicas")
@@ -497,7 +569,7 @@ def conversion_unidades():
     while True:
         try:
             mostrar_menu_principal()
-            opcion = input("Seleccione una opción (0-11): ").strip()
+            opcion = input("Seleccione una opción (0-12): ").strip()
             
             if opcion == "0":
                 print("\n🎉 ¡Gracias por usar el conversor de unidades!")
@@ -522,7 +594,7 @@ def conversion_unidades():
                     print("\n🔄 Intente nuevamente con valores válidos...")
                     
             else:
-                print("❌ Opción no válida. Por favor, seleccione un número del 0 al 11.")
+                print("❌ Opción no válida. Por favor, seleccione un número del 0 al 12.")
                 
         except KeyboardInterrupt:
             print("\n\n👋 ¡Hasta luego!")
@@ -531,6 +603,230 @@ def conversion_unidades():
             print(f"❌ Error inesperado: {e}")
             print("🔄 Intente nuevamente...")
 
+def ejecutar_csv(args):
+    """Convierte columnas de un archivo CSV/TSV sin pasar por el menú interactivo."""
+    from contextlib import nullcontext
+    
+    from conversiones.Archivos import abrir_salida, convertir_csv
+    from conversiones.Convertidores import obtener_convertidor
+    
+    convertidor = obtener_convertidor(
+        args.magnitud, args.unidad_inicial, args.unidad_final,
+        masa_molar=args.masa_molar, densidad=args.densidad
+    )
+    columnas = [columna.strip() for columna in args.columnas.split(",") if columna.strip()]
+    
+    delimitador = args.delimitador
+    if delimitador is None:
+        delimitador = "\t" if args.entrada.lower().endswith((".tsv", ".tab")) else ","
+    
+    # La salida se escribe en un temporal y solo reemplaza al destino si todo va bien:
+    # un error (o una salida igual a la entrada) no deja archivos vacíos ni a medias
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, newline="", encoding="utf-8")
+    if args.salida == "-":
+        destino = nullcontext(sys.stdout)
+    else:
+        destino = abrir_salida(args.salida, newline="", encoding="utf-8")
+    try:
+        with destino as salida:
+            estadisticas = convertir_csv(
+                entrada, salida, convertidor, columnas,
+                delimitador=delimitador, encabezado=args.encabezado, tamano_bloque=args.bloque
+            )
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+    
+    segundos = estadisticas["segundos"]
+    velocidad = estadisticas["valores"] / segundos if segundos > 0 else float("inf")
+    print(f"✓ {estadisticas['filas']} filas, {estadisticas['valores']} valores convertidos "
+          f"en {segundos:.3f} s ({velocidad:,.0f} valores/s)", file=sys.stderr)
+
+def ejecutar_binario(args):
+    """Convierte un archivo .npy o binario plano mapeándolo en memoria por bloques."""
+    from conversiones.Archivos import convertir_binario
+    from conversiones.Convertidores import obtener_convertidor
+    
+    if args.salida is None and not args.en_sitio:
+        raise ValueError("Indique un archivo de salida o use --en-sitio para sobrescribir la entrada.")
+    
+    convertidor = obtener_convertidor(
+        args.magnitud, args.unidad_inicial, args.unidad_final,
+        masa_molar=args.masa_molar, densidad=args.densidad
+    )
+    estadisticas = convertir_binario(
+        args.entrada, convertidor, ruta_salida=args.salida,
+        dtype=args.dtype, tamano_bloque=args.bloque
+    )
+    
+    segundos = estadisticas["segundos"]
+    velocidad = estadisticas["valores"] / segundos if segundos > 0 else float("inf")
+    print(f"✓ {estadisticas['valores']} valores convertidos "
+          f"en {segundos:.3f} s ({velocidad:,.0f} valores/s)", file=sys.stderr)
+
+def ejecutar_servidor(args):
+    """Inicia el servicio HTTP local de conversión."""
+    import asyncio
+    
+    from conversiones.ServidorHTTP import servir
+    
+    try:
+        asyncio.run(servir(args.host, args.puerto))
+    except KeyboardInterrupt:
+        print("\n👋 Servicio detenido.", file=sys.stderr)
+
+def ejecutar_servidor_binario(args):
+    """Inicia el servidor de protocolo binario sobre un socket Unix."""
+    import asyncio
+    
+    from conversiones.ServidorBinario import servir
+    
+    try:
+        asyncio.run(servir(args.socket))
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido.", file=sys.stderr)
+
+def crear_parser():
+    """Crea el parser de la línea de comandos. Sin subcomando se inicia el menú interactivo."""
+    import argparse
+    
+    from conversiones.Registro import TIPOS
+    
+    def entero_positivo(texto):
+        try:
+            valor = int(texto)
+        except ValueError:
+            valor = 0
+        if valor <= 0:
+            raise argparse.ArgumentTypeError(f"debe ser un entero positivo: '{texto}'")
+        return valor
+    
+    parser = argparse.ArgumentParser(
+        description="Conversor de unidades científicas. Sin argumentos inicia el menú interactivo."
+    )
+    parser.add_argument("--cache", type=int, default=0, metavar="N",
+                        help="Activa una caché LRU de N resultados y muestra sus estadísticas al salir")
+    parser.add_argument("--metricas", metavar="ARCHIVO", default=None,
+                        help="Registra llamadas, errores y latencias por par de unidades y las guarda en JSON al salir")
+    parser.add_argument("--perfil", metavar="ARCHIVO", default=None,
+                        help="Perfila la sesión y guarda el perfil y un resumen (ARCHIVO.txt). Si es un "
+                             "directorio, crea un archivo por sesión. También: variable CONVERSOR_PERFIL")
+    parser.add_argument("--perfil-formato", choices=("pstats", "colapsado"), default=None,
+                        help="pstats (cProfile, por defecto) o colapsado (muestreo, para flame graphs)")
+    subcomandos = parser.add_subparsers(dest="comando")
+    
+    parser_csv = subcomandos.add_parser("csv", help="Convierte columnas de un archivo CSV/TSV en streaming")
+    parser_csv.add_argument("magnitud", help="Magnitud: volumen, temperatura, concentracion, densidad, "
+                                             "velocidad, masa, energia, presion, longitud, area")
+    parser_csv.add_argument("unidad_inicial", help="Número, nombre o símbolo (Pa, psi, °C...) de la unidad inicial")
+    parser_csv.add_argument("unidad_final", help="Número, nombre o símbolo de la unidad final")
+    parser_csv.add_argument("entrada", nargs="?", default="-", help="Archivo de entrada (- para stdin)")
+    parser_csv.add_argument("salida", nargs="?", default="-", help="Archivo de salida (- para stdout)")
+    parser_csv.add_argument("-c", "--columnas", required=True,
+                            help="Columnas a convertir separadas por comas (números 1-based o nombres)")
+    parser_csv.add_argument("-d", "--delimitador", default=None,
+                            help="Separador de campos (por defecto tabulador para .tsv y coma en otro caso)")
+    parser_csv.add_argument("--encabezado", action="store_true", help="La primera fila es un encabezado")
+    parser_csv.add_argument("--bloque", type=entero_positivo, default=10_000, help="Filas por bloque (por defecto 10000)")
+    parser_csv.add_argument("--masa-molar", type=float, default=None, help="Masa molar del soluto (g/mol)")
+    parser_csv.add_argument("--densidad", type=float, default=None, help="Densidad de la solución (g/mL)")
+    parser_csv.set_defaults(funcion=ejecutar_csv)
+    
+    parser_binario = subcomandos.add_parser(
+        "binario", help="Convierte un archivo .npy o binario plano mapeado en memoria por bloques"
+    )
+    parser_binario.add_argument("magnitud", help="Magnitud: volumen, temperatura, concentracion, densidad, "
+                                                 "velocidad, masa, energia, presion, longitud, area")
+    parser_binario.add_argument("unidad_inicial", help="Número, nombre o símbolo (Pa, psi, °C...) de la unidad inicial")
+    parser_binario.add_argument("unidad_final", help="Número, nombre o símbolo de la unidad final")
+    parser_binario.add_argument("entrada", help="Archivo .npy o binario plano de entrada")
+    parser_binario.add_argument("salida", nargs="?", default=None, help="Archivo de salida (.npy o plano)")
+    parser_binario.add_argument("--en-sitio", action="store_true", help="Sobrescribir el archivo de entrada")
+    parser_binario.add_argument("--dtype", choices=TIPOS, default="float64",
+                                help="Tipo de los archivos planos: float64 o float32 (por defecto float64)")
+    parser_binario.add_argument("--bloque", type=entero_positivo, default=1_048_576,
+                                help="Valores por bloque (por defecto 1048576)")
+    parser_binario.add_argument("--masa-molar", type=float, default=None, help="Masa molar del soluto (g/mol)")
+    parser_binario.add_argument("--densidad", type=float, default=None, help="Densidad de la solución (g/mL)")
+    parser_binario.set_defaults(funcion=ejecutar_binario)
+    
+    parser_servidor = subcomandos.add_parser("servidor", help="Inicia el servicio HTTP local de conversión")
+    parser_servidor.add_argument("--host", default="127.0.0.1", help="Dirección de escucha (por defecto 127.0.0.1)")
+    parser_servidor.add_argument("--puerto", type=int, default=8765, help="Puerto de escucha (por defecto 8765)")
+    parser_servidor.set_defaults(funcion=ejecutar_servidor)
+    
+    parser_binario_uds = subcomandos.add_parser(
+        "servidor-binario", help="Inicia el servidor de protocolo binario sobre un socket Unix"
+    )
+    parser_binario_uds.add_argument("--socket", default="/tmp/conversor.sock",
+                                    help="Ruta del socket Unix (por defecto /tmp/conversor.sock)")
+    parser_binario_uds.set_defaults(funcion=ejecutar_servidor_binario)
+    
+    return parser
+
+def guardar_metricas(ruta):
+    """Guarda en JSON la instantánea de la instrumentación."""
+    import json
+    
+    from conversiones.Instrumentacion import instantanea
+    
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(instantanea(), archivo, indent=2, ensure_ascii=False)
+    print(f"📊 Métricas guardadas en {ruta}", file=sys.stderr)
+
+def main(argv=None):
+    """Punto de entrada: menú interactivo o subcomando no interactivo."""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Sin argumentos se va directo al menú, sin cargar argparse
+    # (salvo que el perfilado esté activado por variable de entorno)
+    if not argv and "CONVERSOR_PERFIL" not in os.environ:
+        conversion_unidades()
+        return 0
+    
+    args = crear_parser().parse_args(argv)
+    
+    if args.perfil is None:
+        from conversiones.Perfilado import configuracion_de_entorno
+        ruta, formato = configuracion_de_entorno()
+        if ruta is not None:
+            args.perfil = ruta
+            args.perfil_formato = args.perfil_formato or formato
+    
+    if args.cache > 0:
+        from conversiones.Cache import activar_cache
+        activar_cache(args.cache)
+    
+    if args.metricas:
+        from conversiones.Instrumentacion import activar_instrumentacion
+        activar_instrumentacion(sys.modules[__name__])
+    
+    if args.comando is None:
+        ejecutar = conversion_unidades
+    else:
+        ejecutar = lambda: args.funcion(args)
+    
+    try:
+        if args.perfil:
+            from conversiones.Perfilado import perfilar
+            perfilar(ejecutar, args.perfil, args.perfil_formato or "pstats")
+        else:
+            ejecutar()
+    except (ValueError, OSError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        from conversiones.Cache import estadisticas_cache
+        estadisticas = estadisticas_cache()
+        if estadisticas is not None:
+            print(f"📊 Caché: {estadisticas['aciertos']} aciertos, {estadisticas['fallos']} fallos, "
+                  f"{estadisticas['desalojos']} desalojos ({estadisticas['tasa_aciertos']:.1%} de aciertos)",
+                  file=sys.stderr)
+        if args.metricas:
+            guardar_metricas(args.metricas)
+    return 0
+
 # Ejecutar el programa
 if __name__ == "__main__":
-    conversion_unidades()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
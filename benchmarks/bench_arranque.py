@@ -0,0 +1,97 @@
+# ============================================================================
+# BENCHMARK - Tiempo de arranque del conversor (python -X importtime)
+# ============================================================================
+#
+# Uso (desde la raíz del repositorio):
+#     python benchmarks/bench_arranque.py
+#     python benchmarks/bench_arranque.py --maximo-ms 30
+#
+# Termina con código 1 si el arranque supera --maximo-ms o si alguno de los
+# módulos de magnitudes se importa antes de elegir una opción del menú.
+
+import argparse
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que pueden cargarse antes de mostrar el menú
+MODULOS_PERMITIDOS = {"conversiones", "conversiones.Cache"}
+
+ESCENARIOS = {
+    "menú": "import Conversor_de_unidades",
+    "menú + temperatura": "import Conversor_de_unidades; import conversiones.Temperatura",
+    "todas las magnitudes": "import Conversor_de_unidades; "
+                            "from conversiones.Registro import cargar_magnitudes; cargar_magnitudes()",
+}
+
+
+def medir_importaciones(codigo, ignorar=frozenset()):
+    """
+    Ejecuta el código en un intérprete nuevo con -X importtime.
+
+    Args:
+        codigo: Código a ejecutar con python -c
+        ignorar: Módulos de nivel superior que no se suman (los del arranque del intérprete)
+
+    Returns:
+        tuple: (microsegundos totales, {módulo: microsegundos acumulados})
+    """
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=RAIZ, capture_output=True, text=True, check=True
+    ).stderr
+
+    modulos = {}
+    total = 0
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        acumulado = int(acumulado)
+        modulos[nombre.strip()] = acumulado
+        # Las importaciones de nivel superior llevan un solo espacio de sangría
+        if not nombre[1:].startswith(" ") and nombre.strip() not in ignorar:
+            total += acumulado
+    return total, modulos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de arranque del conversor")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--maximo-ms", type=float, default=None,
+                        help="Falla si el arranque del menú supera este tiempo")
+    args = parser.parse_args()
+
+    # Lo que el intérprete importa al arrancar (site, encodings...) no cuenta
+    _, arranque = medir_importaciones("pass")
+    ignorar = frozenset(arranque)
+
+    resultados = {}
+    modulos_menu = {}
+    for escenario, codigo in ESCENARIOS.items():
+        mediciones = [medir_importaciones(codigo, ignorar) for _ in range(args.repeticiones)]
+        resultados[escenario] = min(total for total, _ in mediciones) / 1000
+        if escenario == "menú":
+            modulos_menu = mediciones[0][1]
+
+    print(f"{'Escenario':<24}{'Importaciones (ms)':>20}")
+    print("-" * 44)
+    for escenario, milisegundos in resultados.items():
+        print(f"{escenario:<24}{milisegundos:>20.2f}")
+
+    cargados = sorted(nombre for nombre in modulos_menu
+                      if nombre.startswith("conversiones") and nombre not in MODULOS_PERMITIDOS)
+    codigo_salida = 0
+    if cargados:
+        print(f"\n❌ Módulos cargados antes del menú: {', '.join(cargados)}")
+        codigo_salida = 1
+    if args.maximo_ms is not None and resultados["menú"] > args.maximo_ms:
+        print(f"\n❌ El arranque del menú ({resultados['menú']:.2f} ms) supera {args.maximo_ms} ms")
+        codigo_salida = 1
+    return codigo_salida
+
+
+if __name__ == "__main__":
+    sys.exit(main())
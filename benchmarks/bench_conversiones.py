@@ -0,0 +1,184 @@
+# ============================================================================
+# BENCHMARK - Suite de microbenchmarks de todos los convertidores
+# ============================================================================
+#
+# Uso (desde la raíz del repositorio):
+#     python benchmarks/bench_conversiones.py --salida base.json
+#     python benchmarks/bench_conversiones.py --base base.json --umbral 0.10
+#     python benchmarks/bench_conversiones.py --filtro concentracion
+#
+# Con --base, termina con código 1 si algún caso es más lento que la base en más
+# del umbral indicado (por defecto 10 %).
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.Area import convertir_area
+from conversiones.Concentracion import (
+    calcular_fracciones_mezcla_binaria, convertir_concentracion,
+    convertir_fraccion_masa_a_molar, convertir_fraccion_molar_a_masa
+)
+from conversiones.Convertidores import obtener_convertidor
+from conversiones.Densidad import convertir_densidad
+from conversiones.Energia import convertir_energia
+from conversiones.Especializadas import funcion_par
+from conversiones.Longitud import convertir_longitud
+from conversiones.Masa import convertir_masa
+from conversiones.Presion import convertir_presion
+from conversiones.Temperatura import convertir_temperatura
+from conversiones.Velocidad import convertir_velocidad
+from conversiones.Volumen import convertir_volumen
+
+# Para cada función: unidad inicial y final por número y por nombre
+FUNCIONES_SIMPLES = {
+    "volumen": (convertir_volumen, ("1", "16"), ("litros", "yardas_cubicas")),
+    "temperatura": (convertir_temperatura, ("1", "2"), ("celsius", "fahrenheit")),
+    "densidad": (convertir_densidad, ("1", "5"), ("kg_m3", "lb_in3")),
+    "velocidad": (convertir_velocidad, ("1", "5"), ("m_s", "nudos")),
+    "masa": (convertir_masa, ("1", "9"), ("kg", "toneladas_cortas")),
+    "energia": (convertir_energia, ("1", "8"), ("joules", "kilovatios_hora")),
+    "presion": (convertir_presion, ("1", "11"), ("pascales", "mmh2o")),
+    "longitud": (convertir_longitud, ("1", "9"), ("metros", "micrometros")),
+    "area": (convertir_area, ("1", "9"), ("metros_cuadrados", "acres")),
+}
+
+MEZCLA_BINARIA = {
+    "componentes": [
+        {"nombre": "agua", "peso_molecular": 18.015},
+        {"nombre": "etanol", "peso_molecular": 46.07},
+    ],
+    "indice_componente": 0,
+}
+
+MEZCLA_MULTICOMPONENTE = {
+    "componentes": [
+        {"nombre": "agua", "peso_molecular": 18.015},
+        {"nombre": "etanol", "peso_molecular": 46.07},
+        {"nombre": "metanol", "peso_molecular": 32.04},
+        {"nombre": "acetona", "peso_molecular": 58.08},
+    ],
+    "indice_componente": 1,
+}
+
+
+def crear_casos():
+    """Devuelve un diccionario {nombre del caso: función sin argumentos}."""
+    casos = {}
+    for magnitud, (funcion, numeros, nombres) in FUNCIONES_SIMPLES.items():
+        casos[f"{magnitud}/misma_unidad"] = lambda f=funcion, u=numeros[0]: f(u, u, 12.5)
+        casos[f"{magnitud}/numero"] = lambda f=funcion, u=numeros: f(u[0], u[1], 12.5)
+        casos[f"{magnitud}/nombre"] = lambda f=funcion, u=nombres: f(u[0], u[1], 12.5)
+        # Mismo par con el convertidor compilado y con la función generada
+        compilado = obtener_convertidor(magnitud, *numeros)
+        generada = funcion_par(magnitud, *numeros)
+        casos[f"{magnitud}/compilado"] = lambda f=compilado: f(12.5)
+        casos[f"{magnitud}/generada"] = lambda f=generada: f(12.5)
+
+    c = convertir_concentracion
+    casos.update({
+        "concentracion/misma_unidad": lambda: c("7", "7", 12.5),
+        "concentracion/numero": lambda: c("1", "7", 0.5, masa_molar=58.44),
+        "concentracion/nombre": lambda: c("molaridad", "ppm", 0.5, masa_molar=58.44),
+        "concentracion/porcentaje_mm": lambda: c("12", "9", 5.0, densidad=1.05),
+        "concentracion/molalidad_a_molaridad": lambda: c("2", "1", 0.5, masa_molar=58.44, densidad=1.02),
+        "concentracion/g_l_a_molalidad": lambda: c("9", "2", 30.0, masa_molar=58.44, densidad=1.02),
+        "concentracion/mezcla_binaria": lambda: c("4", "3", 0.4, datos_mezcla=MEZCLA_BINARIA),
+        "concentracion/mezcla_multicomponente": lambda: c("3", "4", 0.2, datos_mezcla=MEZCLA_MULTICOMPONENTE),
+        "fracciones/binaria_masa": lambda: calcular_fracciones_mezcla_binaria(0.4, 18.015, 46.07, "masa"),
+        "fracciones/binaria_molar": lambda: calcular_fracciones_mezcla_binaria(0.4, 18.015, 46.07, "molar"),
+        "fracciones/masa_a_molar": lambda: convertir_fraccion_masa_a_molar(
+            0.2, MEZCLA_MULTICOMPONENTE["componentes"], 1),
+        "fracciones/molar_a_masa": lambda: convertir_fraccion_molar_a_masa(
+            0.2, MEZCLA_MULTICOMPONENTE["componentes"], 1),
+    })
+
+    from conversiones.Convertidores import convertir
+    casos["api/convertir_numero"] = lambda: convertir("presion", "1", "11", 12.5)
+    casos["api/convertir_simbolo"] = lambda: convertir("presion", "Pa", "mm H2O", 12.5)
+
+    try:
+        import numpy as np
+    except ImportError:
+        return casos
+
+    from conversiones.Concentracion import convertir_composicion_masa_a_molar, convertir_composicion_molar_a_masa
+    pesos = np.array([componente["peso_molecular"] for componente in MEZCLA_MULTICOMPONENTE["componentes"]])
+    composiciones = np.random.default_rng(0).dirichlet(np.ones(pesos.size), size=1000)
+    casos["fracciones/composicion_masa_a_molar_1000"] = lambda: convertir_composicion_masa_a_molar(composiciones, pesos)
+    casos["fracciones/composicion_molar_a_masa_1000"] = lambda: convertir_composicion_molar_a_masa(composiciones, pesos)
+
+    from conversiones.Presion import convertir_presion_mixto
+    from conversiones.Temperatura import convertir_temperatura_mixto
+    generador = np.random.default_rng(0)
+    numeros_presion = generador.integers(1, 12, 1000)
+    numeros_temperatura = generador.integers(1, 9, 1000)
+    valores = generador.random(1000) * 100
+    casos["mixto/presion_1000"] = lambda: convertir_presion_mixto(numeros_presion, "pascales", valores)
+    casos["mixto/temperatura_1000"] = lambda: convertir_temperatura_mixto(numeros_temperatura, "kelvin", valores)
+    return casos
+
+
+def medir(funcion, repeticiones):
+    """Devuelve el mejor tiempo por llamada en nanosegundos."""
+    temporizador = timeit.Timer(funcion)
+    numero, _ = temporizador.autorange()
+    return min(temporizador.repeat(repeat=repeticiones, number=numero)) / numero * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks de los convertidores")
+    parser.add_argument("--salida", help="Guarda los resultados en este archivo JSON")
+    parser.add_argument("--base", help="Archivo JSON de una ejecución anterior para comparar")
+    parser.add_argument("--umbral", type=float, default=0.10,
+                        help="Regresión máxima admitida respecto a la base (0.10 = 10 %%)")
+    parser.add_argument("--filtro", default="", help="Solo ejecuta los casos que contengan este texto")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    base = {}
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+
+    resultados = {}
+    regresiones = []
+    print(f"{'Caso':<48}{'ns/llamada':>12}{'Base':>12}{'Cambio':>10}")
+    print("-" * 82)
+    for nombre, funcion in crear_casos().items():
+        if args.filtro not in nombre:
+            continue
+        nanosegundos = medir(funcion, args.repeticiones)
+        resultados[nombre] = nanosegundos
+
+        linea = f"{nombre:<48}{nanosegundos:>12.1f}"
+        if nombre in base:
+            cambio = nanosegundos / base[nombre] - 1
+            linea += f"{base[nombre]:>12.1f}{cambio:>+9.1%}"
+            if cambio > args.umbral:
+                linea += "  ❌"
+                regresiones.append(nombre)
+        print(linea)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "unidad": "ns/llamada",
+                "resultados": resultados,
+            }, archivo, indent=2, ensure_ascii=False)
+
+    if regresiones:
+        print(f"\n❌ {len(regresiones)} casos superan el umbral de {args.umbral:.0%}: {', '.join(regresiones)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# ============================================================================
+# BENCHMARK - Costo por llamada antes y después del registro precalculado
+# ============================================================================
+#
+# Uso (desde la raíz del repositorio):
+#     python benchmarks/bench_registro.py
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones import Area, Densidad, Energia, Longitud, Masa, Presion, Velocidad, Volumen
+
+MODULOS = {
+    "longitud": (Longitud, Longitud.convertir_longitud, Longitud.FACTORES_POR_METRO),
+    "volumen": (Volumen, Volumen.convertir_volumen, Volumen.FACTORES_POR_LITRO),
+    "presion": (Presion, Presion.convertir_presion, Presion.FACTORES_POR_PASCAL),
+    "energia": (Energia, Energia.convertir_energia, Energia.FACTORES_POR_JOULE),
+    "masa": (Masa, Masa.convertir_masa, Masa.FACTORES_POR_KG),
+    "area": (Area, Area.convertir_area, Area.FACTORES_POR_M2),
+    "densidad": (Densidad, Densidad.convertir_densidad, Densidad.FACTORES_POR_KG_M3),
+    "velocidad": (Velocidad, Velocidad.convertir_velocidad, Velocidad.FACTORES_POR_M_S),
+}
+
+
+def crear_convertir_original(unidades_modulo, factores_modulo):
+    """
+    Reproduce la implementación anterior: reconstruye los diccionarios en cada
+    llamada, hace dos búsquedas, dos validaciones y una división.
+    """
+    def convertir(unidad_inicial, unidad_final, cantidad):
+        unidades = dict(unidades_modulo)
+        factores = dict(factores_modulo)
+        if unidad_inicial in unidades:
+            unidad_inicial = unidades[unidad_inicial]
+        if unidad_final in unidades:
+            unidad_final = unidades[unidad_final]
+        if unidad_inicial not in factores:
+            raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
+        if unidad_final not in factores:
+            raise ValueError(f"Unidad final '{unidad_final}' no válida.")
+        if unidad_inicial == unidad_final:
+            return cantidad
+        return cantidad * (factores[unidad_final] / factores[unidad_inicial])
+    return convertir
+
+
+def medir(funcion, args, repeticiones=5, numero=100_000):
+    """Devuelve el mejor tiempo por llamada en nanosegundos."""
+    tiempos = timeit.repeat(lambda: funcion(*args), repeat=repeticiones, number=numero)
+    return min(tiempos) / numero * 1e9
+
+
+def main():
+    print(f"{'Magnitud':<12}{'Entrada':<10}{'Antes (ns)':>12}{'Después (ns)':>14}{'Mejora':>9}")
+    print("-" * 57)
+    for nombre, (modulo, funcion, factores) in MODULOS.items():
+        original = crear_convertir_original(modulo.UNIDADES, factores)
+        ultima = str(len(modulo.UNIDADES))
+        casos = {
+            "número": ("1", ultima, 12.5),
+            "nombre": (modulo.UNIDADES["1"], modulo.UNIDADES[ultima], 12.5),
+        }
+        for entrada, args in casos.items():
+            antes = medir(original, args)
+            despues = medir(funcion, args)
+            print(f"{nombre:<12}{entrada:<10}{antes:>12.1f}{despues:>14.1f}{antes / despues:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
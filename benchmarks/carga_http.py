@@ -0,0 +1,88 @@
+# ============================================================================
+# PRUEBA DE CARGA - Servicio HTTP de conversión (latencias p50/p99)
+# ============================================================================
+#
+# Uso (con el servicio iniciado: python Conversor_de_unidades.py servidor):
+#     python benchmarks/carga_http.py --clientes 50 --peticiones 200
+#     python benchmarks/carga_http.py --lote 1000
+
+import argparse
+import asyncio
+import json
+import time
+
+
+def percentil(valores_ordenados, porcentaje):
+    """Percentil por el método del rango más cercano."""
+    indice = max(0, int(round(porcentaje / 100 * len(valores_ordenados))) - 1)
+    return valores_ordenados[indice]
+
+
+async def cliente(host, puerto, peticiones, cuerpo, ruta, latencias):
+    """Abre una conexión keep-alive y envía las peticiones una tras otra."""
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    peticion = (
+        f"POST {ruta} HTTP/1.1\r\n"
+        f"Host: {host}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n"
+        f"\r\n"
+    ).encode("latin-1") + cuerpo
+
+    for _ in range(peticiones):
+        inicio = time.perf_counter()
+        escritor.write(peticion)
+        cabecera = await lector.readuntil(b"\r\n\r\n")
+        longitud = 0
+        for linea in cabecera.split(b"\r\n"):
+            if linea.lower().startswith(b"content-length:"):
+                longitud = int(linea.split(b":", 1)[1])
+        await lector.readexactly(longitud)
+        latencias.append(time.perf_counter() - inicio)
+
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def main(args):
+    datos = {"magnitud": args.magnitud, "desde": args.desde, "hasta": args.hasta}
+    if args.lote:
+        ruta = "/lote"
+        datos["valores"] = [float(i) for i in range(args.lote)]
+    else:
+        ruta = "/convertir"
+        datos["valor"] = 101325.0
+    cuerpo = json.dumps(datos).encode("utf-8")
+
+    latencias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        cliente(args.host, args.puerto, args.peticiones, cuerpo, ruta, latencias)
+        for _ in range(args.clientes)
+    ))
+    duracion = time.perf_counter() - inicio
+
+    latencias.sort()
+    total = len(latencias)
+    print(f"Ruta: {ruta}  clientes: {args.clientes}  peticiones: {total}")
+    print(f"Rendimiento: {total / duracion:,.0f} peticiones/s", end="")
+    if args.lote:
+        print(f" ({total * args.lote / duracion:,.0f} valores/s)")
+    else:
+        print()
+    print(f"p50: {percentil(latencias, 50) * 1e3:.3f} ms  "
+          f"p99: {percentil(latencias, 99) * 1e3:.3f} ms  "
+          f"máx: {latencias[-1] * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio HTTP de conversión")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--clientes", type=int, default=20, help="Conexiones concurrentes")
+    parser.add_argument("--peticiones", type=int, default=500, help="Peticiones por conexión")
+    parser.add_argument("--lote", type=int, default=0, help="Valores por petición (0 = endpoint individual)")
+    parser.add_argument("--magnitud", default="presion")
+    parser.add_argument("--desde", default="pascales")
+    parser.add_argument("--hasta", default="psi")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,78 @@
+# ============================================================================
+# LATENCIA - Servidor binario sobre socket Unix (ida y vuelta y encadenado)
+# ============================================================================
+#
+# Uso (con el servidor iniciado: python Conversor_de_unidades.py servidor-binario):
+#     python benchmarks/latencia_uds.py --peticiones 20000 --profundidad 32
+
+import argparse
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.ServidorBinario import LONGITUD, desempaquetar_respuesta, empaquetar_peticion
+
+
+def recibir_exacto(conexion, cantidad):
+    datos = bytearray()
+    while len(datos) < cantidad:
+        bloque = conexion.recv(cantidad - len(datos))
+        if not bloque:
+            raise ConnectionError("El servidor cerró la conexión.")
+        datos += bloque
+    return bytes(datos)
+
+
+def recibir_respuesta(conexion):
+    (longitud,) = LONGITUD.unpack(recibir_exacto(conexion, LONGITUD.size))
+    return desempaquetar_respuesta(recibir_exacto(conexion, longitud))
+
+
+def percentil(valores_ordenados, porcentaje):
+    indice = max(0, int(round(porcentaje / 100 * len(valores_ordenados))) - 1)
+    return valores_ordenados[indice]
+
+
+def main(args):
+    conexion = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conexion.connect(args.socket)
+    valores = [101325.0] * args.valores
+
+    # 1. Ida y vuelta: una petición, una respuesta
+    latencias = []
+    for identificador in range(args.peticiones):
+        trama = empaquetar_peticion(identificador, 8, 1, 6, valores)
+        inicio = time.perf_counter()
+        conexion.sendall(trama)
+        recibir_respuesta(conexion)
+        latencias.append(time.perf_counter() - inicio)
+    latencias.sort()
+    print(f"Ida y vuelta ({args.valores} valores): "
+          f"p50 {percentil(latencias, 50) * 1e6:.1f} µs  p99 {percentil(latencias, 99) * 1e6:.1f} µs")
+
+    # 2. Encadenado: se envían 'profundidad' peticiones antes de leer las respuestas
+    tramas = b"".join(empaquetar_peticion(i, 8, 1, 6, valores) for i in range(args.profundidad))
+    rondas = max(1, args.peticiones // args.profundidad)
+    inicio = time.perf_counter()
+    for _ in range(rondas):
+        conexion.sendall(tramas)
+        for _ in range(args.profundidad):
+            recibir_respuesta(conexion)
+    duracion = time.perf_counter() - inicio
+    total = rondas * args.profundidad
+    print(f"Encadenado (profundidad {args.profundidad}): {total / duracion:,.0f} peticiones/s, "
+          f"{duracion / total * 1e6:.1f} µs por petición")
+
+    conexion.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latencia del servidor binario de conversión")
+    parser.add_argument("--socket", default="/tmp/conversor.sock")
+    parser.add_argument("--peticiones", type=int, default=10_000)
+    parser.add_argument("--profundidad", type=int, default=32, help="Peticiones encadenadas por ronda")
+    parser.add_argument("--valores", type=int, default=1, help="Valores float64 por petición")
+    main(parser.parse_args())
@@ -0,0 +1,62 @@
+# ============================================================================
+# INFORME - Error de las conversiones por lotes en float32
+# ============================================================================
+#
+# Uso (desde la raíz del repositorio):
+#     python benchmarks/precision_float32.py
+#     python benchmarks/precision_float32.py --magnitud presion --umbral 1e-7
+#     python benchmarks/precision_float32.py --salida precision.json
+#
+# Para cada par de unidades muestra el peor error relativo y absoluto de la ruta
+# float32 frente a la float64, con los mismos datos de entrada ya almacenados en
+# float32. Los pares que superan --umbral se marcan con ❌.
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.Convertidores import informe_precision
+from conversiones.Registro import MODULOS
+
+MAGNITUDES = [nombre for nombre in MODULOS if nombre != "concentracion"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Error por par de unidades de las conversiones en float32")
+    parser.add_argument("--magnitud", choices=MAGNITUDES, help="Solo esta magnitud")
+    parser.add_argument("--umbral", type=float, default=1e-6,
+                        help="Error relativo máximo aceptable (por defecto 1e-6)")
+    parser.add_argument("--salida", help="Guarda el informe en este archivo JSON")
+    parser.add_argument("--todos", action="store_true", help="Muestra todos los pares, no solo el peor de cada unidad")
+    args = parser.parse_args()
+
+    resultado = {}
+    for magnitud in [args.magnitud] if args.magnitud else MAGNITUDES:
+        informe = informe_precision(magnitud)
+        resultado[magnitud] = {f"{inicial}->{final}": errores for (inicial, final), errores in informe.items()}
+
+        print(f"\n{magnitud.upper()}")
+        print(f"{'Par':<48}{'Error relativo':>16}{'Error absoluto':>16}")
+        print("-" * 80)
+        filas = sorted(informe.items(), key=lambda par: -par[1]["error_relativo"])
+        if not args.todos:
+            # El peor par de cada unidad inicial
+            vistos = set()
+            filas = [fila for fila in filas if fila[0][0] not in vistos and not vistos.add(fila[0][0])]
+        for (inicial, final), errores in filas:
+            marca = "  ❌" if errores["error_relativo"] > args.umbral else ""
+            print(f"{inicial + ' -> ' + final:<48}{errores['error_relativo']:>16.2e}"
+                  f"{errores['error_absoluto']:>16.2e}{marca}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({"dtype": "float32", "umbral": args.umbral, "resultados": resultado},
+                      archivo, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
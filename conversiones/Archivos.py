@@ -0,0 +1,268 @@
+# Archivos.py - Conversión de archivos por bloques, sin cargarlos en memoria
+
+import csv
+import os
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+from conversiones.Registro import tipo_lote
+
+
+def leer_bloques(filas, tamano_bloque):
+    """Agrupa un iterador de filas en listas de, como máximo, tamano_bloque filas."""
+    filas = iter(filas)
+    while True:
+        bloque = list(islice(filas, tamano_bloque))
+        if not bloque:
+            return
+        yield bloque
+
+
+def convertir_bloques(bloques, convertidor, columnas, fila_inicial=1):
+    """
+    Aplica el convertidor a las columnas seleccionadas de cada bloque.
+
+    Las celdas vacías se conservan. Una celda no numérica detiene la conversión
+    indicando su fila y columna (ambas 1-based).
+
+    Yields:
+        tuple: (bloque convertido, número de valores convertidos en el bloque)
+    """
+    numero_fila = fila_inicial
+    for bloque in bloques:
+        convertidos = 0
+        for fila in bloque:
+            for columna in columnas:
+                if columna >= len(fila):
+                    continue
+                celda = fila[columna].strip()
+                if not celda:
+                    continue
+                try:
+                    valor = float(celda)
+                except ValueError:
+                    raise ValueError(
+                        f"Valor no numérico '{celda}' en la fila {numero_fila}, columna {columna + 1}."
+                    ) from None
+                fila[columna] = repr(convertidor(valor))
+                convertidos += 1
+            numero_fila += 1
+        yield bloque, convertidos
+
+
+def resolver_columnas(columnas, encabezado):
+    """
+    Traduce una lista de columnas (números 1-based o nombres del encabezado) a índices 0-based.
+    """
+    indices = []
+    for columna in columnas:
+        if columna.isdigit():
+            indice = int(columna) - 1
+            if indice < 0:
+                raise ValueError(f"Columna '{columna}' no válida.")
+        elif encabezado is not None and columna in encabezado:
+            indice = encabezado.index(columna)
+        else:
+            raise ValueError(f"Columna '{columna}' no encontrada.")
+        indices.append(indice)
+    return indices
+
+
+def convertir_csv(entrada, salida, convertidor, columnas, delimitador=",", encabezado=False,
+                  tamano_bloque=10_000):
+    """
+    Convierte columnas de un archivo CSV/TSV en streaming, con memoria constante.
+
+    Args:
+        entrada: Archivo de texto abierto para lectura
+        salida: Archivo de texto abierto para escritura
+        convertidor: Función convertir(valor), ver obtener_convertidor()
+        columnas: Lista de columnas a convertir (números 1-based o nombres del encabezado)
+        delimitador: Separador de campos ("," para CSV, "\\t" para TSV)
+        encabezado: Si es True, la primera fila se copia sin convertir
+        tamano_bloque: Número de filas leídas y escritas por bloque
+
+    Returns:
+        dict: Estadísticas con 'filas', 'valores' y 'segundos'
+    """
+    inicio = time.perf_counter()
+    lector = csv.reader(entrada, delimiter=delimitador)
+    escritor = csv.writer(salida, delimiter=delimitador, lineterminator="\n")
+
+    nombres = None
+    fila_inicial = 1
+    if encabezado:
+        nombres = next(lector, None)
+        if nombres is not None:
+            escritor.writerow(nombres)
+            fila_inicial = 2
+    indices = resolver_columnas(columnas, nombres)
+
+    filas = 0
+    valores = 0
+    bloques = leer_bloques(lector, tamano_bloque)
+    for bloque, convertidos in convertir_bloques(bloques, convertidor, indices, fila_inicial):
+        escritor.writerows(bloque)
+        filas += len(bloque)
+        valores += convertidos
+
+    return {
+        "filas": filas,
+        "valores": valores,
+        "segundos": time.perf_counter() - inicio,
+    }
+
+
+def _ruta_temporal(ruta):
+    """Ruta de un temporal junto a ruta, en la misma carpeta para que os.replace sea atómico."""
+    carpeta, nombre = os.path.split(os.path.abspath(ruta))
+    return os.path.join(carpeta, f".{nombre}.{os.getpid()}.tmp")
+
+
+@contextmanager
+def abrir_salida(ruta, modo="w", **opciones):
+    """
+    Abre un archivo de salida que solo reemplaza a ruta si la escritura termina bien.
+
+    Se escribe en un temporal junto al destino y se renombra al salir del bloque
+    with; si hay un error se borra el temporal y ruta queda intacta. Así la salida
+    puede ser el propio archivo de entrada: este se lee completo antes de reemplazarlo.
+
+    Args:
+        ruta: Archivo de salida
+        modo: Modo de escritura de open() ("w" o "wb")
+        **opciones: Resto de argumentos de open() (newline, encoding...)
+
+    Yields:
+        Archivo abierto para escritura
+    """
+    ruta_temporal = _ruta_temporal(ruta)
+    try:
+        with open(ruta_temporal, modo, **opciones) as archivo:
+            yield archivo
+        os.replace(ruta_temporal, ruta)
+    except BaseException:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+        raise
+
+
+def _describir_binario(ruta, dtype):
+    """Devuelve (dtype, desplazamiento, número de valores) de un archivo .npy o binario plano."""
+    import numpy as np
+
+    if ruta.lower().endswith(".npy"):
+        mapa = np.load(ruta, mmap_mode="r")
+        descripcion = (mapa.dtype, mapa.offset, mapa.size)
+        del mapa
+        return descripcion
+
+    dtype = tipo_lote(dtype)
+    tamano = os.path.getsize(ruta)
+    if tamano % dtype.itemsize:
+        raise ValueError(f"El tamaño de '{ruta}' no es múltiplo de {dtype.itemsize} bytes ({dtype}).")
+    return dtype, 0, tamano // dtype.itemsize
+
+
+def _convertir_bloques_binarios(ruta_entrada, desplazamiento_entrada, ruta_salida, desplazamiento_salida,
+                                convertidor, dtype, total, tamano_bloque):
+    """Mapea, convierte y libera el archivo bloque a bloque (en el sitio si ambas rutas coinciden)."""
+    import numpy as np
+
+    en_sitio = ruta_salida == ruta_entrada
+    for inicio in range(0, total, tamano_bloque):
+        cantidad = min(tamano_bloque, total - inicio)
+        salida = np.memmap(ruta_salida, dtype=dtype, mode="r+", shape=(cantidad,),
+                           offset=desplazamiento_salida + inicio * dtype.itemsize)
+        if en_sitio:
+            entrada = salida
+        else:
+            entrada = np.memmap(ruta_entrada, dtype=dtype, mode="r", shape=(cantidad,),
+                                offset=desplazamiento_entrada + inicio * dtype.itemsize)
+        salida[:] = convertidor(entrada)
+        salida.flush()
+        del entrada, salida
+
+
+def convertir_binario(ruta_entrada, convertidor, ruta_salida=None, dtype="float64", tamano_bloque=1_048_576):
+    """
+    Convierte un archivo .npy o binario plano mapeándolo en memoria bloque a bloque.
+
+    Cada bloque se mapea, se convierte y se libera antes del siguiente, de modo que
+    la memoria residente depende de tamano_bloque y no del tamaño del archivo. Los
+    datos nunca pasan por objetos de Python. Como la conversión es elemento a elemento,
+    se recorre el archivo en su orden de almacenamiento (C o Fortran da igual).
+
+    Args:
+        ruta_entrada: Archivo .npy o binario plano de entrada
+        convertidor: Función convertir(arreglo), ver obtener_convertidor()
+        ruta_salida: Archivo de salida (.npy o plano); None, o el propio archivo de entrada,
+            para convertir en el sitio. La salida solo aparece si la conversión termina bien
+        dtype: Tipo de los archivos planos, "float64" o "float32" (los .npy usan el de su encabezado)
+        tamano_bloque: Número de valores por bloque
+
+    Returns:
+        dict: Estadísticas con 'valores' y 'segundos'
+    """
+    import numpy as np
+
+    if tamano_bloque <= 0:
+        raise ValueError(f"El tamaño de bloque debe ser positivo, no {tamano_bloque}.")
+
+    inicio_tiempo = time.perf_counter()
+    dtype, desplazamiento_entrada, total = _describir_binario(ruta_entrada, dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f"Solo se admiten datos de punto flotante, '{ruta_entrada}' es {dtype}.")
+
+    # Otra ruta al mismo archivo ("./x.bin", enlaces...) también es una conversión en
+    # el sitio: crear la salida truncaría la entrada antes de leerla.
+    if ruta_salida is not None and os.path.exists(ruta_salida) and os.path.samefile(ruta_salida, ruta_entrada):
+        ruta_salida = None
+
+    if ruta_salida is None:
+        _convertir_bloques_binarios(ruta_entrada, desplazamiento_entrada, ruta_entrada, desplazamiento_entrada,
+                                    convertidor, dtype, total, tamano_bloque)
+    else:
+        _convertir_a_archivo_nuevo(ruta_entrada, desplazamiento_entrada, ruta_salida,
+                                   convertidor, dtype, total, tamano_bloque)
+
+    return {
+        "valores": total,
+        "segundos": time.perf_counter() - inicio_tiempo,
+    }
+
+
+def _convertir_a_archivo_nuevo(ruta_entrada, desplazamiento_entrada, ruta_salida,
+                               convertidor, dtype, total, tamano_bloque):
+    """
+    Convierte la entrada en un archivo distinto.
+
+    La salida se escribe en un temporal junto al destino y se renombra al terminar,
+    para no dejar un archivo a medias (o lleno de ceros) si falla algún bloque.
+    """
+    import numpy as np
+
+    ruta_temporal = _ruta_temporal(ruta_salida)
+    try:
+        if ruta_salida.lower().endswith(".npy"):
+            encabezado = np.load(ruta_entrada, mmap_mode="r") if ruta_entrada.lower().endswith(".npy") else None
+            forma = encabezado.shape if encabezado is not None else (total,)
+            fortran = encabezado is not None and encabezado.flags.f_contiguous and not encabezado.flags.c_contiguous
+            del encabezado
+            mapa = np.lib.format.open_memmap(ruta_temporal, mode="w+", dtype=dtype, shape=forma,
+                                             fortran_order=fortran)
+            desplazamiento_salida = mapa.offset
+            del mapa
+        else:
+            with open(ruta_temporal, "wb") as archivo:
+                archivo.truncate(total * dtype.itemsize)
+            desplazamiento_salida = 0
+
+        _convertir_bloques_binarios(ruta_entrada, desplazamiento_entrada, ruta_temporal, desplazamiento_salida,
+                                    convertidor, dtype, total, tamano_bloque)
+        os.replace(ruta_temporal, ruta_salida)
+    except BaseException:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+        raise
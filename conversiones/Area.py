@@ -1,49 +1,70 @@
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "metros_cuadrados",
+    "2": "centimetros_cuadrados",
+    "3": "milimetros_cuadrados",
+    "4": "kilometros_cuadrados",
+    "5": "pulgadas_cuadradas",
+    "6": "pies_cuadrados",
+    "7": "yardas_cuadradas",
+    "8": "hectareas",
+    "9": "acres"
+}
+
+# 2. Factores hacia metros cuadrados (unidad base)
+FACTORES_POR_M2 = {
+    "metros_cuadrados": 1.0,
+    "centimetros_cuadrados": 10000.0,
+    "milimetros_cuadrados": 1_000_000.0,
+    "kilometros_cuadrados": 0.000001,
+    "pulgadas_cuadradas": 1550.0031,
+    "pies_cuadrados": 10.7639,
+    "yardas_cuadradas": 1.19599,
+    "hectareas": 0.0001,
+    "acres": 0.000247105
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+AREA = registrar_magnitud("area", UNIDADES, FACTORES_POR_M2)
+
+
 def convertir_area(unidad_inicial, unidad_final, cantidad):
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "metros_cuadrados",
-        "2": "centimetros_cuadrados",
-        "3": "milimetros_cuadrados",
-        "4": "kilometros_cuadrados",
-        "5": "pulgadas_cuadradas",
-        "6": "pies_cuadrados",
-        "7": "yardas_cuadradas",
-        "8": "hectareas",
-        "9": "acres"
-    }
-    
-    # 2. Factores hacia metros cuadrados (unidad base)
-    factores_por_m2 = {
-        "metros_cuadrados": 1.0,
-        "centimetros_cuadrados": 10000.0,
-        "milimetros_cuadrados": 1_000_000.0,
-        "kilometros_cuadrados": 0.000001,
-        "pulgadas_cuadradas": 1550.0031,
-        "pies_cuadrados": 10.7639,
-        "yardas_cuadradas": 1.19599,
-        "hectareas": 0.0001,
-        "acres": 0.000247105
-    }
-    
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_m2:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_m2:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-    
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_m2[unidad_inicial]
-    factor_destino = factores_por_m2[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-    
-    return cantidad * factor_conversion
\ No newline at end of file
+    return convertir_lineal(AREA, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_area_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de áreas con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-9) o nombre de unidad
+        unidad_final: Número de unidad final (1-9) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(AREA, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_area_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de áreas con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-9), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-9) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(AREA, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
@@ -0,0 +1,158 @@
+# Cache.py - Caché LRU opcional de resultados de conversión
+#
+# El módulo se importa al arrancar el menú, así que no importa nada hasta que
+# se activa la caché.
+
+import math
+
+
+class CacheLRU:
+    """
+    Caché de resultados acotada, con desalojo LRU y segura entre hilos.
+
+    Attributes:
+        maximo: Número máximo de resultados guardados
+        aciertos: Consultas respondidas desde la caché
+        fallos: Consultas que tuvieron que calcularse
+        desalojos: Resultados descartados por falta de espacio
+    """
+
+    def __init__(self, maximo=1024):
+        if maximo < 1:
+            raise ValueError("El tamaño máximo de la caché debe ser al menos 1.")
+        self.maximo = maximo
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        import threading
+        from collections import OrderedDict
+
+        self._datos = OrderedDict()
+        self._candado = threading.Lock()
+
+    def calcular(self, clave, funcion, *args, **kwargs):
+        """Devuelve el resultado guardado para la clave o lo calcula con funcion(*args, **kwargs)."""
+        with self._candado:
+            if clave in self._datos:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return self._datos[clave]
+            self.fallos += 1
+
+        # El cálculo se hace fuera del candado; los errores no se guardan
+        resultado = funcion(*args, **kwargs)
+
+        with self._candado:
+            self._datos[clave] = resultado
+            self._datos.move_to_end(clave)
+            if len(self._datos) > self.maximo:
+                self._datos.popitem(last=False)
+                self.desalojos += 1
+        return resultado
+
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores."""
+        with self._candado:
+            self._datos.clear()
+            self.aciertos = self.fallos = self.desalojos = 0
+
+    def estadisticas(self):
+        """
+        Devuelve los contadores de la caché.
+
+        Returns:
+            dict: 'aciertos', 'fallos', 'desalojos', 'tamano', 'maximo' y 'tasa_aciertos'
+        """
+        with self._candado:
+            consultas = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "tamano": len(self._datos),
+                "maximo": self.maximo,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            }
+
+
+# Caché global; None mientras no se active
+CACHE = None
+
+
+def activar_cache(maximo=1024):
+    """Activa la caché global de resultados (o la reemplaza por una nueva vacía)."""
+    global CACHE
+    CACHE = CacheLRU(maximo)
+    return CACHE
+
+
+def desactivar_cache():
+    """Desactiva la caché global y descarta su contenido."""
+    global CACHE
+    CACHE = None
+
+
+def estadisticas_cache():
+    """Devuelve las estadísticas de la caché global, o None si no está activada."""
+    return CACHE.estadisticas() if CACHE is not None else None
+
+
+def _con_signo(valor):
+    """Parte de la clave de un valor: 0.0 == -0.0, pero no dan el mismo resultado."""
+    if isinstance(valor, float):
+        return valor, math.copysign(1.0, valor)
+    return valor, None
+
+
+def calcular_con_cache(magnitud, funcion, unidad_inicial, unidad_final, cantidad, **kwargs):
+    """
+    Llama a funcion(unidad_inicial, unidad_final, cantidad, **kwargs) a través de la caché global.
+
+    La clave es (magnitud, unidades, valor, masa_molar, densidad), con el tipo del valor
+    y el signo de los float. Con la caché desactivada se llama directamente a la
+    función. Las conversiones con datos de mezcla o con valores no hashables (por
+    ejemplo, arreglos) no se guardan.
+
+    Args:
+        magnitud: Nombre de la magnitud, parte de la clave
+        funcion: Función convertir(unidad_inicial, unidad_final, cantidad, ...)
+        unidad_inicial, unidad_final, cantidad, **kwargs: Argumentos de funcion
+
+    Returns:
+        El resultado de funcion, guardado o recién calculado
+    """
+    cache = CACHE
+    if cache is None or kwargs.get("datos_mezcla") is not None:
+        return funcion(unidad_inicial, unidad_final, cantidad, **kwargs)
+
+    clave = (magnitud, unidad_inicial, unidad_final, type(cantidad), _con_signo(cantidad),
+             _con_signo(kwargs.get("masa_molar")), _con_signo(kwargs.get("densidad")))
+    try:
+        hash(clave)
+    except TypeError:
+        return funcion(unidad_inicial, unidad_final, cantidad, **kwargs)
+    return cache.calcular(clave, funcion, unidad_inicial, unidad_final, cantidad, **kwargs)
+
+
+def memorizar(magnitud, funcion):
+    """
+    Envuelve una función convertir_* para que consulte la caché global cuando esté activada.
+
+    Ver calcular_con_cache para la clave y los casos que no se guardan.
+
+    Args:
+        magnitud: Nombre de la magnitud, parte de la clave
+        funcion: Función convertir(unidad_inicial, unidad_final, cantidad, ...)
+
+    Returns:
+        callable: Función con la misma firma
+    """
+    def convertir(unidad_inicial, unidad_final, cantidad, *args, **kwargs):
+        if CACHE is None or args:
+            return funcion(unidad_inicial, unidad_final, cantidad, *args, **kwargs)
+        return calcular_con_cache(magnitud, funcion, unidad_inicial, unidad_final, cantidad, **kwargs)
+
+    convertir.__name__ = funcion.__name__
+    convertir.__doc__ = funcion.__doc__
+    convertir.__wrapped__ = funcion
+    return convertir
@@ -1,5 +1,38 @@
 # conversiones.py - Módulo de conversiones de concentración mejorado
 
+from functools import lru_cache
+from numbers import Real
+
+from conversiones.Registro import preparar_lote, registrar_magnitud, resolver_unidades
+
+# Mapeo de números a nombres
+UNIDADES = {
+    "1": "molaridad",
+    "2": "molalidad",
+    "3": "fraccion_molar",
+    "4": "fraccion_masa",
+    "5": "milimolar",
+    "6": "micromolar",
+    "7": "ppm",
+    "8": "ppb",
+    "9": "g_l",
+    "10": "kg_m3",
+    "11": "porcentaje_mv",
+    "12": "porcentaje_mm"
+}
+
+# Unidades que requieren masa molar
+REQUIEREN_MASA_MOLAR = frozenset(["molaridad", "molalidad", "fraccion_molar", "milimolar", "micromolar"])
+
+# Unidades que requieren densidad
+REQUIEREN_DENSIDAD = frozenset(["molalidad", "porcentaje_mm"])
+
+# Unidades cuya conversión entre sí requiere datos de mezcla
+FRACCIONES = frozenset(["fraccion_molar", "fraccion_masa"])
+
+CONCENTRACION = registrar_magnitud("concentracion", UNIDADES)
+
+
 def necesita_parametros_adicionales(unidad_inicial, unidad_final):
     """
     Determina si una conversión de concentración necesita parámetros adicionales.
@@ -12,44 +45,20 @@ def necesita_parametros_adicionales(unidad_inicial, unidad_final):
         dict: Diccionario indicando qué parámetros se necesitan
     """
     
-    # Mapeo de números a nombres
-    unidades = {
-        "1": "molaridad",
-        "2": "molalidad", 
-        "3": "fraccion_molar",
-        "4": "fraccion_masa",
-        "5": "milimolar",
-        "6": "micromolar",
-        "7": "ppm",
-        "8": "ppb",
-        "9": "g_l",
-        "10": "kg_m3",
-        "11": "porcentaje_mv",
-        "12": "porcentaje_mm"
-    }
-    
     # Convertir números a nombres si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # Unidades que requieren masa molar
-    requieren_masa_molar = ["molaridad", "molalidad", "fraccion_molar", "milimolar", "micromolar"]
-    
-    # Unidades que requieren densidad
-    requieren_densidad = ["molalidad", "porcentaje_mm"]
+    unidad_inicial = UNIDADES.get(unidad_inicial, unidad_inicial)
+    unidad_final = UNIDADES.get(unidad_final, unidad_final)
     
     # Conversiones entre fracción masa y fracción molar requieren datos de mezcla
     requiere_datos_mezcla = (
-        (unidad_inicial == "fraccion_masa" and unidad_final == "fraccion_molar") or
-        (unidad_inicial == "fraccion_molar" and unidad_final == "fraccion_masa")
+        unidad_inicial != unidad_final and
+        unidad_inicial in FRACCIONES and unidad_final in FRACCIONES
     )
     
-    necesita_masa_molar = (unidad_inicial in requieren_masa_molar or 
-                          unidad_final in requieren_masa_molar)
-    necesita_densidad = (unidad_inicial in requieren_densidad or 
-                        unidad_final in requieren_densidad)
+    necesita_masa_molar = (unidad_inicial in REQUIEREN_MASA_MOLAR or 
+                          unidad_final in REQUIEREN_MASA_MOLAR)
+    necesita_densidad = (unidad_inicial in REQUIEREN_DENSIDAD or 
+                        unidad_final in REQUIEREN_DENSIDAD)
     
     return {
         "masa_molar": necesita_masa_molar and not requiere_datos_mezcla,
@@ -166,6 +175,52 @@ def calcular_fracciones_mezcla_binaria(fraccion_componente_1, peso_mol_1, peso_m
     else:
         raise ValueError("tipo_inicial debe ser 'masa' o 'molar'")
 
+def calcular_fracciones_mezcla_binaria_lote(fraccion_componente_1, peso_mol_1, peso_mol_2, tipo_inicial):
+    """
+    Calcula las fracciones masa y molar de muchas mezclas binarias en una sola pasada.
+    
+    Los tres primeros argumentos pueden ser escalares o arreglos y se combinan con
+    broadcasting de NumPy.
+    
+    Args:
+        fraccion_componente_1: Fracciones del componente 1 (masa o molar según tipo_inicial)
+        peso_mol_1: Pesos moleculares del componente 1
+        peso_mol_2: Pesos moleculares del componente 2
+        tipo_inicial: "masa" o "molar" - tipo de las fracciones iniciales
+    
+    Returns:
+        tuple: (fraccion_masa_1, fraccion_masa_2, fraccion_molar_1, fraccion_molar_2) como ndarrays
+    """
+    import numpy as np
+    
+    fracciones = np.array(fraccion_componente_1, dtype=np.float64)
+    peso_mol_1 = np.asarray(peso_mol_1, dtype=np.float64)
+    peso_mol_2 = np.asarray(peso_mol_2, dtype=np.float64)
+    
+    fuera_de_rango = ~((fracciones >= 0) & (fracciones <= 1))
+    if fuera_de_rango.any():
+        indices = np.flatnonzero(fuera_de_rango)
+        raise ValueError(f"La fracción {tipo_inicial} debe estar entre 0 y 1 "
+                         f"({indices.size} filas inválidas, la primera en el índice {indices[0]})")
+    
+    if tipo_inicial == "masa":
+        w1 = fracciones
+        w2 = 1 - w1
+        n1 = w1 / peso_mol_1
+        x1 = n1 / (n1 + w2 / peso_mol_2)
+        x2 = 1 - x1
+    elif tipo_inicial == "molar":
+        x1 = fracciones
+        x2 = 1 - x1
+        masa_1 = x1 * peso_mol_1
+        w1 = masa_1 / (masa_1 + x2 * peso_mol_2)
+        w2 = 1 - w1
+    else:
+        raise ValueError("tipo_inicial debe ser 'masa' o 'molar'")
+    
+    # np.array copia en orden C y, a diferencia de ascontiguousarray, conserva la forma 0-d
+    return tuple(np.array(fraccion, order="C") for fraccion in np.broadcast_arrays(w1, w2, x1, x2))
+
 def convertir_fraccion_masa_a_molar(fraccion_masa, componentes, indice_componente):
     """
     Convierte fracción masa a fracción molar usando el método original para multi-componente.
@@ -229,6 +284,333 @@ def convertir_fraccion_molar_a_masa(fraccion_molar, componentes, indice_componen
     
     return fraccion_masa
 
+def _preparar_composiciones(composiciones, pesos_moleculares, normalizar, tolerancia):
+    """Valida una matriz de composiciones (mezclas × componentes) y su vector de pesos moleculares."""
+    import numpy as np
+    
+    composiciones = np.asarray(composiciones, dtype=np.float64)
+    pesos_moleculares = np.asarray(pesos_moleculares, dtype=np.float64)
+    
+    if composiciones.ndim == 1:
+        composiciones = composiciones[np.newaxis, :]
+    if composiciones.ndim != 2:
+        raise ValueError("Las composiciones deben ser una matriz de mezclas × componentes.")
+    if pesos_moleculares.shape != (composiciones.shape[1],):
+        raise ValueError(f"Se esperaban {composiciones.shape[1]} pesos moleculares, "
+                         f"se recibieron {pesos_moleculares.size}.")
+    if composiciones.shape[1] < 2:
+        raise ValueError("Una mezcla debe tener al menos 2 componentes.")
+    if not (np.isfinite(pesos_moleculares).all() and (pesos_moleculares > 0).all()):
+        raise ValueError("Los pesos moleculares deben ser positivos.")
+    
+    filas_invalidas = ~(np.isfinite(composiciones) & (composiciones >= 0)).all(axis=1)
+    sumas = composiciones.sum(axis=1)
+    filas_invalidas |= ~(sumas > 0)
+    if not normalizar:
+        filas_invalidas |= np.abs(sumas - 1) > tolerancia
+    if filas_invalidas.any():
+        indices = np.flatnonzero(filas_invalidas)
+        raise ValueError(f"Composiciones inválidas: {indices.size} mezclas con fracciones negativas, "
+                         f"no finitas o que no suman 1 (la primera en el índice {indices[0]})")
+    
+    return composiciones, pesos_moleculares
+
+
+def convertir_composicion_masa_a_molar(composiciones, pesos_moleculares, normalizar=True, tolerancia=1e-6):
+    """
+    Convierte fracciones masa a fracciones molares para todas las mezclas y componentes.
+    
+    x_i = (w_i / M_i) / sum_j (w_j / M_j), fila por fila.
+    
+    Args:
+        composiciones: Matriz de fracciones masa (mezclas × componentes); un vector es una sola mezcla
+        pesos_moleculares: Vector de pesos moleculares de cada componente (g/mol)
+        normalizar: Si es True, cada fila se normaliza para sumar 1; si es False,
+            las filas que no sumen 1 (± tolerancia) se rechazan
+        tolerancia: Desviación admitida de la suma de cada fila cuando normalizar es False
+    
+    Returns:
+        numpy.ndarray: Matriz de fracciones molares (mezclas × componentes)
+    """
+    composiciones, pesos_moleculares = _preparar_composiciones(
+        composiciones, pesos_moleculares, normalizar, tolerancia
+    )
+    
+    # La fórmula es invariante a la escala de cada fila, así que normaliza implícitamente
+    moles = composiciones / pesos_moleculares
+    moles /= moles.sum(axis=1, keepdims=True)
+    return moles
+
+
+def convertir_composicion_molar_a_masa(composiciones, pesos_moleculares, normalizar=True, tolerancia=1e-6):
+    """
+    Convierte fracciones molares a fracciones masa para todas las mezclas y componentes.
+    
+    w_i = (x_i × M_i) / sum_j (x_j × M_j), fila por fila.
+    
+    Args:
+        composiciones: Matriz de fracciones molares (mezclas × componentes); un vector es una sola mezcla
+        pesos_moleculares: Vector de pesos moleculares de cada componente (g/mol)
+        normalizar: Si es True, cada fila se normaliza para sumar 1; si es False,
+            las filas que no sumen 1 (± tolerancia) se rechazan
+        tolerancia: Desviación admitida de la suma de cada fila cuando normalizar es False
+    
+    Returns:
+        numpy.ndarray: Matriz de fracciones masa (mezclas × componentes)
+    """
+    composiciones, pesos_moleculares = _preparar_composiciones(
+        composiciones, pesos_moleculares, normalizar, tolerancia
+    )
+    
+    masas = composiciones * pesos_moleculares
+    masas /= masas.sum(axis=1, keepdims=True)
+    return masas
+
+# Pasos lineales hacia g/L: g/L = valor * a * b / c, con (a, b, c) = pasos(masa_molar, densidad).
+# Siguen el orden de las fórmulas originales (primero multiplicar, después dividir),
+# así que el resultado es el mismo float; None indica un paso que no existe.
+PASOS_A_G_L = {
+    "g_l": lambda mm, dens: (None, None, None),
+    "kg_m3": lambda mm, dens: (None, None, None),          # kg/m³ = g/L
+    "ppm": lambda mm, dens: (None, None, 1000),            # ppm a g/L
+    "ppb": lambda mm, dens: (None, None, 1_000_000),       # ppb a g/L
+    "porcentaje_mv": lambda mm, dens: (10, None, None),    # %m/v a g/L
+    "porcentaje_mm": lambda mm, dens: (dens, 10, None),    # %m/m a g/L
+    "molaridad": lambda mm, dens: (mm, None, None),        # M * g/mol = g/L
+    "milimolar": lambda mm, dens: (mm, None, 1000),        # mM * g/mol / 1000 = g/L
+    "micromolar": lambda mm, dens: (mm, None, 1_000_000)   # μM * g/mol / 1000000 = g/L
+}
+
+# Pasos lineales desde g/L: valor = g/L * a * b / c, con la misma convención
+PASOS_DESDE_G_L = {
+    "g_l": lambda mm, dens: (None, None, None),
+    "kg_m3": lambda mm, dens: (None, None, None),          # g/L = kg/m³
+    "ppm": lambda mm, dens: (1000, None, None),
+    "ppb": lambda mm, dens: (1_000_000, None, None),
+    "porcentaje_mv": lambda mm, dens: (None, None, 10),
+    "porcentaje_mm": lambda mm, dens: (None, None, dens * 10),
+    "molaridad": lambda mm, dens: (None, None, mm),        # g/L / g/mol = M
+    "milimolar": lambda mm, dens: (1000, None, mm),        # g/L * 1000 / g/mol = mM
+    "micromolar": lambda mm, dens: (1_000_000, None, mm)   # g/L * 1000000 / g/mol = μM
+}
+
+
+def _lineal(valor, a, b, c):
+    """Aplica valor * a * b / c saltando los pasos None (válido para escalares y arreglos)."""
+    if a is not None:
+        valor = valor * a
+    if b is not None:
+        valor = valor * b
+    if c is not None:
+        valor = valor / c
+    return valor
+
+
+def molalidad_a_g_l(valor, mm, dens):
+    """Convierte molalidad (mol/kg) a g/L."""
+    return valor * mm * dens / (1 + valor * mm / 1000)
+
+
+def g_l_a_molalidad(valor, mm, dens):
+    """Convierte g/L a molalidad (mol/kg)."""
+    denominador = mm * dens - valor * mm / 1000
+    if denominador <= 0:
+        raise ValueError("Error en la conversión: Concentración demasiado alta para conversión a molalidad")
+    return valor / denominador * 1000
+
+
+def g_l_a_molalidad_lote(valor, mm, dens):
+    """Versión vectorizada de g_l_a_molalidad: las filas con denominador no positivo quedan en NaN."""
+    import numpy as np
+
+    denominador = mm * dens - valor * mm / 1000
+    return np.where(denominador > 0, valor / denominador * 1000, np.nan)
+
+
+# Conversiones no lineales, despachadas por tabla
+FUNCIONES_A_G_L = {"molalidad": molalidad_a_g_l}
+FUNCIONES_DESDE_G_L = {"molalidad": g_l_a_molalidad}
+
+# Versiones para arreglos (molalidad_a_g_l ya es vectorizable)
+FUNCIONES_A_G_L_LOTE = {"molalidad": molalidad_a_g_l}
+FUNCIONES_DESDE_G_L_LOTE = {"molalidad": g_l_a_molalidad_lote}
+
+
+def _convertir_arreglo(unidad_inicial, unidad_final, cantidades, mm, dens):
+    """
+    Pasos a y desde g/L sobre arreglos, sin avisos de NumPy.
+
+    Las filas inválidas (división por cero, denominador de molalidad no positivo)
+    quedan en inf o NaN; quien llama las marca como NaN.
+    """
+    import numpy as np
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        pasos_a = PASOS_A_G_L.get(unidad_inicial)
+        if pasos_a is not None:
+            valor_intermedio = _lineal(cantidades, *pasos_a(mm, dens))
+        else:
+            valor_intermedio = FUNCIONES_A_G_L_LOTE[unidad_inicial](cantidades, mm, dens)
+
+        pasos_desde = PASOS_DESDE_G_L.get(unidad_final)
+        if pasos_desde is not None:
+            return _lineal(valor_intermedio, *pasos_desde(mm, dens))
+        return FUNCIONES_DESDE_G_L_LOTE[unidad_final](valor_intermedio, mm, dens)
+
+
+def _identidad(cantidad):
+    return cantidad
+
+
+class PlanConcentracion:
+    """
+    Conversión de concentración precompilada para unidades y parámetros fijos.
+
+    Se obtiene con compilar_concentracion(); aplicarla cuesta unas pocas
+    operaciones de punto flotante y ninguna validación.
+
+    Attributes:
+        unidad_inicial: Nombre de la unidad inicial
+        unidad_final: Nombre de la unidad final
+        masa_molar: Masa molar del soluto en g/mol (o None)
+        densidad: Densidad de la solución en g/mL (o None)
+        pasos: ((a, b, c) hacia g/L, (a, b, c) desde g/L) si la conversión es lineal,
+            None si pasa por molalidad (ver PASOS_A_G_L)
+        aplicar: Función aplicar(cantidad) especializada
+    """
+
+    __slots__ = ("unidad_inicial", "unidad_final", "masa_molar", "densidad", "pasos", "aplicar")
+
+    def __init__(self, unidad_inicial, unidad_final, masa_molar, densidad, pasos, aplicar):
+        self.unidad_inicial = unidad_inicial
+        self.unidad_final = unidad_final
+        self.masa_molar = masa_molar
+        self.densidad = densidad
+        self.pasos = pasos
+        self.aplicar = aplicar
+
+    def __call__(self, cantidad):
+        return self.aplicar(cantidad)
+
+    def __repr__(self):
+        return (f"PlanConcentracion({self.unidad_inicial!r} -> {self.unidad_final!r}, "
+                f"masa_molar={self.masa_molar!r}, densidad={self.densidad!r})")
+
+
+@lru_cache(maxsize=256)
+def _compilar(origen, destino, masa_molar, densidad):
+    unidad_inicial = CONCENTRACION.unidades[origen]
+    unidad_final = CONCENTRACION.unidades[destino]
+
+    if origen == destino:
+        return PlanConcentracion(unidad_inicial, unidad_final, masa_molar, densidad, None, _identidad)
+
+    # 1. Verificar parámetros necesarios
+    parametros = necesita_parametros_adicionales(unidad_inicial, unidad_final)
+    if parametros["masa_molar"] and masa_molar is None:
+        raise ValueError("Esta conversión requiere la masa molar del soluto.")
+    if parametros["densidad"] and densidad is None:
+        raise ValueError("Esta conversión requiere la densidad de la solución.")
+
+    # 2. Las fracciones no pasan por g/L
+    if unidad_inicial in FRACCIONES:
+        raise ValueError(f"Error en la conversión: Conversión desde {unidad_inicial} requiere datos de mezcla específicos")
+    if unidad_final in FRACCIONES:
+        raise ValueError(f"Error en la conversión: Conversión hacia {unidad_final} requiere datos de mezcla específicos")
+
+    # 3. Precalcular los pasos lineales y elegir las funciones de la tabla
+    pasos_a = PASOS_A_G_L.get(unidad_inicial)
+    pasos_desde = PASOS_DESDE_G_L.get(unidad_final)
+    if pasos_a is not None:
+        pasos_a = pasos_a(masa_molar, densidad)
+    if pasos_desde is not None:
+        pasos_desde = pasos_desde(masa_molar, densidad)
+
+    funcion_a = FUNCIONES_A_G_L.get(unidad_inicial)
+    funcion_desde = FUNCIONES_DESDE_G_L.get(unidad_final)
+
+    # Los pasos se aplican uno a uno, en el orden de las fórmulas originales, para
+    # obtener los mismos resultados (no se multiplican los coeficientes entre sí)
+    a1, b1, c1 = pasos_a or (None, None, None)
+    a2, b2, c2 = pasos_desde or (None, None, None)
+
+    def aplicar(cantidad):
+        if type(cantidad) is not float and getattr(cantidad, "ndim", 0):
+            return _aplicar_arreglo(unidad_inicial, unidad_final, cantidad, masa_molar, densidad)
+        try:
+            if funcion_a is not None:
+                cantidad = funcion_a(cantidad, masa_molar, densidad)
+            if a1 is not None:
+                cantidad = cantidad * a1
+            if b1 is not None:
+                cantidad = cantidad * b1
+            if c1 is not None:
+                cantidad = cantidad / c1
+            if a2 is not None:
+                cantidad = cantidad * a2
+            if b2 is not None:
+                cantidad = cantidad * b2
+            if c2 is not None:
+                cantidad = cantidad / c2
+            if funcion_desde is not None:
+                cantidad = funcion_desde(cantidad, masa_molar, densidad)
+            return cantidad
+        except ZeroDivisionError as e:
+            raise ValueError(f"Error en la conversión: {str(e)}") from None
+
+    lineal = funcion_a is None and funcion_desde is None
+    return PlanConcentracion(unidad_inicial, unidad_final, masa_molar, densidad,
+                             (pasos_a, pasos_desde) if lineal else None, aplicar)
+
+
+def _aplicar_arreglo(unidad_inicial, unidad_final, cantidades, mm, dens):
+    """Ruta de arreglos de los planes: como convertir_concentracion_lote, NaN en las filas inválidas."""
+    import numpy as np
+
+    resultado = _convertir_arreglo(unidad_inicial, unidad_final, cantidades, mm, dens)
+    validos = np.isfinite(resultado)
+    if not validos.all():
+        resultado = np.where(validos, resultado, np.nan)
+    return resultado
+
+
+def _validar_parametros_escalares(masa_molar, densidad):
+    """Los planes se guardan en caché por masa_molar y densidad, que deben ser números (o None)."""
+    for nombre, valor in (("masa_molar", masa_molar), ("densidad", densidad)):
+        if valor is not None and not isinstance(valor, Real):
+            raise ValueError(f"El parámetro {nombre} debe ser un número; para valores por fila "
+                             f"use convertir_concentracion_lote.")
+
+
+def compilar_concentracion(unidad_inicial, unidad_final, masa_molar=None, densidad=None):
+    """
+    Compila una conversión de concentración para unidades y parámetros fijos.
+
+    Los planes se guardan en caché por (unidades, masa_molar, densidad), por lo que
+    compilar repetidamente la misma conversión no repite las validaciones.
+    El plan acepta escalares o ndarrays: un escalar no convertible (por ejemplo, un
+    denominador de molalidad no positivo) lanza ValueError, y en un arreglo esas
+    filas quedan en NaN, como en convertir_concentracion_lote.
+    No admite conversiones entre fracción masa y fracción molar.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-12) o nombre de unidad
+        unidad_final: Número de unidad final (1-12) o nombre de unidad
+        masa_molar: Masa molar del soluto en g/mol, un número (opcional)
+        densidad: Densidad de la solución en g/mL, un número (opcional)
+
+    Returns:
+        PlanConcentracion: Plan que se aplica llamándolo con la cantidad
+    """
+    origen, destino = resolver_unidades(CONCENTRACION, unidad_inicial, unidad_final)
+    try:
+        return _compilar(origen, destino, masa_molar, densidad)
+    except TypeError:
+        # Parámetros no hashables (arreglos, listas): se valida solo al fallar la caché
+        _validar_parametros_escalares(masa_molar, densidad)
+        raise
+
+
 def convertir_concentracion(unidad_inicial, unidad_final, cantidad, masa_molar=None, densidad=None, datos_mezcla=None):
     """
     Convierte concentraciones entre diferentes unidades.
@@ -237,60 +619,28 @@ def convertir_concentracion(unidad_inicial, unidad_final, cantidad, masa_molar=N
         unidad_inicial: Número de unidad inicial (1-12) o nombre de unidad
         unidad_final: Número de unidad final (1-12) o nombre de unidad
         cantidad: Valor de concentración a convertir
-        masa_molar: Masa molar del soluto en g/mol (opcional)
-        densidad: Densidad de la solución en g/mL (opcional)
+        masa_molar: Masa molar del soluto en g/mol, un número (opcional)
+        densidad: Densidad de la solución en g/mL, un número (opcional)
         datos_mezcla: Diccionario con datos de mezcla para conversiones fracción masa/molar
     
     Returns:
         dict o float: Para fracciones binarias devuelve dict con todas las fracciones, sino float
     """
     
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "molaridad",
-        "2": "molalidad",
-        "3": "fraccion_molar",
-        "4": "fraccion_masa",
-        "5": "milimolar",
-        "6": "micromolar",
-        "7": "ppm",
-        "8": "ppb",
-        "9": "g_l",
-        "10": "kg_m3",
-        "11": "porcentaje_mv",
-        "12": "porcentaje_mm"
-    }
+    # 1. Validar unidades (número o nombre)
+    origen, destino = resolver_unidades(CONCENTRACION, unidad_inicial, unidad_final)
     
-    # 2. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 3. Validaciones
-    unidades_validas = list(unidades.values())
-    if unidad_inicial not in unidades_validas:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in unidades_validas:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 4. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
+    # 2. Si las unidades son iguales, devolver la cantidad sin cambio
+    if origen == destino:
         return cantidad
     
-    # 5. Verificar parámetros necesarios
-    parametros = necesita_parametros_adicionales(unidad_inicial, unidad_final)
+    unidad_inicial = CONCENTRACION.unidades[origen]
+    unidad_final = CONCENTRACION.unidades[destino]
     
-    if parametros["masa_molar"] and masa_molar is None:
-        raise ValueError("Esta conversión requiere la masa molar del soluto.")
-    if parametros["densidad"] and densidad is None:
-        raise ValueError("Esta conversión requiere la densidad de la solución.")
-    if parametros["datos_mezcla"] and datos_mezcla is None:
-        raise ValueError("Esta conversión requiere datos de la mezcla.")
-    
-    # 6. Conversión especial entre fracciones masa y molar
-    if ((unidad_inicial == "fraccion_masa" and unidad_final == "fraccion_molar") or
-        (unidad_inicial == "fraccion_molar" and unidad_final == "fraccion_masa")):
+    # 3. Conversión especial entre fracciones masa y molar
+    if unidad_inicial in FRACCIONES and unidad_final in FRACCIONES:
+        if datos_mezcla is None:
+            raise ValueError("Esta conversión requiere datos de la mezcla.")
         
         componentes = datos_mezcla['componentes']
         indice_componente = datos_mezcla['indice_componente']
@@ -343,87 +693,86 @@ def convertir_concentracion(unidad_inicial, unidad_final, cantidad, masa_molar=N
                 )
             return resultado
     
-    # 7. Función para convertir a g/L como unidad intermedia
-    def a_g_l(valor, unidad, mm=None, dens=None):
-        if unidad == "g_l":
-            return valor
-        elif unidad == "kg_m3":
-            return valor  # kg/m³ = g/L
-        elif unidad == "ppm":
-            return valor / 1000  # ppm a g/L
-        elif unidad == "ppb":
-            return valor / 1_000_000  # ppb a g/L
-        elif unidad == "porcentaje_mv":
-            return valor * 10  # %m/v a g/L
-        elif unidad == "porcentaje_mm":
-            if dens is None:
-                raise ValueError("Densidad requerida para % m/m")
-            return valor * dens * 10  # %m/m a g/L
-        elif unidad == "molaridad":
-            if mm is None:
-                raise ValueError("Masa molar requerida para molaridad")
-            return valor * mm  # M * g/mol = g/L
-        elif unidad == "milimolar":
-            if mm is None:
-                raise ValueError("Masa molar requerida para milimolar")
-            return valor * mm / 1000  # mM * g/mol / 1000 = g/L
-        elif unidad == "micromolar":
-            if mm is None:
-                raise ValueError("Masa molar requerida para micromolar")
-            return valor * mm / 1_000_000  # μM * g/mol / 1000000 = g/L
-        elif unidad == "molalidad":
-            if mm is None or dens is None:
-                raise ValueError("Masa molar y densidad requeridas para molalidad")
-            return valor * mm * dens / (1 + valor * mm / 1000)
-        elif unidad in ["fraccion_molar", "fraccion_masa"]:
-            raise ValueError(f"Conversión desde {unidad} requiere datos de mezcla específicos")
-        else:
-            raise ValueError(f"Conversión desde {unidad} no implementada")
-    
-    # 8. Función para convertir desde g/L
-    def desde_g_l(valor, unidad, mm=None, dens=None):
-        if unidad == "g_l":
-            return valor
-        elif unidad == "kg_m3":
-            return valor  # g/L = kg/m³
-        elif unidad == "ppm":
-            return valor * 1000
-        elif unidad == "ppb":
-            return valor * 1_000_000
-        elif unidad == "porcentaje_mv":
-            return valor / 10
-        elif unidad == "porcentaje_mm":
-            if dens is None:
-                raise ValueError("Densidad requerida para % m/m")
-            return valor / (dens * 10)
-        elif unidad == "molaridad":
-            if mm is None:
-                raise ValueError("Masa molar requerida para molaridad")
-            return valor / mm  # g/L / g/mol = M
-        elif unidad == "milimolar":
-            if mm is None:
-                raise ValueError("Masa molar requerida para milimolar")
-            return valor * 1000 / mm  # g/L * 1000 / g/mol = mM
-        elif unidad == "micromolar":
-            if mm is None:
-                raise ValueError("Masa molar requerida para micromolar")
-            return valor * 1_000_000 / mm  # g/L * 1000000 / g/mol = μM
-        elif unidad == "molalidad":
-            if mm is None or dens is None:
-                raise ValueError("Masa molar y densidad requeridas para molalidad")
-            denominador = mm * dens - valor * mm / 1000
-            if denominador <= 0:
-                raise ValueError("Concentración demasiado alta para conversión a molalidad")
-            return valor / denominador * 1000
-        elif unidad in ["fraccion_molar", "fraccion_masa"]:
-            raise ValueError(f"Conversión hacia {unidad} requiere datos de mezcla específicos")
-        else:
-            raise ValueError(f"Conversión hacia {unidad} no implementada")
-    
-    # 9. Realizar la conversión normal
+    # 4. Conversión normal a través de g/L con un plan precompilado
     try:
-        valor_intermedio = a_g_l(cantidad, unidad_inicial, masa_molar, densidad)
-        resultado = desde_g_l(valor_intermedio, unidad_final, masa_molar, densidad)
-        return resultado
-    except Exception as e:
-        raise ValueError(f"Error en la conversión: {str(e)}")
\ No newline at end of file
+        plan = _compilar(origen, destino, masa_molar, densidad)
+    except TypeError:
+        _validar_parametros_escalares(masa_molar, densidad)
+        raise
+    return plan.aplicar(cantidad)
+
+
+def convertir_concentracion_lote(unidad_inicial, unidad_final, cantidades, masa_molar=None, densidad=None,
+                                 out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de concentraciones con masa molar y densidad por fila.
+
+    cantidades, masa_molar y densidad pueden ser escalares o arreglos y se combinan
+    con broadcasting de NumPy. Las filas inválidas (por ejemplo, un denominador de
+    molalidad no positivo o una masa molar nula) no interrumpen el lote: quedan en
+    NaN y se marcan como False en la máscara.
+    No admite conversiones entre fracción masa y fracción molar. Con out o en_sitio
+    el resultado se escribe en ese búfer, pero los pasos intermedios usan arreglos
+    temporales.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-12) o nombre de unidad
+        unidad_final: Número de unidad final (1-12) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        masa_molar: Masa molar del soluto en g/mol, escalar o arreglo (opcional)
+        densidad: Densidad de la solución en g/mL, escalar o arreglo (opcional)
+        out: Búfer del tipo dtype donde escribir el resultado, con la forma de cantidades (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"; masa_molar y densidad se convierten al mismo tipo
+
+    Returns:
+        tuple: (resultado, validos) - ndarray del tipo dtype (sobre out si se indicó) y máscara booleana de filas válidas
+    """
+    import numpy as np
+
+    # 1. Validar unidades y parámetros una sola vez para todo el lote
+    origen, destino = resolver_unidades(CONCENTRACION, unidad_inicial, unidad_final)
+    unidad_inicial = CONCENTRACION.unidades[origen]
+    unidad_final = CONCENTRACION.unidades[destino]
+
+    if origen != destino:
+        parametros = necesita_parametros_adicionales(unidad_inicial, unidad_final)
+        if parametros["masa_molar"] and masa_molar is None:
+            raise ValueError("Esta conversión requiere la masa molar del soluto.")
+        if parametros["densidad"] and densidad is None:
+            raise ValueError("Esta conversión requiere la densidad de la solución.")
+        if unidad_inicial in FRACCIONES:
+            raise ValueError(f"Conversión desde {unidad_inicial} requiere datos de mezcla específicos")
+        if unidad_final in FRACCIONES:
+            raise ValueError(f"Conversión hacia {unidad_final} requiere datos de mezcla específicos")
+
+    # 2. Preparar los arreglos con broadcasting
+    entrada, salida = preparar_lote(cantidades, out, en_sitio, dtype)
+    operandos = [entrada]
+    if masa_molar is not None:
+        operandos.append(np.asarray(masa_molar, dtype=entrada.dtype))
+    if densidad is not None:
+        operandos.append(np.asarray(densidad, dtype=entrada.dtype))
+    forma = np.broadcast_shapes(*(operando.shape for operando in operandos))
+    cantidades = np.broadcast_to(operandos[0], forma)
+    mm = operandos[1] if masa_molar is not None else None
+    dens = operandos[-1] if densidad is not None else None
+
+    if origen == destino:
+        resultado = cantidades
+    else:
+        # 3. Convertir a g/L y desde g/L despachando por tabla
+        resultado = _convertir_arreglo(unidad_inicial, unidad_final, cantidades, mm, dens)
+
+    if salida is None:
+        resultado = np.array(np.broadcast_to(resultado, forma), dtype=entrada.dtype)
+    else:
+        if salida.shape != forma:
+            raise ValueError(f"El destino tiene forma {salida.shape} y el resultado {forma}.")
+        np.copyto(salida, np.broadcast_to(resultado, forma))
+        resultado = salida
+
+    # 4. Marcar filas inválidas en lugar de lanzar una excepción
+    validos = np.isfinite(resultado)
+    resultado[~validos] = np.nan
+    return resultado, validos
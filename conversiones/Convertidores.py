@@ -0,0 +1,275 @@
+# Convertidores.py - Convertidores compilados para un par de unidades fijo
+
+from functools import partial
+from importlib import import_module
+from operator import mul
+
+from conversiones import Cache
+from conversiones.Registro import MODULOS, obtener_magnitud, resolver_unidades
+
+# Rutas ya resueltas: magnitud -> (tablas, módulo, función escalar, función por lotes)
+_RUTAS = {}
+
+
+def _identidad(cantidad):
+    return cantidad
+
+
+def obtener_convertidor(magnitud, unidad_inicial, unidad_final, masa_molar=None, densidad=None):
+    """
+    Resuelve y valida un par de unidades una sola vez y devuelve un convertidor especializado.
+
+    El convertidor devuelto acepta un escalar o un ndarray y no repite validaciones.
+    Las unidades se interpretan igual que en convertir(), así que también se admiten
+    símbolos.
+
+    Args:
+        magnitud: Nombre de la magnitud ("longitud", "volumen", "temperatura", "concentracion"...)
+        unidad_inicial: Número de menú, nombre interno o símbolo ("Pa", "°F"...) de la unidad inicial
+        unidad_final: Unidad final, en cualquiera de las mismas formas
+        masa_molar: Masa molar del soluto en g/mol (solo concentración)
+        densidad: Densidad de la solución en g/mL (solo concentración)
+
+    Returns:
+        callable: Función convertir(cantidad)
+    """
+    tablas = (_RUTAS.get(magnitud) or _ruta(magnitud))[0]
+    codigos = tablas.codigos
+    if unidad_inicial not in codigos:
+        unidad_inicial = _unidad(tablas, unidad_inicial)
+    if unidad_final not in codigos:
+        unidad_final = _unidad(tablas, unidad_final)
+
+    if tablas.nombre == "concentracion":
+        from conversiones.Concentracion import compilar_concentracion
+        return compilar_concentracion(unidad_inicial, unidad_final, masa_molar, densidad).aplicar
+
+    origen, destino = resolver_unidades(tablas, unidad_inicial, unidad_final)
+    if origen == destino:
+        return _identidad
+
+    if tablas.matriz is None:
+        # Temperatura: única magnitud no lineal sin parámetros
+        from conversiones.Temperatura import FUNCIONES
+        return FUNCIONES[origen][destino]
+
+    return partial(mul, tablas.matriz[origen][destino])
+
+
+def _ruta(magnitud):
+    """Devuelve la ruta precalculada de una magnitud, importando su módulo la primera vez."""
+    ruta = _RUTAS.get(magnitud)
+    if ruta is not None:
+        return ruta
+
+    nombre = magnitud
+    if nombre not in MODULOS:
+        # Admite "Presión", "TEMPERATURA"...
+        from conversiones.Unidades import normalizar_unidad
+        nombre = normalizar_unidad(str(magnitud))
+    tablas = obtener_magnitud(nombre)
+    ruta = (tablas, import_module(MODULOS[nombre]), f"convertir_{nombre}", f"convertir_{nombre}_lote")
+    _RUTAS[magnitud] = ruta
+    return ruta
+
+
+# Símbolos ya interpretados: (magnitud, unidad) -> nombre interno
+_SIMBOLOS = {}
+
+
+def _unidad(tablas, unidad):
+    """Devuelve la unidad tal cual si es un número o nombre interno; si no, la interpreta como símbolo."""
+    try:
+        return _SIMBOLOS[tablas.nombre, unidad]
+    except KeyError:
+        pass
+    except TypeError:
+        return unidad
+
+    from conversiones.Unidades import interpretar_unidad
+    try:
+        _, codigo = interpretar_unidad(unidad, tablas.nombre)
+    except ValueError:
+        return unidad  # la función de la magnitud informa del error con su mensaje habitual
+    nombre = _SIMBOLOS[tablas.nombre, unidad] = tablas.unidades[codigo]
+    return nombre
+
+
+def convertir(magnitud, desde, hasta, valor, **parametros):
+    """
+    Convierte un valor de cualquier magnitud con un único punto de entrada.
+
+    La magnitud se enruta con una tabla precalculada y se llama directamente a
+    su función convertir_<magnitud>, sin importar el menú interactivo. Si la caché
+    de resultados está activada (Cache.activar_cache), se consulta antes.
+
+    Args:
+        magnitud: Nombre de la magnitud ("presion", "temperatura", "concentracion"...)
+        desde: Unidad inicial: número de menú, nombre interno o símbolo ("km/h", "°F"...)
+        hasta: Unidad final, en cualquiera de las mismas formas
+        valor: Valor a convertir
+        **parametros: masa_molar, densidad o datos_mezcla (solo concentración)
+
+    Returns:
+        float: Valor convertido (dict en las conversiones entre fracciones de mezclas binarias)
+    """
+    tablas, modulo, escalar, _ = _RUTAS.get(magnitud) or _ruta(magnitud)
+    codigos = tablas.codigos
+    if desde not in codigos:
+        desde = _unidad(tablas, desde)
+    if hasta not in codigos:
+        hasta = _unidad(tablas, hasta)
+    # La función se busca en el módulo en cada llamada para respetar la instrumentación
+    if Cache.CACHE is not None:
+        return Cache.calcular_con_cache(magnitud, getattr(modulo, escalar), desde, hasta, valor, **parametros)
+    if parametros:
+        return getattr(modulo, escalar)(desde, hasta, valor, **parametros)
+    return getattr(modulo, escalar)(desde, hasta, valor)
+
+
+def convertir_lote(magnitud, desde, hasta, valores, **parametros):
+    """
+    Convierte un arreglo de valores de cualquier magnitud. Requiere NumPy.
+
+    Args:
+        magnitud: Nombre de la magnitud
+        desde: Unidad inicial (número de menú, nombre interno o símbolo)
+        hasta: Unidad final
+        valores: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        **parametros: out, en_sitio y dtype ("float64" o "float32", ver Registro.preparar_lote);
+            masa_molar y densidad, escalares o arreglos (solo concentración)
+
+    Returns:
+        numpy.ndarray: Valores convertidos, float64 o del dtype indicado (ej: dtype="float32").
+        En concentración, las filas inválidas quedan en NaN
+    """
+    tablas, modulo, _, lote = _RUTAS.get(magnitud) or _ruta(magnitud)
+    resultado = getattr(modulo, lote)(_unidad(tablas, desde), _unidad(tablas, hasta), valores, **parametros)
+    if isinstance(resultado, tuple):
+        # convertir_concentracion_lote devuelve además la máscara de filas válidas
+        resultado = resultado[0]
+    return resultado
+
+
+def convertir_a_todas(magnitud, desde, valores, **parametros):
+    """
+    Convierte uno o varios valores a todas las unidades de una magnitud a la vez.
+
+    En las magnitudes lineales es un único producto exterior con la fila de factores
+    precalculada de la unidad inicial. En temperatura y concentración se convierte
+    unidad por unidad; en concentración, las unidades que no se pueden alcanzar con
+    los parámetros dados (o las fracciones, que requieren datos de mezcla) quedan
+    en NaN. Requiere NumPy.
+
+    Args:
+        magnitud: Nombre de la magnitud
+        desde: Unidad inicial (número de menú, nombre interno o símbolo)
+        valores: Valor o arreglo de valores
+        **parametros: masa_molar y densidad (solo concentración)
+
+    Returns:
+        tuple: (unidades, matriz) - nombres de las unidades y ndarray float64 de forma
+        (unidades, valores), con una fila por unidad en el orden del menú
+    """
+    import numpy as np
+
+    tablas, modulo, _, lote = _RUTAS.get(magnitud) or _ruta(magnitud)
+    origen = tablas.codigos.get(_unidad(tablas, desde))
+    if origen is None:
+        raise ValueError(f"Unidad inicial '{desde}' no válida.")
+    valores = np.atleast_1d(np.asarray(valores, dtype=np.float64))
+
+    if tablas.nombre == "concentracion":
+        matriz = np.full((len(tablas.unidades),) + valores.shape, np.nan)
+        for destino, unidad_final in enumerate(tablas.unidades):
+            try:
+                matriz[destino] = getattr(modulo, lote)(tablas.unidades[origen], unidad_final, valores, **parametros)[0]
+            except ValueError:
+                pass
+        return tablas.unidades, matriz
+
+    if tablas.matriz is None:
+        # Temperatura: mismas operaciones que la conversión escalar, para que 0 °C salga exacto
+        matriz = np.empty((len(tablas.unidades),) + valores.shape)
+        for destino, unidad_final in enumerate(tablas.unidades):
+            getattr(modulo, lote)(tablas.unidades[origen], unidad_final, valores, out=matriz[destino])
+        return tablas.unidades, matriz
+
+    from conversiones.Registro import matriz_factores
+    matriz = np.multiply.outer(matriz_factores(tablas)[origen], valores)
+    return tablas.unidades, matriz
+
+
+def formatear_tabla(unidades, valores, matriz):
+    """
+    Da formato de tabla compacta al resultado de convertir_a_todas.
+
+    Args:
+        unidades: Nombres de las unidades (filas)
+        valores: Valores de entrada (columnas)
+        matriz: Resultado de forma (unidades, valores)
+
+    Returns:
+        str: Tabla con una fila por unidad y una columna por valor
+    """
+    import numpy as np
+
+    valores = np.atleast_1d(np.asarray(valores, dtype=np.float64)).ravel()
+    matriz = np.asarray(matriz).reshape(len(unidades), -1)
+    ancho_unidad = max(len(unidad) for unidad in unidades)
+
+    lineas = [" " * ancho_unidad + "".join(f"{valor:>14.6g}" for valor in valores)]
+    lineas.append("-" * len(lineas[0]))
+    for unidad, fila in zip(unidades, matriz):
+        celdas = "".join(f"{'—':>14}" if np.isnan(x) else f"{x:>14.6g}" for x in fila)
+        lineas.append(f"{unidad:<{ancho_unidad}}{celdas}")
+    return "\n".join(lineas)
+
+
+def informe_precision(magnitud, dtype="float32", valores=None):
+    """
+    Mide el error de convertir en precisión reducida cada par de unidades de una magnitud.
+
+    Los valores de prueba se redondean primero al tipo reducido (como estarían ya
+    almacenados) y se convierten por las dos rutas: en dtype y en float64. El
+    error relativo se calcula donde el resultado exacto no es cero; en temperatura,
+    cerca del cero de la escala final el error relativo crece aunque el absoluto
+    no, por eso se informa de ambos.
+
+    Args:
+        magnitud: Nombre de una magnitud sin parámetros (todas salvo concentración)
+        dtype: Tipo reducido a evaluar (por defecto "float32")
+        valores: Valores de prueba (por defecto, ±10^-6 a 10^6 en lineales y
+            -200 a 5000 en temperatura)
+
+    Returns:
+        dict: {(unidad_inicial, unidad_final): {"error_relativo": float, "error_absoluto": float}}
+    """
+    import numpy as np
+
+    tablas, modulo, _, lote = _RUTAS.get(magnitud) or _ruta(magnitud)
+    if tablas.nombre == "concentracion":
+        raise ValueError("El informe de precisión no cubre concentración: depende de masa molar y densidad.")
+
+    if valores is None:
+        if tablas.matriz is None:
+            valores = np.linspace(-200.0, 5000.0, 20001)
+        else:
+            modulos = np.logspace(-6, 6, 10001)
+            valores = np.concatenate((-modulos[::-1], modulos))
+    reducidos = np.asarray(valores, dtype=dtype)
+    exactos = reducidos.astype(np.float64)
+
+    funcion = getattr(modulo, lote)
+    informe = {}
+    for unidad_inicial in tablas.unidades:
+        for unidad_final in tablas.unidades:
+            aproximado = funcion(unidad_inicial, unidad_final, reducidos, dtype=dtype).astype(np.float64)
+            exacto = funcion(unidad_inicial, unidad_final, exactos)
+            error = np.abs(aproximado - exacto)
+            no_nulos = exacto != 0
+            informe[unidad_inicial, unidad_final] = {
+                "error_relativo": float(np.max(error[no_nulos] / np.abs(exacto[no_nulos]))) if no_nulos.any() else 0.0,
+                "error_absoluto": float(np.max(error)),
+            }
+    return informe
@@ -1,41 +1,62 @@
-def convertir_densidad(unidad_inicial, unidad_final, cantidad): 
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "kg_m3",
-        "2": "g_cm3",
-        "3": "g_l",
-        "4": "lb_ft3", 
-        "5": "lb_in3"
-    }
-    
-    # 2. Factores hacia kg/m³ (unidad base)
-    factores_por_kg_m3 = {
-        "kg_m3": 1.0,
-        "g_cm3": 1000.0,
-        "g_l": 1.0,
-        "lb_ft3": 16.0185,
-        "lb_in3": 27679.9
-    }
-    
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_kg_m3:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_kg_m3:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-    
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_kg_m3[unidad_inicial]
-    factor_destino = factores_por_kg_m3[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-    
-    return cantidad * factor_conversion
\ No newline at end of file
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "kg_m3",
+    "2": "g_cm3",
+    "3": "g_l",
+    "4": "lb_ft3", 
+    "5": "lb_in3"
+}
+
+# 2. Factores hacia kg/m³ (unidad base)
+FACTORES_POR_KG_M3 = {
+    "kg_m3": 1.0,
+    "g_cm3": 1000.0,
+    "g_l": 1.0,
+    "lb_ft3": 16.0185,
+    "lb_in3": 27679.9
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+DENSIDAD = registrar_magnitud("densidad", UNIDADES, FACTORES_POR_KG_M3)
+
+
+def convertir_densidad(unidad_inicial, unidad_final, cantidad):
+    return convertir_lineal(DENSIDAD, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_densidad_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de densidades con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-5) o nombre de unidad
+        unidad_final: Número de unidad final (1-5) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(DENSIDAD, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_densidad_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de densidades con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-5), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-5) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(DENSIDAD, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
@@ -1,3 +1,33 @@
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "joules",
+    "2": "calorias",
+    "3": "kilocalorias",
+    "4": "electronvolts",
+    "5": "kilojoules",
+    "6": "btu",
+    "7": "vatios_hora",
+    "8": "kilovatios_hora"
+}
+
+# 2. Factores hacia joules (unidad base)
+FACTORES_POR_JOULE = {
+    "joules": 1.0,
+    "calorias": 0.239006,
+    "kilocalorias": 0.000239006,
+    "electronvolts": 6.242e+18,
+    "kilojoules": 0.001,
+    "btu": 0.000947817,
+    "vatios_hora": 0.000277778,
+    "kilovatios_hora": 2.77778e-7
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+ENERGIA = registrar_magnitud("energia", UNIDADES, FACTORES_POR_JOULE)
+
+
 def convertir_energia(unidad_inicial, unidad_final, cantidad):
     """
     Convierte energías entre diferentes unidades.
@@ -10,50 +40,40 @@ def convertir_energia(unidad_inicial, unidad_final, cantidad):
     Returns:
         float: Energía convertida
     """
-    
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "joules",
-        "2": "calorias",
-        "3": "kilocalorias",
-        "4": "electronvolts",
-        "5": "kilojoules",
-        "6": "btu",
-        "7": "vatios_hora",
-        "8": "kilovatios_hora"
-    }
-    
-    # 2. Factores hacia joules (unidad base)
-    factores_por_joule = {
-        "joules": 1.0,
-        "calorias": 0.239006,
-        "kilocalorias": 0.000239006,
-        "electronvolts": 6.242e+18,
-        "kilojoules": 0.001,
-        "btu": 0.000947817,
-        "vatios_hora": 0.000277778,
-        "kilovatios_hora": 2.77778e-7
-    }
-    
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_joule:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_joule:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-    
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_joule[unidad_inicial]
-    factor_destino = factores_por_joule[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-    
-    return cantidad * factor_conversion
\ No newline at end of file
+    return convertir_lineal(ENERGIA, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_energia_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de energías con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-8) o nombre de unidad
+        unidad_final: Número de unidad final (1-8) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(ENERGIA, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_energia_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de energías con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-8), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-8) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(ENERGIA, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
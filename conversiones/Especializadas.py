@@ -0,0 +1,106 @@
+# Especializadas.py - Funciones generadas, una por par de unidades, con el factor como constante
+#
+# Para cada magnitud sin parámetros se genera el código fuente de una función
+# plana por par (ej: "def presion_atmosferas_a_psi(cantidad): return cantidad * 14.69...")
+# y se compila con exec la primera vez que se pide un par de esa magnitud. La
+# llamada ya no traduce nombres, no consulta diccionarios ni compara unidades.
+#
+# Los factores se escriben con repr(), que reproduce el float exacto, y en
+# temperatura se copian los pasos de Temperatura.expresion_par, así que los
+# resultados son idénticos a los de convertir_<magnitud>.
+
+import linecache
+
+from conversiones.Registro import MODULOS, obtener_magnitud
+
+# Funciones compiladas por magnitud: {magnitud: {(unidad_inicial, unidad_final): función}}
+# Las claves incluyen números de menú y nombres internos.
+_PARES = {}
+
+
+def generar_fuente(magnitud):
+    """
+    Genera el código fuente de las funciones de todos los pares de una magnitud.
+
+    Args:
+        magnitud: Nombre de la magnitud (todas salvo concentración)
+
+    Returns:
+        str: Código Python con una función por par
+    """
+    tablas = obtener_magnitud(magnitud)
+    if tablas.matriz is None and magnitud != "temperatura":
+        raise ValueError(f"La magnitud '{magnitud}' depende de parámetros y no admite funciones generadas.")
+
+    expresion_par = None
+    if tablas.matriz is None:
+        from conversiones.Temperatura import expresion_par
+
+    lineas = [f"# Código generado por conversiones.Especializadas para {magnitud}", ""]
+    for origen, unidad_inicial in enumerate(tablas.unidades):
+        for destino, unidad_final in enumerate(tablas.unidades):
+            lineas.append(f"def {magnitud}_{unidad_inicial}_a_{unidad_final}(cantidad):")
+            if origen == destino:
+                lineas.append("    return cantidad")
+            elif expresion_par is None:
+                lineas.append(f"    return cantidad * {tablas.matriz[origen][destino]!r}")
+            else:
+                lineas.append(f"    return {expresion_par(origen, destino)}")
+            lineas.append("")
+    return "\n".join(lineas)
+
+
+def _compilar(magnitud):
+    """Compila las funciones de una magnitud y construye su tabla de búsqueda."""
+    fuente = generar_fuente(magnitud)
+    archivo = f"<conversiones generadas: {magnitud}>"
+    # Registrar el código para que las trazas y los perfiladores muestren las líneas
+    linecache.cache[archivo] = (len(fuente), None, fuente.splitlines(True), archivo)
+
+    espacio = {}
+    exec(compile(fuente, archivo, "exec"), espacio)
+
+    tablas = obtener_magnitud(magnitud)
+    alias = {}
+    for clave, codigo in tablas.codigos.items():
+        alias.setdefault(codigo, []).append(clave)
+
+    pares = {}
+    for origen, unidad_inicial in enumerate(tablas.unidades):
+        for destino, unidad_final in enumerate(tablas.unidades):
+            funcion = espacio[f"{magnitud}_{unidad_inicial}_a_{unidad_final}"]
+            for clave_inicial in alias[origen]:
+                for clave_final in alias[destino]:
+                    pares[clave_inicial, clave_final] = funcion
+    _PARES[magnitud] = pares
+    return pares
+
+
+def funcion_par(magnitud, unidad_inicial, unidad_final):
+    """
+    Devuelve la función generada para un par de unidades.
+
+    Las funciones de una magnitud se compilan todas juntas la primera vez que se
+    pide uno de sus pares; después es una sola búsqueda en diccionario.
+
+    Args:
+        magnitud: Nombre de la magnitud (todas salvo concentración)
+        unidad_inicial: Número o nombre de la unidad inicial
+        unidad_final: Número o nombre de la unidad final
+
+    Returns:
+        callable: Función convertir(cantidad) con el factor como constante
+    """
+    pares = _PARES.get(magnitud)
+    if pares is None:
+        if magnitud not in MODULOS:
+            raise ValueError(f"Magnitud '{magnitud}' no válida.")
+        pares = _compilar(magnitud)
+
+    funcion = pares.get((unidad_inicial, unidad_final))
+    if funcion is None:
+        codigos = obtener_magnitud(magnitud).codigos
+        if unidad_inicial not in codigos:
+            raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
+        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
+    return funcion
@@ -0,0 +1,238 @@
+# Instrumentacion.py - Contadores e histogramas de latencia por magnitud y par de unidades
+#
+# La instrumentación sustituye las funciones convertir_* (y, si se indica, los
+# manejadores manejar_conversion_* del menú) por versiones medidas mientras está
+# activada, y restaura las originales al desactivarla. Desactivada no añade
+# ningún coste: las funciones originales se llaman directamente.
+
+import threading
+import time
+from importlib import import_module
+
+from conversiones.Registro import MODULOS, obtener_magnitud
+
+# Funciones escalares instrumentadas de cada magnitud
+FUNCIONES = {
+    "volumen": "convertir_volumen",
+    "temperatura": "convertir_temperatura",
+    "concentracion": "convertir_concentracion",
+    "densidad": "convertir_densidad",
+    "velocidad": "convertir_velocidad",
+    "masa": "convertir_masa",
+    "energia": "convertir_energia",
+    "presion": "convertir_presion",
+    "longitud": "convertir_longitud",
+    "area": "convertir_area"
+}
+
+# Número de cubetas del histograma: la cubeta i cuenta latencias en [2^(i-1), 2^i) ns
+CUBETAS = 40
+
+
+class Metrica:
+    """Contadores e histograma logarítmico de latencias de una clave."""
+
+    __slots__ = ("llamadas", "errores", "total_ns", "cubetas")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.errores = 0
+        self.total_ns = 0
+        self.cubetas = [0] * CUBETAS
+
+    def registrar(self, nanosegundos, error):
+        self.llamadas += 1
+        self.errores += error
+        self.total_ns += nanosegundos
+        self.cubetas[min(nanosegundos.bit_length(), CUBETAS - 1)] += 1
+
+    def percentil_ns(self, porcentaje):
+        """Cota superior del percentil, según el histograma."""
+        objetivo = self.llamadas * porcentaje / 100
+        acumulado = 0
+        for cubeta, cantidad in enumerate(self.cubetas):
+            acumulado += cantidad
+            if cantidad and acumulado >= objetivo:
+                return 1 << cubeta
+        return 0
+
+    def resumen(self):
+        return {
+            "llamadas": self.llamadas,
+            "errores": self.errores,
+            "total_ns": self.total_ns,
+            "media_ns": self.total_ns / self.llamadas if self.llamadas else 0.0,
+            "p50_ns": self.percentil_ns(50),
+            "p99_ns": self.percentil_ns(99),
+            "histograma_ns": {
+                f"<{1 << cubeta}": cantidad for cubeta, cantidad in enumerate(self.cubetas) if cantidad
+            },
+        }
+
+
+_metricas = {}
+_candado = threading.Lock()
+_originales = []
+
+
+def _registrar(grupo, clave, nanosegundos, error):
+    with _candado:
+        metrica = _metricas.get((grupo, clave))
+        if metrica is None:
+            metrica = _metricas[(grupo, clave)] = Metrica()
+        metrica.registrar(nanosegundos, error)
+
+
+def _nombre_unidad(magnitud, unidad):
+    try:
+        indice = magnitud.codigos.get(unidad)
+    except TypeError:
+        indice = None
+    return magnitud.unidades[indice] if indice is not None else str(unidad)
+
+
+def instrumentar_conversion(nombre_magnitud, funcion):
+    """
+    Devuelve una versión de funcion que mide cada llamada por par de unidades.
+
+    Las unidades se guardan tal como llegan y se traducen a su nombre interno al
+    pedir la instantánea, para no encarecer cada llamada.
+    """
+    reloj = time.perf_counter_ns
+
+    def convertir(unidad_inicial, unidad_final, cantidad, *args, **kwargs):
+        inicio = reloj()
+        try:
+            resultado = funcion(unidad_inicial, unidad_final, cantidad, *args, **kwargs)
+        except BaseException:
+            _registrar(nombre_magnitud, (unidad_inicial, unidad_final), reloj() - inicio, 1)
+            raise
+        _registrar(nombre_magnitud, (unidad_inicial, unidad_final), reloj() - inicio, 0)
+        return resultado
+
+    convertir.__name__ = funcion.__name__
+    convertir.__doc__ = funcion.__doc__
+    convertir.__wrapped__ = funcion
+    return convertir
+
+
+def instrumentar_manejador(nombre, manejador):
+    """Devuelve una versión del manejador del menú que mide cada llamada (None cuenta como error)."""
+    reloj = time.perf_counter_ns
+
+    def manejar(*args, **kwargs):
+        inicio = reloj()
+        resultado = None
+        try:
+            resultado = manejador(*args, **kwargs)
+            return resultado
+        finally:
+            _registrar("menu", nombre, reloj() - inicio, int(resultado is None))
+
+    manejar.__name__ = manejador.__name__
+    manejar.__doc__ = manejador.__doc__
+    manejar.__wrapped__ = manejador
+    return manejar
+
+
+def _sustituir(modulo, nombre, nuevo):
+    _originales.append((modulo, nombre, getattr(modulo, nombre)))
+    setattr(modulo, nombre, nuevo)
+
+
+def activar_instrumentacion(modulo_menu=None):
+    """
+    Activa la instrumentación de todas las funciones convertir_*.
+
+    Se aplica a los accesos posteriores a conversiones.<Modulo>.convertir_* y a
+    conversiones.convertir_*; las referencias importadas antes con
+    "from ... import" conservan la función original.
+
+    Args:
+        modulo_menu: Módulo del programa principal cuyos manejar_conversion_* se instrumentan (opcional)
+    """
+    if _originales:
+        return
+
+    import conversiones
+
+    for nombre_magnitud, nombre_funcion in FUNCIONES.items():
+        modulo = import_module(MODULOS[nombre_magnitud])
+        instrumentada = instrumentar_conversion(nombre_magnitud, getattr(modulo, nombre_funcion))
+        _sustituir(modulo, nombre_funcion, instrumentada)
+        if nombre_funcion in vars(conversiones):
+            _sustituir(conversiones, nombre_funcion, instrumentada)
+
+    if modulo_menu is not None:
+        for nombre in dir(modulo_menu):
+            if nombre.startswith("manejar_conversion_") and nombre != "manejar_conversion_generica":
+                _sustituir(modulo_menu, nombre, instrumentar_manejador(nombre, getattr(modulo_menu, nombre)))
+
+
+def desactivar_instrumentacion():
+    """Restaura las funciones originales. Las métricas acumuladas se conservan."""
+    if not _originales:
+        return
+
+    import conversiones
+
+    while _originales:
+        modulo, nombre, original = _originales.pop()
+        setattr(modulo, nombre, original)
+
+    # conversiones.__getattr__ guarda en el paquete las funciones que se piden por
+    # primera vez: las que se guardaron instrumentadas se descartan para que el
+    # siguiente acceso vuelva a traer la original
+    for nombre_magnitud, nombre_funcion in FUNCIONES.items():
+        original = getattr(import_module(MODULOS[nombre_magnitud]), nombre_funcion)
+        if vars(conversiones).get(nombre_funcion, original) is not original:
+            del vars(conversiones)[nombre_funcion]
+
+
+def instrumentacion_activa():
+    return bool(_originales)
+
+
+def reiniciar_metricas():
+    """Descarta todas las métricas acumuladas."""
+    with _candado:
+        _metricas.clear()
+
+
+def instantanea():
+    """
+    Devuelve una copia de las métricas acumuladas.
+
+    Returns:
+        dict: {grupo: {clave: resumen}}, donde grupo es la magnitud (o "menu") y clave
+        el par de unidades "inicial->final" (o el nombre del manejador)
+    """
+    with _candado:
+        copias = []
+        for (grupo, clave), metrica in _metricas.items():
+            copia = Metrica()
+            copia.llamadas = metrica.llamadas
+            copia.errores = metrica.errores
+            copia.total_ns = metrica.total_ns
+            copia.cubetas = list(metrica.cubetas)
+            copias.append((grupo, clave, copia))
+
+    # Unir las entradas de un mismo par escrito con números o con nombres
+    agrupadas = {}
+    for grupo, clave, metrica in copias:
+        if isinstance(clave, tuple):
+            magnitud = obtener_magnitud(grupo)
+            clave = f"{_nombre_unidad(magnitud, clave[0])}->{_nombre_unidad(magnitud, clave[1])}"
+        acumulada = agrupadas.get((grupo, clave))
+        if acumulada is None:
+            agrupadas[(grupo, clave)] = metrica
+            continue
+        acumulada.llamadas += metrica.llamadas
+        acumulada.errores += metrica.errores
+        acumulada.total_ns += metrica.total_ns
+        acumulada.cubetas = [a + b for a, b in zip(acumulada.cubetas, metrica.cubetas)]
+
+    resultado = {}
+    for (grupo, clave), metrica in sorted(agrupadas.items()):
+        resultado.setdefault(grupo, {})[clave] = metrica.resumen()
+    return resultado
@@ -1,49 +1,70 @@
-def convertir_longitud(unidad_inicial, unidad_final, cantidad):    
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "metros",
-        "2": "centimetros",
-        "3": "milimetros",
-        "4": "kilometros",
-        "5": "pulgadas",
-        "6": "pies",
-        "7": "yardas",
-        "8": "millas",
-        "9": "micrometros"
-    }
-    
-    # 2. Factores hacia metros (unidad base)
-    factores_por_metro = {
-        "metros": 1.0,
-        "centimetros": 100.0,
-        "milimetros": 1000.0,
-        "kilometros": 0.001,
-        "pulgadas": 39.3701,
-        "pies": 3.28084,
-        "yardas": 1.09361,
-        "millas": 0.000621371,
-        "micrometros": 1_000_000.0
-    }
-    
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_metro:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_metro:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-    
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_metro[unidad_inicial]
-    factor_destino = factores_por_metro[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-    
-    return cantidad * factor_conversion
\ No newline at end of file
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "metros",
+    "2": "centimetros",
+    "3": "milimetros",
+    "4": "kilometros",
+    "5": "pulgadas",
+    "6": "pies",
+    "7": "yardas",
+    "8": "millas",
+    "9": "micrometros"
+}
+
+# 2. Factores hacia metros (unidad base)
+FACTORES_POR_METRO = {
+    "metros": 1.0,
+    "centimetros": 100.0,
+    "milimetros": 1000.0,
+    "kilometros": 0.001,
+    "pulgadas": 39.3701,
+    "pies": 3.28084,
+    "yardas": 1.09361,
+    "millas": 0.000621371,
+    "micrometros": 1_000_000.0
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+LONGITUD = registrar_magnitud("longitud", UNIDADES, FACTORES_POR_METRO)
+
+
+def convertir_longitud(unidad_inicial, unidad_final, cantidad):
+    return convertir_lineal(LONGITUD, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_longitud_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de longitudes con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-9) o nombre de unidad
+        unidad_final: Número de unidad final (1-9) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(LONGITUD, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_longitud_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de longitudes con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-9), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-9) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(LONGITUD, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
@@ -1,49 +1,70 @@
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "kg",
+    "2": "g",
+    "3": "lb",
+    "4": "mg",
+    "5": "t",
+    "6": "oz",
+    "7": "stone",
+    "8": "toneladas_metricas",
+    "9": "toneladas_cortas"
+}
+
+# 2. Factores hacia kilogramos (unidad base)
+FACTORES_POR_KG = {
+    "kg": 1.0,
+    "g": 1000.0,
+    "lb": 2.20462,
+    "mg": 1_000_000.0,
+    "t": 0.001,
+    "oz": 35.274,
+    "stone": 0.157473,
+    "toneladas_metricas": 0.001,
+    "toneladas_cortas": 0.00110231
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+MASA = registrar_magnitud("masa", UNIDADES, FACTORES_POR_KG)
+
+
 def convertir_masa(unidad_inicial, unidad_final, cantidad):
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "kg",
-        "2": "g",
-        "3": "lb",
-        "4": "mg",
-        "5": "t",
-        "6": "oz",
-        "7": "stone",
-        "8": "toneladas_metricas",
-        "9": "toneladas_cortas"
-    }
-    
-    # 2. Factores hacia kilogramos (unidad base)
-    factores_por_kg = {
-        "kg": 1.0,
-        "g": 1000.0,
-        "lb": 2.20462,
-        "mg": 1_000_000.0,
-        "t": 0.001,
-        "oz": 35.274,
-        "stone": 0.157473,
-        "toneladas_metricas": 0.001,
-        "toneladas_cortas": 0.00110231
-    }
-    
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_kg:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_kg:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-    
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_kg[unidad_inicial]
-    factor_destino = factores_por_kg[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-    
-    return cantidad * factor_conversion
\ No newline at end of file
+    return convertir_lineal(MASA, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_masa_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de masas con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-9) o nombre de unidad
+        unidad_final: Número de unidad final (1-9) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(MASA, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_masa_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de masas con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-9), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-9) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(MASA, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
@@ -0,0 +1,211 @@
+# Perfilado.py - Captura opcional de perfiles de una sesión (menú o modo por lotes)
+#
+# Dos formatos:
+#     pstats     Perfilador determinista (cProfile). El archivo se abre con
+#                "python -m pstats ARCHIVO" o con snakeviz.
+#     colapsado  Muestreo del tiempo real cada INTERVALO segundos. Cada línea es
+#                "marco;marco;...;marco N", el formato de flamegraph.pl y speedscope.
+#                Incluye el tiempo de espera en input(). Solo en sistemas con SIGALRM.
+#
+# Junto al perfil se escribe un resumen (ARCHIVO.txt) con las funciones más
+# costosas y el tiempo repartido entre entrada, formato/salida y conversión.
+
+import os
+import sys
+import time
+
+FORMATOS = ("pstats", "colapsado")
+
+# Variable de entorno que activa el perfilado sin tocar la línea de comandos.
+# Su valor es el archivo (o directorio) de salida; CONVERSOR_PERFIL_FORMATO elige el formato.
+VARIABLE_ENTORNO = "CONVERSOR_PERFIL"
+VARIABLE_FORMATO = "CONVERSOR_PERFIL_FORMATO"
+
+# Periodo de muestreo del formato colapsado, en segundos
+INTERVALO = 0.001
+
+# Número de funciones del resumen
+FUNCIONES_RESUMEN = 20
+
+_CARPETA_PAQUETE = os.path.dirname(os.path.abspath(__file__))
+
+
+def ruta_de_sesion(ruta, formato):
+    """
+    Devuelve el archivo de salida de la sesión.
+
+    Si ruta es un directorio existente (o termina en /), se crea dentro un archivo
+    con la fecha y el PID, para que cada sesión tenga el suyo.
+    """
+    if ruta.endswith(os.sep) or os.path.isdir(ruta):
+        os.makedirs(ruta, exist_ok=True)
+        extension = "pstats" if formato == "pstats" else "folded"
+        nombre = f"perfil-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.{extension}"
+        return os.path.join(ruta, nombre)
+    return ruta
+
+
+def _categoria(archivo, funcion):
+    """Clasifica una función en entrada, formato/salida, conversión, menú u otros."""
+    if funcion in ("<built-in method builtins.input>", "input"):
+        return "entrada"
+    if funcion in ("<built-in method builtins.print>", "print") or "method 'format'" in funcion:
+        return "formato_salida"
+    if archivo.startswith(_CARPETA_PAQUETE):
+        return "conversion"
+    if os.path.basename(archivo) == "Conversor_de_unidades.py":
+        return "menu"
+    return "otros"
+
+
+def _categoria_muestra(archivo, linea, funcion):
+    """
+    Clasifica una muestra por su marco superior.
+
+    input() y print() son funciones nativas y no aparecen en la pila muestreada,
+    así que se reconocen por la línea que se estaba ejecutando en el marco que las llama.
+    """
+    import linecache
+
+    codigo = linecache.getline(archivo, linea)
+    if "input(" in codigo:
+        return "entrada"
+    if "print(" in codigo:
+        return "formato_salida"
+    return _categoria(archivo, funcion)
+
+
+def _resumen_pstats(estadisticas):
+    """Devuelve las líneas del resumen de un perfil determinista."""
+    filas = []
+    categorias = {}
+    for (archivo, linea, funcion), (_, llamadas, propio, acumulado, _) in estadisticas.stats.items():
+        nombre = funcion if archivo == "~" else f"{os.path.basename(archivo)}:{linea}({funcion})"
+        filas.append((propio, acumulado, llamadas, nombre))
+        categoria = _categoria(archivo, funcion)
+        categorias[categoria] = categorias.get(categoria, 0.0) + propio
+
+    total = estadisticas.total_tt or 1.0
+    lineas = [f"Tiempo total: {estadisticas.total_tt:.3f} s", "", "Tiempo propio por categoría:"]
+    for categoria, segundos in sorted(categorias.items(), key=lambda par: -par[1]):
+        lineas.append(f"  {categoria:<16}{segundos:>10.3f} s {segundos / total:>7.1%}")
+    lineas += ["", f"{'Propio (s)':>11}{'Acumulado (s)':>15}{'Llamadas':>10}  Función"]
+    for propio, acumulado, llamadas, nombre in sorted(filas, reverse=True)[:FUNCIONES_RESUMEN]:
+        lineas.append(f"{propio:>11.4f}{acumulado:>15.4f}{llamadas:>10}  {nombre}")
+    return lineas
+
+
+def _resumen_colapsado(muestras):
+    """Devuelve las líneas del resumen de un perfil por muestreo."""
+    total = sum(muestras.values()) or 1
+    propias = {}
+    categorias = {}
+    for pila, cantidad in muestras.items():
+        archivo, linea, funcion = pila[-1]
+        nombre = f"{os.path.basename(archivo)}({funcion})"
+        propias[nombre] = propias.get(nombre, 0) + cantidad
+        categoria = _categoria_muestra(archivo, linea, funcion)
+        categorias[categoria] = categorias.get(categoria, 0) + cantidad
+
+    lineas = [f"Muestras: {total} (cada {INTERVALO * 1000:g} ms, ~{total * INTERVALO:.3f} s)", "",
+              "Muestras por categoría (marco superior):"]
+    for categoria, cantidad in sorted(categorias.items(), key=lambda par: -par[1]):
+        lineas.append(f"  {categoria:<16}{cantidad:>10} {cantidad / total:>7.1%}")
+    lineas += ["", f"{'Muestras':>10}{'%':>8}  Función (marco superior)"]
+    for nombre, cantidad in sorted(propias.items(), key=lambda par: -par[1])[:FUNCIONES_RESUMEN]:
+        lineas.append(f"{cantidad:>10}{cantidad / total:>8.1%}  {nombre}")
+    return lineas
+
+
+class _Muestreador:
+    """Perfilador por muestreo de la pila del hilo principal con SIGALRM."""
+
+    def __init__(self, intervalo):
+        self.intervalo = intervalo
+        self.muestras = {}
+
+    def _muestrear(self, senal, marco):
+        pila = []
+        while marco is not None:
+            codigo = marco.f_code
+            pila.append((codigo.co_filename, marco.f_lineno, codigo.co_name))
+            marco = marco.f_back
+        pila = tuple(reversed(pila))
+        self.muestras[pila] = self.muestras.get(pila, 0) + 1
+
+    def iniciar(self):
+        import signal
+
+        if not hasattr(signal, "setitimer"):
+            raise ValueError("El perfil colapsado necesita SIGALRM, no disponible en este sistema.")
+        self._anterior = signal.signal(signal.SIGALRM, self._muestrear)
+        signal.setitimer(signal.ITIMER_REAL, self.intervalo, self.intervalo)
+
+    def detener(self):
+        import signal
+
+        signal.setitimer(signal.ITIMER_REAL, 0, 0)
+        signal.signal(signal.SIGALRM, self._anterior)
+
+    def escribir(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            for pila, cantidad in sorted(self.muestras.items()):
+                marcos = ";".join(f"{funcion} ({os.path.basename(nombre)})" for nombre, _, funcion in pila)
+                archivo.write(f"{marcos} {cantidad}\n")
+
+
+def perfilar(funcion, ruta, formato="pstats", *args, **kwargs):
+    """
+    Ejecuta funcion(*args, **kwargs) bajo el perfilador y guarda el perfil y su resumen.
+
+    El perfil se guarda aunque la función termine con una excepción (por ejemplo,
+    al interrumpir el menú con Ctrl+C), que luego se propaga.
+
+    Args:
+        funcion: Función a perfilar (ej: conversion_unidades)
+        ruta: Archivo de salida, o directorio donde crear uno por sesión
+        formato: 'pstats' (determinista) o 'colapsado' (muestreo)
+
+    Returns:
+        El resultado de funcion
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de perfil '{formato}' no válido. Opciones: {', '.join(FORMATOS)}.")
+    ruta = ruta_de_sesion(ruta, formato)
+
+    if formato == "pstats":
+        import cProfile
+        import pstats
+
+        perfilador = cProfile.Profile()
+        try:
+            return perfilador.runcall(funcion, *args, **kwargs)
+        finally:
+            perfilador.dump_stats(ruta)
+            lineas = _resumen_pstats(pstats.Stats(perfilador))
+            _guardar_resumen(ruta, lineas)
+
+    muestreador = _Muestreador(INTERVALO)
+    muestreador.iniciar()
+    try:
+        return funcion(*args, **kwargs)
+    finally:
+        muestreador.detener()
+        muestreador.escribir(ruta)
+        _guardar_resumen(ruta, _resumen_colapsado(muestreador.muestras))
+
+
+def _guardar_resumen(ruta, lineas):
+    with open(ruta + ".txt", "w", encoding="utf-8") as archivo:
+        archivo.write("\n".join(lineas) + "\n")
+    print(f"🔍 Perfil guardado en {ruta} (resumen en {ruta}.txt)", file=sys.stderr)
+    for linea in lineas[:12]:
+        print(f"   {linea}", file=sys.stderr)
+
+
+def configuracion_de_entorno():
+    """Devuelve (ruta, formato) según las variables de entorno, o (None, None) si no está activado."""
+    ruta = os.environ.get(VARIABLE_ENTORNO)
+    if not ruta:
+        return None, None
+    return ruta, os.environ.get(VARIABLE_FORMATO, "pstats")
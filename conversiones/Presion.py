@@ -1,53 +1,74 @@
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "pascales",
+    "2": "kilopascales",
+    "3": "bar",
+    "4": "atmosferas",
+    "5": "mmhg",
+    "6": "psi",
+    "7": "torr",
+    "8": "kgf_cm2",
+    "9": "inhg",
+    "10": "inh2o",
+    "11": "mmh2o"
+}
+
+# 2. Factores hacia pascales (unidad base)
+FACTORES_POR_PASCAL = {
+    "pascales": 1.0,
+    "kilopascales": 0.001,
+    "bar": 0.00001,
+    "atmosferas": 9.8692e-6,
+    "mmhg": 0.00750062,
+    "psi": 0.000145038,
+    "torr": 0.00750062,
+    "kgf_cm2": 1.01972e-5,
+    "inhg": 0.000295300,
+    "inh2o": 0.00401463,
+    "mmh2o": 0.101972
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+PRESION = registrar_magnitud("presion", UNIDADES, FACTORES_POR_PASCAL)
+
+
 def convertir_presion(unidad_inicial, unidad_final, cantidad):
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "pascales",
-        "2": "kilopascales",
-        "3": "bar",
-        "4": "atmosferas",
-        "5": "mmhg",
-        "6": "psi",
-        "7": "torr",
-        "8": "kgf_cm2",
-        "9": "inhg",
-        "10": "inh2o",
-        "11": "mmh2o"
-    }
-    
-    # 2. Factores hacia pascales (unidad base)
-    factores_por_pascal = {
-        "pascales": 1.0,
-        "kilopascales": 0.001,
-        "bar": 0.00001,
-        "atmosferas": 9.8692e-6,
-        "mmhg": 0.00750062,
-        "psi": 0.000145038,
-        "torr": 0.00750062,
-        "kgf_cm2": 1.01972e-5,
-        "inhg": 0.000295300,
-        "inh2o": 0.00401463,
-        "mmh2o": 0.101972
-    }
-    
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_pascal:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_pascal:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-    
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_pascal[unidad_inicial]
-    factor_destino = factores_por_pascal[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-    
-    return cantidad * factor_conversion
\ No newline at end of file
+    return convertir_lineal(PRESION, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_presion_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de presiones con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-11) o nombre de unidad
+        unidad_final: Número de unidad final (1-11) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(PRESION, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_presion_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de presiones con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-11), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-11) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(PRESION, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
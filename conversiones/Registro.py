@@ -0,0 +1,368 @@
+# Registro.py - Registro compartido de magnitudes y factores de conversión
+
+import sys
+from importlib import import_module
+
+# Magnitudes registradas, indexadas por nombre
+MAGNITUDES = {}
+
+# Módulo que define cada magnitud; se importa la primera vez que se necesita
+MODULOS = {
+    "volumen": "conversiones.Volumen",
+    "temperatura": "conversiones.Temperatura",
+    "concentracion": "conversiones.Concentracion",
+    "densidad": "conversiones.Densidad",
+    "velocidad": "conversiones.Velocidad",
+    "masa": "conversiones.Masa",
+    "energia": "conversiones.Energia",
+    "presion": "conversiones.Presion",
+    "longitud": "conversiones.Longitud",
+    "area": "conversiones.Area"
+}
+
+
+class Magnitud:
+    """
+    Tablas precalculadas de una magnitud.
+
+    Attributes:
+        nombre: Nombre de la magnitud (ej: "longitud")
+        unidades: Tupla con los nombres internos de las unidades, en el orden del menú
+        codigos: Diccionario de alias (número de menú o nombre) a código entero (0-based)
+        factores: Tupla de factores hacia la unidad base, indexada por código (o None)
+        matriz: Matriz N×N de factores por par, matriz[origen][destino] (o None)
+    """
+
+    __slots__ = ("nombre", "unidades", "codigos", "factores", "matriz")
+
+    def __init__(self, nombre, unidades, factores=None):
+        self.nombre = sys.intern(nombre)
+        self.unidades = tuple(sys.intern(nombre_unidad) for nombre_unidad in unidades.values())
+
+        codigos = {}
+        for codigo, numero in enumerate(unidades):
+            codigos[sys.intern(numero)] = codigo
+            codigos[self.unidades[codigo]] = codigo
+        self.codigos = codigos
+
+        if factores is None:
+            self.factores = None
+            self.matriz = None
+        else:
+            self.factores = tuple(factores[nombre_unidad] for nombre_unidad in self.unidades)
+            # El factor de cada par se divide una sola vez, al importar
+            self.matriz = tuple(
+                tuple(factor_destino / factor_origen for factor_destino in self.factores)
+                for factor_origen in self.factores
+            )
+
+    def __repr__(self):
+        return f"Magnitud({self.nombre!r}, {len(self.unidades)} unidades)"
+
+
+def registrar_magnitud(nombre, unidades, factores=None):
+    """
+    Construye las tablas de una magnitud y la añade al registro.
+
+    Args:
+        nombre: Nombre de la magnitud
+        unidades: Diccionario de número de menú a nombre de unidad
+        factores: Diccionario de nombre de unidad a factor hacia la unidad base (opcional)
+
+    Returns:
+        Magnitud: Tablas precalculadas de la magnitud
+    """
+    magnitud = Magnitud(nombre, unidades, factores)
+    MAGNITUDES[magnitud.nombre] = magnitud
+    return magnitud
+
+
+def obtener_magnitud(nombre):
+    """
+    Devuelve las tablas de una magnitud, importando su módulo si aún no se ha cargado.
+
+    Args:
+        nombre: Nombre de la magnitud (ej: "presion")
+
+    Returns:
+        Magnitud: Tablas precalculadas de la magnitud
+    """
+    magnitud = MAGNITUDES.get(nombre)
+    if magnitud is None:
+        modulo = MODULOS.get(nombre)
+        if modulo is None:
+            raise ValueError(f"Magnitud '{nombre}' no válida.")
+        import_module(modulo)
+        magnitud = MAGNITUDES[nombre]
+    return magnitud
+
+
+def cargar_magnitudes():
+    """Importa todos los módulos de conversión y devuelve el registro completo."""
+    for nombre in MODULOS:
+        obtener_magnitud(nombre)
+    return MAGNITUDES
+
+
+def resolver_unidades(magnitud, unidad_inicial, unidad_final):
+    """
+    Traduce un par de unidades (número o nombre) a sus códigos enteros.
+
+    Returns:
+        tuple: (codigo_inicial, codigo_final)
+    """
+    codigos = magnitud.codigos
+    origen = codigos.get(unidad_inicial)
+    if origen is None:
+        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
+    destino = codigos.get(unidad_final)
+    if destino is None:
+        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
+    return origen, destino
+
+
+def convertir_lineal(magnitud, unidad_inicial, unidad_final, cantidad):
+    """
+    Convierte una cantidad entre dos unidades de una magnitud lineal.
+
+    Args:
+        magnitud: Magnitud registrada con factores
+        unidad_inicial: Número o nombre de la unidad inicial
+        unidad_final: Número o nombre de la unidad final
+        cantidad: Valor a convertir
+
+    Returns:
+        float: Cantidad convertida (la misma cantidad si las unidades son iguales)
+    """
+    codigos = magnitud.codigos
+    origen = codigos.get(unidad_inicial)
+    if origen is None:
+        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
+    destino = codigos.get(unidad_final)
+    if destino is None:
+        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
+
+    if origen == destino:
+        return cantidad
+
+    return cantidad * magnitud.matriz[origen][destino]
+
+
+# Entrada y salida de las funciones por lotes
+#
+# Todas las funciones *_lote y *_mixto aceptan cualquier objeto con protocolo de
+# búfer (ndarray, array.array('d'), memoryview, bytearray, memoria compartida...)
+# y lo leen sin copiarlo cuando sus elementos ya son del tipo de cálculo (float64 por
+# defecto). Con out= escriben el resultado en un búfer escribible de ese tipo ya
+# reservado, y con en_sitio=True sobrescriben la propia entrada.
+#
+# Rutas que no reservan memoria proporcional al lote (entrada del tipo de cálculo y out= o en_sitio):
+#     convertir_<magnitud>_lote de las magnitudes lineales    una multiplicación
+#     convertir_temperatura_lote                              pasos a y desde Celsius en el destino
+#     convertir_<magnitud>_mixto con números enteros y un out= distinto de la entrada
+#                                                             recogida de factores y producto en out
+# El resto (unidades por nombre, en_sitio en *_mixto, temperatura mixta y
+# concentración) usa arreglos temporales, aunque el resultado final se escribe en out.
+#
+# Con dtype="float32" la entrada, las tablas de factores y el resultado son float32
+# de principio a fin (la mitad de memoria y de ancho de banda). El error relativo
+# de cada par se puede consultar con Convertidores.informe_precision.
+
+# Tipos admitidos en las funciones por lotes
+TIPOS = ("float64", "float32")
+
+# Matrices de factores por tipo: (magnitud, tipo) -> ndarray N×N
+_MATRICES = {}
+
+
+def tipo_lote(dtype):
+    """Valida el tipo de una conversión por lotes y devuelve su numpy.dtype."""
+    import numpy as np
+
+    try:
+        tipo = np.dtype(dtype)
+    except TypeError:
+        tipo = None
+    if tipo is None or tipo.name not in TIPOS:
+        raise ValueError(f"Tipo '{dtype}' no admitido. Opciones: {', '.join(TIPOS)}.")
+    return tipo
+
+
+def matriz_factores(magnitud, dtype="float64"):
+    """
+    Devuelve la matriz de factores de una magnitud lineal como ndarray del tipo pedido.
+
+    Se construye una vez por magnitud y tipo; matriz[origen, destino] es el factor del par.
+    """
+    import numpy as np
+
+    tipo = tipo_lote(dtype)
+    matriz = _MATRICES.get((magnitud.nombre, tipo.name))
+    if matriz is None:
+        matriz = _MATRICES[magnitud.nombre, tipo.name] = np.array(magnitud.matriz, dtype=tipo)
+    return matriz
+
+
+def preparar_lote(cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Prepara la entrada y el destino de una conversión por lotes sin copiar búferes.
+
+    Args:
+        cantidades: ndarray, objeto con protocolo de búfer o secuencia de valores
+        out: Búfer escribible del tipo pedido donde guardar el resultado (opcional)
+        en_sitio: Si es True, el resultado sobrescribe cantidades
+        dtype: Tipo de cálculo y de resultado, "float64" o "float32"
+
+    Returns:
+        tuple: (entrada, destino) - ndarrays del tipo pedido; destino es None si no se pidió
+    """
+    import numpy as np
+
+    tipo = tipo_lote(dtype)
+    if en_sitio:
+        if out is not None:
+            raise ValueError("Indique out o en_sitio, no ambos.")
+        if not isinstance(cantidades, np.ndarray):
+            try:
+                memoryview(cantidades)
+            except TypeError:
+                raise ValueError("La conversión en sitio requiere un búfer (ndarray, array.array, memoryview...).") from None
+        out = cantidades
+
+    entrada = np.asarray(cantidades, dtype=tipo)
+    if out is None:
+        return entrada, None
+
+    try:
+        destino = out if isinstance(out, np.ndarray) else np.asarray(memoryview(out))
+    except TypeError:
+        raise ValueError("out debe ser un ndarray o un objeto con protocolo de búfer.") from None
+    if destino.dtype != tipo:
+        raise ValueError(f"El destino debe ser {tipo.name}, no {destino.dtype}.")
+    if not destino.flags.writeable:
+        raise ValueError("El destino es de solo lectura.")
+    if destino.shape != entrada.shape:
+        raise ValueError(f"El destino tiene forma {destino.shape} y la entrada {entrada.shape}.")
+    return entrada, destino
+
+
+def convertir_lineal_lote(magnitud, unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False,
+                          dtype="float64"):
+    """
+    Convierte un arreglo de cantidades entre dos unidades de una magnitud lineal.
+
+    Requiere NumPy; las funciones escalares no dependen de él.
+
+    Args:
+        magnitud: Magnitud registrada con factores
+        unidad_inicial: Número o nombre de la unidad inicial
+        unidad_final: Número o nombre de la unidad final
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"; el factor se aplica en ese mismo tipo
+
+    Returns:
+        numpy.ndarray: Cantidades convertidas (del tipo dtype); si se indicó out o en_sitio,
+        un ndarray sobre ese mismo búfer
+    """
+    import numpy as np
+
+    origen, destino = resolver_unidades(magnitud, unidad_inicial, unidad_final)
+    entrada, salida = preparar_lote(cantidades, out, en_sitio, dtype)
+    return np.multiply(entrada, matriz_factores(magnitud, dtype)[origen, destino], out=salida)
+
+
+def resolver_numeros(magnitud, unidades):
+    """
+    Traduce un arreglo de unidades, una por fila, a números de unidad (1-based).
+
+    Acepta los números del menú, como enteros o como texto, y nombres de unidad.
+    Los enteros se interpretan igual que "1", "2"... en el menú, la CLI o el
+    protocolo binario, nunca como códigos 0-based. Los enteros intp se usan sin
+    copiarlos; los textos se buscan en bloque en la lista ordenada de alias, sin
+    un bucle de Python por fila.
+
+    Args:
+        magnitud: Magnitud registrada
+        unidades: ndarray o secuencia de números de menú (enteros o texto) o nombres
+
+    Returns:
+        numpy.ndarray: Números intp de 1 a len(magnitud.unidades), con la misma forma que unidades.
+        Para indexar con ellos una tabla por código, ver por_numero()
+    """
+    import numpy as np
+
+    unidades = np.asarray(unidades)
+    if unidades.dtype.kind in "iu":
+        numeros = unidades.astype(np.intp, copy=False)
+        if numeros.size and (numeros.min() < 1 or numeros.max() > len(magnitud.unidades)):
+            invalidos = (numeros < 1) | (numeros > len(magnitud.unidades))
+            fila = int(np.flatnonzero(invalidos)[0])
+            raise ValueError(f"{int(invalidos.sum())} números de unidad fuera de rango 1-{len(magnitud.unidades)} "
+                             f"(primera fila: {fila}, número {numeros.flat[fila]}).")
+        return numeros
+
+    # Búsqueda binaria vectorizada en la lista ordenada de alias (números y nombres)
+    if unidades.dtype.kind != "U":
+        unidades = unidades.astype(str)
+    alias = sorted(magnitud.codigos)
+    claves = np.array(alias)
+    numeros_alias = np.array([magnitud.codigos[clave] + 1 for clave in alias], dtype=np.intp)
+    posiciones = np.minimum(np.searchsorted(claves, unidades), len(claves) - 1)
+    invalidos = claves[posiciones] != unidades
+    if invalidos.any():
+        unidad = unidades.flat[int(np.flatnonzero(invalidos)[0])]
+        raise ValueError(f"Unidad inicial '{unidad}' no válida.")
+    return numeros_alias[posiciones]
+
+
+def por_numero(tabla):
+    """
+    Antepone una posición de relleno al último eje de una tabla indexada por código (0-based).
+
+    Así la tabla se indexa directamente con los números de resolver_numeros(), sin
+    restar 1 a cada fila (lo que obligaría a copiar los números).
+    """
+    import numpy as np
+
+    return np.concatenate((tabla[..., :1], tabla), axis=-1)
+
+
+def convertir_lineal_mixto(magnitud, unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False,
+                           dtype="float64"):
+    """
+    Convierte cantidades con una unidad inicial distinta por fila a una unidad final común.
+
+    Los factores se recogen con un índice sobre la columna de la matriz de la unidad
+    final y se aplica una sola multiplicación vectorizada. Requiere NumPy.
+
+    Args:
+        magnitud: Magnitud registrada con factores
+        unidades_iniciales: Unidad de cada fila: números de menú (enteros o texto) o nombres
+        unidad_final: Número o nombre de la unidad final
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Cantidades convertidas (del tipo dtype), sobre out si se indicó
+    """
+    import numpy as np
+
+    destino = magnitud.codigos.get(unidad_final)
+    if destino is None:
+        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
+    numeros = resolver_numeros(magnitud, unidades_iniciales)
+    entrada, salida = preparar_lote(cantidades, out, en_sitio, dtype)
+    if numeros.shape != entrada.shape:
+        raise ValueError("Las unidades y las cantidades deben tener la misma forma.")
+
+    columna = por_numero(matriz_factores(magnitud, dtype)[:, destino])
+    if salida is not None and not np.may_share_memory(salida, entrada):
+        # Los factores se recogen directamente en el destino: ningún arreglo temporal.
+        # Los números ya están validados; mode="clip" evita que take use un búfer intermedio
+        np.take(columna, numeros, out=salida, mode="clip")
+        return np.multiply(salida, entrada, out=salida)
+    return np.multiply(entrada, columna[numeros], out=salida)
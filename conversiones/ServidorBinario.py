@@ -0,0 +1,200 @@
+# ServidorBinario.py - Servidor de baja latencia con protocolo binario sobre un socket Unix
+#
+# Todas las cifras son little-endian. Cada trama empieza con su longitud (uint32),
+# que no se cuenta a sí misma.
+#
+# Petición:
+#     uint32 longitud
+#     uint32 identificador   (se devuelve en la respuesta; permite encadenar peticiones)
+#     uint8  magnitud        (numeración del menú principal: 1 Volumen ... 10 Área)
+#     uint8  unidad_inicial  (numeración del menú de la magnitud, 1-based)
+#     uint8  unidad_final
+#     uint8  opciones        (bit 0: los dos primeros float64 son masa_molar y densidad; NaN = sin dato)
+#     float64[n] valores
+#
+# Respuesta:
+#     uint32 longitud
+#     uint32 identificador
+#     uint8  estado          (0 = correcto, 1 = error)
+#     3 bytes de relleno
+#     float64[n] resultados  o  mensaje de error en UTF-8
+#
+# Los valores que no se pueden convertir (ej: g/L demasiado altos para pasar a
+# molalidad) se devuelven como NaN sin interrumpir el resto de la trama.
+#
+# Las peticiones se pueden enviar encadenadas sin esperar respuesta; se responden en orden.
+
+import asyncio
+import math
+import struct
+from functools import lru_cache
+
+from conversiones.Convertidores import obtener_convertidor
+
+# Numeración de magnitudes, igual que en el menú principal
+CODIGOS_MAGNITUD = {
+    1: "volumen",
+    2: "temperatura",
+    3: "concentracion",
+    4: "densidad",
+    5: "velocidad",
+    6: "masa",
+    7: "energia",
+    8: "presion",
+    9: "longitud",
+    10: "area"
+}
+
+OPCION_PARAMETROS = 0x01
+ESTADO_CORRECTO = 0
+ESTADO_ERROR = 1
+
+LONGITUD = struct.Struct("<I")
+CABECERA_PETICION = struct.Struct("<IBBBB")
+CABECERA_RESPUESTA = struct.Struct("<IB3x")
+PARAMETROS = struct.Struct("<dd")
+
+# Tamaño máximo de una trama (64 MiB)
+MAXIMO_TRAMA = 64 * 1024 * 1024
+
+
+@lru_cache(maxsize=4096)
+def _convertidor(magnitud, unidad_inicial, unidad_final, masa_molar, densidad):
+    nombre = CODIGOS_MAGNITUD.get(magnitud)
+    if nombre is None:
+        raise ValueError(f"Magnitud {magnitud} no válida.")
+    return obtener_convertidor(nombre, str(unidad_inicial), str(unidad_final),
+                               masa_molar=masa_molar, densidad=densidad)
+
+
+def empaquetar_peticion(identificador, magnitud, unidad_inicial, unidad_final, valores,
+                        masa_molar=None, densidad=None):
+    """
+    Construye una trama de petición.
+
+    Args:
+        identificador: Entero de 32 bits que se devolverá en la respuesta
+        magnitud: Código de magnitud (ver CODIGOS_MAGNITUD)
+        unidad_inicial: Número de la unidad inicial (1-based)
+        unidad_final: Número de la unidad final (1-based)
+        valores: bytes con float64 little-endian, o secuencia de números
+        masa_molar: Masa molar del soluto en g/mol (solo concentración)
+        densidad: Densidad de la solución en g/mL (solo concentración)
+
+    Returns:
+        bytes: Trama lista para enviar
+    """
+    if not isinstance(valores, (bytes, bytearray, memoryview)):
+        valores = struct.pack(f"<{len(valores)}d", *valores)
+    opciones = 0
+    parametros = b""
+    if masa_molar is not None or densidad is not None:
+        opciones |= OPCION_PARAMETROS
+        parametros = PARAMETROS.pack(
+            math.nan if masa_molar is None else masa_molar,
+            math.nan if densidad is None else densidad
+        )
+    cuerpo = CABECERA_PETICION.pack(identificador, magnitud, unidad_inicial, unidad_final, opciones)
+    return LONGITUD.pack(len(cuerpo) + len(parametros) + len(valores)) + cuerpo + parametros + bytes(valores)
+
+
+def desempaquetar_respuesta(cuerpo):
+    """
+    Interpreta el cuerpo de una respuesta (sin el prefijo de longitud).
+
+    Returns:
+        tuple: (identificador, resultados) donde resultados es un memoryview de float64
+
+    Raises:
+        ValueError: Si el servidor respondió con un error
+    """
+    identificador, estado = CABECERA_RESPUESTA.unpack_from(cuerpo)
+    contenido = memoryview(cuerpo)[CABECERA_RESPUESTA.size:]
+    if estado != ESTADO_CORRECTO:
+        raise ValueError(bytes(contenido).decode("utf-8"))
+    return identificador, contenido.cast("d")
+
+
+def procesar_trama(cuerpo):
+    """Convierte el contenido de una trama de petición y devuelve la trama de respuesta."""
+    import numpy as np
+
+    identificador = 0
+    try:
+        if len(cuerpo) < CABECERA_PETICION.size:
+            raise ValueError("Trama demasiado corta.")
+        identificador, magnitud, unidad_inicial, unidad_final, opciones = CABECERA_PETICION.unpack_from(cuerpo)
+        inicio = CABECERA_PETICION.size
+
+        masa_molar = densidad = None
+        if opciones & OPCION_PARAMETROS:
+            masa_molar, densidad = PARAMETROS.unpack_from(cuerpo, inicio)
+            masa_molar = None if math.isnan(masa_molar) else masa_molar
+            densidad = None if math.isnan(densidad) else densidad
+            inicio += PARAMETROS.size
+
+        if (len(cuerpo) - inicio) % 8:
+            raise ValueError("La carga útil no es un múltiplo de 8 bytes.")
+
+        convertidor = _convertidor(magnitud, unidad_inicial, unidad_final, masa_molar, densidad)
+        valores = np.frombuffer(cuerpo, dtype="<f8", offset=inicio)
+        contenido = np.asarray(convertidor(valores), dtype="<f8").tobytes()
+        estado = ESTADO_CORRECTO
+    except (ValueError, TypeError, struct.error) as e:
+        contenido = str(e).encode("utf-8")
+        estado = ESTADO_ERROR
+
+    cabecera = CABECERA_RESPUESTA.pack(identificador, estado)
+    return LONGITUD.pack(len(cabecera) + len(contenido)) + cabecera + contenido
+
+
+async def atender_conexion(lector, escritor):
+    """Lee tramas encadenadas y responde en orden, sin esperar entre peticiones."""
+    try:
+        while True:
+            try:
+                prefijo = await lector.readexactly(LONGITUD.size)
+            except asyncio.IncompleteReadError:
+                break
+            (longitud,) = LONGITUD.unpack(prefijo)
+            if longitud > MAXIMO_TRAMA:
+                break
+            cuerpo = await lector.readexactly(longitud)
+            escritor.write(procesar_trama(cuerpo))
+            # drain() solo se detiene si el cliente deja de leer y el búfer se llena,
+            # así que las peticiones encadenadas se siguen procesando sin esperas
+            await escritor.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        escritor.close()
+
+
+async def servir(ruta="/tmp/conversor.sock"):
+    """
+    Inicia el servidor en un socket Unix y atiende conexiones indefinidamente.
+
+    Un socket anterior en la ruta (de un servidor que no se cerró bien) se reemplaza;
+    cualquier otro archivo se respeta y se lanza ValueError. Al terminar solo se borra
+    el socket creado por este proceso.
+    """
+    import os
+    import stat
+
+    if os.path.lexists(ruta):
+        if not stat.S_ISSOCK(os.lstat(ruta).st_mode):
+            raise ValueError(f"'{ruta}' ya existe y no es un socket.")
+        os.unlink(ruta)
+    servidor = await asyncio.start_unix_server(atender_conexion, ruta)
+    creado = os.lstat(ruta)
+    print(f"🔧 Servidor binario escuchando en {ruta}")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        try:
+            actual = os.lstat(ruta)
+        except FileNotFoundError:
+            actual = None
+        if actual is not None and (actual.st_dev, actual.st_ino) == (creado.st_dev, creado.st_ino):
+            os.unlink(ruta)
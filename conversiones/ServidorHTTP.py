@@ -0,0 +1,182 @@
+# ServidorHTTP.py - Servicio HTTP local (asyncio) con endpoints de conversión individual y por lotes
+#
+# Endpoints:
+#     GET  /magnitudes   -> {"magnitudes": {"presion": ["pascales", ...], ...}}
+#     POST /convertir    <- {"magnitud", "desde", "hasta", "valor", ["masa_molar"], ["densidad"]}
+#                        -> {"resultado": float}
+#     POST /lote         <- {"magnitud", "desde", "hasta", "valores": [...], ["masa_molar"], ["densidad"]}
+#                        -> {"resultados": [float, ...]}
+#
+# Los resultados no finitos (desbordamientos, valores no convertibles en un lote)
+# se devuelven como null: JSON no admite Infinity ni NaN.
+
+import asyncio
+import json
+import math
+from functools import lru_cache
+
+from conversiones.Convertidores import obtener_convertidor
+from conversiones.Registro import cargar_magnitudes
+
+# Tamaño máximo aceptado para encabezados y cuerpo de una petición
+MAXIMO_ENCABEZADOS = 16 * 1024
+MAXIMO_CUERPO = 64 * 1024 * 1024
+
+ESTADOS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+# Los convertidores compilados se reutilizan entre peticiones y clientes
+convertidor_en_cache = lru_cache(maxsize=1024)(obtener_convertidor)
+
+
+def _convertidor_de(datos):
+    try:
+        return convertidor_en_cache(
+            datos["magnitud"], datos["desde"], datos["hasta"],
+            masa_molar=datos.get("masa_molar"), densidad=datos.get("densidad")
+        )
+    except KeyError as e:
+        raise ValueError(f"Falta el campo {e}.") from None
+
+
+def atender_convertir(datos):
+    """Convierte un único valor."""
+    convertidor = _convertidor_de(datos)
+    if "valor" not in datos:
+        raise ValueError("Falta el campo 'valor'.")
+    resultado = convertidor(float(datos["valor"]))
+    return {"resultado": resultado if math.isfinite(resultado) else None}
+
+
+def atender_lote(datos):
+    """Convierte una lista de valores con un único convertidor compilado."""
+    convertidor = _convertidor_de(datos)
+    valores = datos.get("valores")
+    if not isinstance(valores, list):
+        raise ValueError("El campo 'valores' debe ser una lista.")
+    try:
+        import numpy as np
+    except ImportError:
+        resultados = (convertidor(float(valor)) for valor in valores)
+        return {"resultados": [valor if math.isfinite(valor) else None for valor in resultados]}
+
+    # Con NumPy, una sola llamada al convertidor para toda la lista
+    try:
+        arreglo = np.asarray(valores, dtype=np.float64)
+    except (ValueError, TypeError):
+        arreglo = None
+    if arreglo is None or arreglo.ndim != 1 or None in valores:
+        raise ValueError("El campo 'valores' debe ser una lista de números.")
+    arreglo = np.asarray(convertidor(arreglo), dtype=np.float64)
+    resultados = arreglo.tolist()
+    for indice in np.flatnonzero(~np.isfinite(arreglo)).tolist():
+        resultados[indice] = None
+    return {"resultados": resultados}
+
+
+def atender_magnitudes(datos):
+    """Lista las magnitudes disponibles y sus unidades."""
+    return {"magnitudes": {nombre: list(magnitud.unidades) for nombre, magnitud in cargar_magnitudes().items()}}
+
+
+RUTAS = {
+    ("POST", "/convertir"): atender_convertir,
+    ("POST", "/lote"): atender_lote,
+    ("GET", "/magnitudes"): atender_magnitudes,
+}
+
+
+def _respuesta(estado, cuerpo, mantener_conexion):
+    contenido = json.dumps(cuerpo, ensure_ascii=False, allow_nan=False).encode("utf-8")
+    encabezados = (
+        f"HTTP/1.1 {estado} {ESTADOS[estado]}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(contenido)}\r\n"
+        f"Connection: {'keep-alive' if mantener_conexion else 'close'}\r\n"
+        f"\r\n"
+    )
+    return encabezados.encode("latin-1") + contenido
+
+
+def procesar_peticion(metodo, ruta, cuerpo):
+    """Despacha una petición ya leída y devuelve (estado, cuerpo JSON)."""
+    ruta = ruta.split("?", 1)[0]
+    manejador = RUTAS.get((metodo, ruta))
+    if manejador is None:
+        if any(ruta == ruta_registrada for _, ruta_registrada in RUTAS):
+            return 405, {"error": f"Método {metodo} no permitido en {ruta}."}
+        return 404, {"error": f"Ruta {ruta} no encontrada."}
+
+    try:
+        datos = json.loads(cuerpo) if cuerpo else {}
+        if not isinstance(datos, dict):
+            raise ValueError("El cuerpo debe ser un objeto JSON.")
+        return 200, manejador(datos)
+    except (ValueError, TypeError, ArithmeticError) as e:
+        # ArithmeticError: enteros JSON que no caben en un float, divisiones por cero...
+        return 400, {"error": str(e)}
+
+
+async def atender_conexion(lector, escritor):
+    """Atiende una conexión HTTP/1.1, con keep-alive, hasta que el cliente la cierre."""
+    try:
+        while True:
+            try:
+                cabecera = await lector.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            except asyncio.LimitOverrunError:
+                escritor.write(_respuesta(413, {"error": "Encabezados demasiado grandes."}, False))
+                break
+
+            lineas = cabecera.decode("latin-1").split("\r\n")
+            try:
+                metodo, ruta, version = lineas[0].split(" ", 2)
+            except ValueError:
+                escritor.write(_respuesta(400, {"error": "Línea de petición no válida."}, False))
+                break
+
+            encabezados = {}
+            for linea in lineas[1:]:
+                if ":" in linea:
+                    nombre, valor = linea.split(":", 1)
+                    encabezados[nombre.strip().lower()] = valor.strip()
+
+            conexion = encabezados.get("connection", "").lower()
+            if version == "HTTP/1.0":
+                mantener_conexion = conexion == "keep-alive"
+            else:
+                mantener_conexion = conexion != "close"
+
+            try:
+                longitud = int(encabezados.get("content-length", "0"))
+            except ValueError:
+                longitud = -1
+            if longitud < 0 or longitud > MAXIMO_CUERPO:
+                escritor.write(_respuesta(413, {"error": "Cuerpo no válido o demasiado grande."}, False))
+                break
+            cuerpo = await lector.readexactly(longitud) if longitud else b""
+
+            estado, respuesta = procesar_peticion(metodo, ruta, cuerpo)
+            escritor.write(_respuesta(estado, respuesta, mantener_conexion))
+            await escritor.drain()
+            if not mantener_conexion:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        escritor.close()
+
+
+async def servir(host="127.0.0.1", puerto=8765):
+    """Inicia el servicio y atiende conexiones indefinidamente."""
+    servidor = await asyncio.start_server(atender_conexion, host, puerto, limit=MAXIMO_ENCABEZADOS)
+    direcciones = ", ".join(str(socket.getsockname()) for socket in servidor.sockets)
+    print(f"🔧 Servicio de conversión escuchando en {direcciones}")
+    async with servidor:
+        await servidor.serve_forever()
@@ -1,85 +1,242 @@
+import math
+
+from conversiones.Registro import (preparar_lote, por_numero, registrar_magnitud, resolver_numeros, resolver_unidades,
+                                   tipo_lote)
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "celsius",
+    "2": "fahrenheit",
+    "3": "kelvin",
+    "4": "rankine",
+    "5": "reaumur",
+    "6": "delisle",
+    "7": "newton",
+    "8": "romer"
+}
+
+# 2. Conversión a Celsius como unidad base: celsius = (temp - x0) * n / d - z0
+#    Son las mismas operaciones y en el mismo orden que las fórmulas de siempre
+#    ((temp - 32) * 5/9, 100 - temp * 2/3...), así que los resultados coinciden
+#    bit a bit y los puntos de referencia (491.67 °R = 0 °C...) salen exactos.
+A_CELSIUS = {
+    "celsius": (0.0, 1, 1, 0.0),
+    "fahrenheit": (32.0, 5, 9, 0.0),
+    "kelvin": (273.15, 1, 1, 0.0),
+    "rankine": (491.67, 5, 9, 0.0),
+    "reaumur": (0.0, 5, 4, 0.0),
+    "delisle": (0.0, -2, 3, -100.0),    # 100 - temp * 2/3
+    "newton": (0.0, 100, 33, 0.0),
+    "romer": (7.5, 40, 21, 0.0)
+}
+
+# 3. Conversión desde Celsius a la unidad final, con la misma forma
+DESDE_CELSIUS = {
+    "celsius": (0.0, 1, 1, 0.0),
+    "fahrenheit": (0.0, 9, 5, -32.0),
+    "kelvin": (0.0, 1, 1, -273.15),
+    "rankine": (0.0, 9, 5, -491.67),
+    "reaumur": (0.0, 4, 5, 0.0),
+    "delisle": (100.0, -3, 2, -0.0),    # (100 - celsius) * 3/2; con -0.0, 100 °C da +0.0
+    "newton": (0.0, 33, 100, 0.0),
+    "romer": (0.0, 21, 40, -7.5)
+}
+
+TEMPERATURA = registrar_magnitud("temperatura", UNIDADES)
+
+
+def _cero_positivo(constante):
+    """Indica si la constante es +0.0: restarla deja cualquier valor intacto (restar -0.0 no)."""
+    return constante == 0 and math.copysign(1.0, constante) > 0
+
+
+def _expresion(pasos, variable, aditiva=False):
+    """
+    Escribe los pasos (x0, n, d, z0) como expresión de Python, sin las operaciones neutras.
+
+    Returns:
+        tuple: (expresión, True si su última operación es una suma o una resta)
+    """
+    x0, n, d, z0 = pasos
+    if not _cero_positivo(x0):
+        variable, aditiva = f"{variable} - {x0!r}", True
+    if (n != 1 or d != 1) and aditiva:
+        variable, aditiva = f"({variable})", False
+    if n != 1:
+        variable = f"{variable} * {n!r}"
+    if d != 1:
+        variable = f"{variable} / {d!r}"
+    if math.copysign(1.0, z0) < 0:
+        variable, aditiva = f"{variable} + {-z0!r}", True
+    elif z0:
+        variable, aditiva = f"{variable} - {z0!r}", True
+    return variable, aditiva
+
+
+def expresion_par(origen, destino, variable="cantidad"):
+    """
+    Devuelve la expresión de Python que convierte de la escala origen a la destino.
+
+    Args:
+        origen: Código 0-based de la escala inicial
+        destino: Código 0-based de la escala final
+        variable: Nombre de la variable de entrada
+
+    Returns:
+        str: Expresión (ej: "(cantidad - 32.0) * 5 / 9 * 9 / 5 + 491.67")
+    """
+    if origen == destino:
+        return variable
+    celsius = _expresion(A_CELSIUS[TEMPERATURA.unidades[origen]], variable)
+    return _expresion(DESDE_CELSIUS[TEMPERATURA.unidades[destino]], *celsius)[0]
+
+
+def _identidad(cantidad):
+    return cantidad
+
+
+def _componer(origen, destino):
+    """Devuelve la función de conversión de un par; las operaciones neutras no alteran el resultado."""
+    x0, n, d, z0 = A_CELSIUS[TEMPERATURA.unidades[origen]]
+    x1, m, e, z1 = DESDE_CELSIUS[TEMPERATURA.unidades[destino]]
+
+    if origen == destino:
+        return _identidad
+
+    def convertir(cantidad):
+        return ((cantidad - x0) * n / d - z0 - x1) * m / e - z1
+    return convertir
+
+
+# 4. Funciones precalculadas de los 64 pares: FUNCIONES[origen][destino](cantidad)
+FUNCIONES = tuple(
+    tuple(_componer(origen, destino) for destino in range(len(TEMPERATURA.unidades)))
+    for origen in range(len(TEMPERATURA.unidades))
+)
+
+# Pasos a Celsius como ndarray 8×4 por tipo, para convertir_temperatura_mixto
+_PASOS_POR_TIPO = {}
+
+
+def pasos_arreglo(dtype="float64"):
+    """Devuelve A_CELSIUS como ndarray [(x0, n, d, z0), escala] del tipo pedido."""
+    import numpy as np
+
+    tipo = tipo_lote(dtype)
+    arreglo = _PASOS_POR_TIPO.get(tipo.name)
+    if arreglo is None:
+        arreglo = _PASOS_POR_TIPO[tipo.name] = np.array(
+            [A_CELSIUS[unidad] for unidad in TEMPERATURA.unidades], dtype=tipo
+        ).T.copy()
+    return arreglo
+
+
+def _aplicar_pasos(resultado, pasos):
+    """Aplica los pasos (x0, n, d, z0) sobre resultado, en el sitio."""
+    x0, n, d, z0 = pasos
+    if not _cero_positivo(x0):
+        resultado -= x0
+    if n != 1:
+        resultado *= n
+    if d != 1:
+        resultado /= d
+    if not _cero_positivo(z0):
+        resultado -= z0
+    return resultado
+
+
 def convertir_temperatura(unidad_inicial, unidad_final, cantidad):
     """
     Convierte temperaturas entre diferentes escalas.
-    
+
     Args:
         unidad_inicial: Número de unidad inicial (1-8) o nombre de unidad
-        unidad_final: Número de unidad final (1-8) o nombre de unidad  
+        unidad_final: Número de unidad final (1-8) o nombre de unidad
         cantidad: Valor de temperatura a convertir
-    
+
     Returns:
         float: Temperatura convertida
     """
-    
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "celsius",
-        "2": "fahrenheit", 
-        "3": "kelvin",
-        "4": "rankine",
-        "5": "reaumur",
-        "6": "delisle",
-        "7": "newton",
-        "8": "romer"
-    }
-    
-    # 2. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 3. Validaciones
-    unidades_validas = list(unidades.values())
-    if unidad_inicial not in unidades_validas:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in unidades_validas:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 4. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
+    origen, destino = resolver_unidades(TEMPERATURA, unidad_inicial, unidad_final)
+
+    # Si las unidades son iguales, devolver la cantidad sin cambio
+    if origen == destino:
         return cantidad
-    
-    # 5. Convertir primero a Celsius como unidad base
-    def a_celsius(temp, unidad):
-        if unidad == "celsius":
-            return temp
-        elif unidad == "fahrenheit":
-            return (temp - 32) * 5/9
-        elif unidad == "kelvin":
-            return temp - 273.15
-        elif unidad == "rankine":
-            return (temp - 491.67) * 5/9
-        elif unidad == "reaumur":
-            return temp * 5/4
-        elif unidad == "delisle":
-            return 100 - temp * 2/3
-        elif unidad == "newton":
-            return temp * 100/33
-        elif unidad == "romer":
-            return (temp - 7.5) * 40/21
-    
-    # 6. Convertir de Celsius a la unidad final
-    def desde_celsius(temp, unidad):
-        if unidad == "celsius":
-            return temp
-        elif unidad == "fahrenheit":
-            return temp * 9/5 + 32
-        elif unidad == "kelvin":
-            return temp + 273.15
-        elif unidad == "rankine":
-            return temp * 9/5 + 491.67
-        elif unidad == "reaumur":
-            return temp * 4/5
-        elif unidad == "delisle":
-            return (100 - temp) * 3/2
-        elif unidad == "newton":
-            return temp * 33/100
-        elif unidad == "romer":
-            return temp * 21/40 + 7.5
-    
-    # 7. Realizar la conversión
-    temp_celsius = a_celsius(cantidad, unidad_inicial)
-    resultado = desde_celsius(temp_celsius, unidad_final)
-    
-    return resultado
\ No newline at end of file
+
+    return FUNCIONES[origen][destino](cantidad)
+
+
+def convertir_temperatura_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de temperaturas pasando por Celsius, con las mismas operaciones que convertir_temperatura.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-8) o nombre de unidad
+        unidad_final: Número de unidad final (1-8) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Temperaturas convertidas (del tipo dtype), sobre out si se indicó
+    """
+    import numpy as np
+
+    origen, destino = resolver_unidades(TEMPERATURA, unidad_inicial, unidad_final)
+    entrada, salida = preparar_lote(cantidades, out, en_sitio, dtype)
+    if origen == destino:
+        if salida is None:
+            return entrada.copy()
+        np.copyto(salida, entrada)
+        return salida
+
+    # La primera resta escribe en el destino; restar +0.0 no altera ningún valor
+    x0, n, d, z0 = A_CELSIUS[TEMPERATURA.unidades[origen]]
+    resultado = np.subtract(entrada, x0, out=salida)
+    _aplicar_pasos(resultado, (0.0, n, d, z0))
+    return _aplicar_pasos(resultado, DESDE_CELSIUS[TEMPERATURA.unidades[destino]])
+
+
+def convertir_temperatura_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False,
+                                dtype="float64"):
+    """
+    Convierte un arreglo de temperaturas con una escala inicial distinta por fila.
+
+    Los pasos a Celsius de cada fila se recogen con un índice sobre la tabla de
+    escalas y el paso desde Celsius es común a todas. Las filas que ya están en la
+    escala final se dejan intactas, como en convertir_temperatura.
+
+    Args:
+        unidades_iniciales: Escala de cada fila: números (1-8), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-8) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Temperaturas convertidas (del tipo dtype), sobre out si se indicó
+    """
+    import numpy as np
+
+    destino = TEMPERATURA.codigos.get(unidad_final)
+    if destino is None:
+        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
+    numeros = resolver_numeros(TEMPERATURA, unidades_iniciales)
+    entrada, salida = preparar_lote(cantidades, out, en_sitio, dtype)
+    if numeros.shape != entrada.shape:
+        raise ValueError("Las unidades y las cantidades deben tener la misma forma.")
+
+    # Las filas que ya están en la escala final se guardan y se restauran al final
+    iguales = numeros == destino + 1
+    conservadas = entrada[iguales]
+
+    x0, n, d, z0 = (fila.take(numeros) for fila in por_numero(pasos_arreglo(dtype)))
+    resultado = np.subtract(entrada, x0, out=salida)
+    resultado *= n
+    resultado /= d
+    resultado -= z0
+    _aplicar_pasos(resultado, DESDE_CELSIUS[TEMPERATURA.unidades[destino]])
+    resultado[iguales] = conservadas
+    return resultado
@@ -0,0 +1,334 @@
+# Unidades.py - Intérprete de nombres y símbolos de unidades
+#
+# Traduce cualquier forma habitual de escribir una unidad ("km/h", "m³", "°F",
+# "mmol/L", "% m/v", "Kilómetros", "pies cúbicos"...) a (magnitud, código), donde
+# código es el índice 0-based de la unidad en Magnitud.unidades.
+#
+# El índice de alias se construye una sola vez, la primera vez que se usa, con
+# los nombres internos de todas las magnitudes más los símbolos de SIMBOLOS.
+# Las consultas son búsquedas en diccionario y se guardan en caché.
+#
+# Primero se busca el texto respetando mayúsculas, porque en los símbolos cambian
+# el significado (m metro / M molar, ml mililitro / ML megalitro). Solo si no hay
+# coincidencia exacta se ignoran mayúsculas y minúsculas, y si eso cambiaría un
+# prefijo (ML -> ml) la unidad se rechaza como ambigua.
+
+import re
+import unicodedata
+from functools import lru_cache
+
+from conversiones.Registro import cargar_magnitudes, obtener_magnitud
+
+# Símbolos y nombres alternativos de cada unidad (además de su nombre interno).
+# Se escriben tal como aparecen en los datos: el índice los normaliza.
+SIMBOLOS = {
+    "volumen": {
+        "litros": ("l", "L", "litro", "litre", "liter"),
+        "mililitros": ("ml", "mL", "mililitro"),
+        "centimetros_cubicos": ("cm³", "cc", "centímetro cúbico"),
+        "metros_cubicos": ("m³", "metro cúbico"),
+        "galones": ("gal", "galón", "gallon"),
+        "onzas_liquidas": ("fl oz", "onza líquida", "fluid ounce"),
+        "pintas": ("pt", "pinta", "pint"),
+        "cuartos": ("qt", "cuarto", "quart"),
+        "decilitros": ("dl", "dL", "decilitro"),
+        "hectolitros": ("hl", "hL", "hectolitro"),
+        "microlitros": ("µl", "µL", "ul", "uL", "microlitro"),
+        "nanolitros": ("nl", "nL", "nanolitro"),
+        "barriles": ("bbl", "barril", "barrel"),
+        "pies_cubicos": ("ft³", "cu ft", "pie cúbico"),
+        "pulgadas_cubicas": ("in³", "cu in", "pulgada cúbica"),
+        "yardas_cubicas": ("yd³", "cu yd", "yarda cúbica"),
+    },
+    "temperatura": {
+        "celsius": ("°C", "C", "grados celsius", "centígrados"),
+        "fahrenheit": ("°F", "F", "grados fahrenheit"),
+        "kelvin": ("K",),
+        "rankine": ("°Ra", "°R", "R"),
+        "reaumur": ("°Ré", "°Re", "°R", "R", "réaumur"),
+        "delisle": ("°De", "De"),
+        "newton": ("°N",),
+        "romer": ("°Rø", "°Ro", "rømer", "roemer"),
+    },
+    "concentracion": {
+        "molaridad": ("M", "mol/L", "mol/dm³", "molar"),
+        "molalidad": ("mol/kg", "molal"),
+        "fraccion_molar": ("fracción molar", "x", "mol/mol"),
+        "fraccion_masa": ("fracción másica", "fracción en masa", "w", "g/g"),
+        "milimolar": ("mM", "mmol/L"),
+        "micromolar": ("µM", "uM", "µmol/L", "umol/L"),
+        "ppm": ("mg/kg", "partes por millón"),
+        "ppb": ("µg/kg", "ug/kg", "partes por billón"),
+        "g_l": ("g/L", "mg/mL"),
+        "kg_m3": ("kg/m³",),
+        "porcentaje_mv": ("% m/v", "% p/v", "% w/v"),
+        "porcentaje_mm": ("% m/m", "% p/p", "% w/w"),
+    },
+    "densidad": {
+        "kg_m3": ("kg/m³",),
+        "g_cm3": ("g/cm³", "g/mL", "g/cc"),
+        "g_l": ("g/L", "mg/mL"),
+        "lb_ft3": ("lb/ft³", "lb/pie³"),
+        "lb_in3": ("lb/in³",),
+    },
+    "velocidad": {
+        "m_s": ("m/s",),
+        "km_h": ("km/h", "kph", "kmh"),
+        "mph": ("mi/h", "millas por hora"),
+        "ft_s": ("ft/s", "fps", "pies por segundo"),
+        "nudos": ("kn", "kt", "nudo", "knot"),
+    },
+    "masa": {
+        "kg": ("kilogramo", "kilo"),
+        "g": ("gramo", "gr"),
+        "lb": ("libra", "pound"),
+        "mg": ("miligramo",),
+        "t": ("tonelada", "tonne", "ton"),
+        "oz": ("onza", "ounce"),
+        "stone": ("st",),
+        "toneladas_metricas": ("tonelada métrica", "metric ton"),
+        "toneladas_cortas": ("tonelada corta", "short ton", "ton"),
+    },
+    "energia": {
+        "joules": ("J", "julio"),
+        "calorias": ("cal", "caloría"),
+        "kilocalorias": ("kcal", "kilocaloría"),
+        "electronvolts": ("eV", "electronvoltio"),
+        "kilojoules": ("kJ", "kilojulio"),
+        "btu": (),
+        "vatios_hora": ("Wh", "W·h", "vatio hora"),
+        "kilovatios_hora": ("kWh", "kW·h", "kilovatio hora"),
+    },
+    "presion": {
+        "pascales": ("Pa", "pascal"),
+        "kilopascales": ("kPa", "kilopascal"),
+        "bar": (),
+        "atmosferas": ("atm", "atmósfera"),
+        "mmhg": ("mm Hg", "milímetros de mercurio"),
+        "psi": ("lb/in²", "lbf/in²"),
+        "torr": (),
+        "kgf_cm2": ("kgf/cm²", "at"),
+        "inhg": ("in Hg", "pulgadas de mercurio"),
+        "inh2o": ("in H₂O", "pulgadas de agua"),
+        "mmh2o": ("mm H₂O", "mmca", "milímetros de agua"),
+    },
+    "longitud": {
+        "metros": ("m", "metro", "meter", "metre"),
+        "centimetros": ("cm", "centímetro"),
+        "milimetros": ("mm", "milímetro"),
+        "kilometros": ("km", "kilómetro"),
+        "pulgadas": ("in", '"', "pulgada", "inch"),
+        "pies": ("ft", "'", "pie", "foot", "feet"),
+        "yardas": ("yd", "yarda"),
+        "millas": ("mi", "milla", "mile"),
+        "micrometros": ("µm", "um", "micrómetro", "micra", "micrón"),
+    },
+    "area": {
+        "metros_cuadrados": ("m²", "metro cuadrado"),
+        "centimetros_cuadrados": ("cm²", "centímetro cuadrado"),
+        "milimetros_cuadrados": ("mm²", "milímetro cuadrado"),
+        "kilometros_cuadrados": ("km²", "kilómetro cuadrado"),
+        "pulgadas_cuadradas": ("in²", "sq in", "pulgada cuadrada"),
+        "pies_cuadrados": ("ft²", "sq ft", "pie cuadrado"),
+        "yardas_cuadradas": ("yd²", "sq yd", "yarda cuadrada"),
+        "hectareas": ("ha", "hectárea"),
+        "acres": ("ac", "acre"),
+    },
+}
+
+# Caracteres que NFKD no traduce como se necesita
+_TRADUCCION = str.maketrans({
+    "º": "°",   # indicador ordinal, frecuente en lugar del símbolo de grado
+    "µ": "u",   # signo micro
+    "μ": "u",   # letra griega mu
+    "ø": "o",
+    "·": "",
+    "*": "",
+    "^": "",
+})
+
+_SEPARADORES = re.compile(r"[\s_\-]+")
+_JUNTO_A_SIMBOLO = re.compile(r"_?([/%°])_?")
+_PALABRA = re.compile(r"[a-z]+")
+
+# Terminaciones en -s que no son plurales (celsius, ...)
+_NO_PLURALES = ("us", "ss", "is")
+
+# Prefijos SI que pasan a ser otro prefijo al cambiar de mayúscula (mili/mega, pico/peta...)
+_PREFIJOS_AMBIGUOS = frozenset("mMpPyYzZ")
+
+_indice_exacto = None
+_indice = None
+_indice_singular = None
+
+
+def _normalizar(texto):
+    """Como normalizar_unidad, pero conservando mayúsculas y minúsculas."""
+    texto = texto.strip().translate(_TRADUCCION)
+    texto = "".join(
+        caracter for caracter in unicodedata.normalize("NFKD", texto)
+        if not unicodedata.combining(caracter)
+    )
+    texto = _SEPARADORES.sub("_", texto).strip("_")
+    return _JUNTO_A_SIMBOLO.sub(r"\1", texto)
+
+
+def normalizar_unidad(texto):
+    """
+    Devuelve la forma canónica de un nombre o símbolo de unidad.
+
+    Pasa a minúsculas, quita acentos, convierte superíndices y subíndices en
+    dígitos (m³ -> m3), unifica espacios, guiones y guiones bajos, y elimina
+    los separadores junto a '/', '%' y '°'.
+
+    Args:
+        texto: Nombre o símbolo de la unidad (ej: "Metros Cúbicos", "% m/v")
+
+    Returns:
+        str: Forma normalizada (ej: "metros_cubicos", "%m/v")
+    """
+    return _normalizar(texto).casefold()
+
+
+def _sin_s(palabra):
+    if len(palabra) >= 3 and palabra.endswith("s") and not palabra.endswith(_NO_PLURALES):
+        return palabra[:-1]
+    return palabra
+
+
+def _sin_es(palabra):
+    if len(palabra) >= 5 and palabra.endswith("es") and palabra[-3] in "lrndz":
+        return palabra[:-2]
+    return _sin_s(palabra)
+
+
+def _singulares(normalizado):
+    """Devuelve las formas singulares candidatas ("metros_cubicos" -> "metro_cubico", ...)."""
+    formas = []
+    for regla in (_sin_s, _sin_es):
+        forma = _PALABRA.sub(lambda palabra: regla(palabra.group()), normalizado)
+        if forma != normalizado and forma not in formas:
+            formas.append(forma)
+    return formas
+
+
+def _agregar(indice, clave, candidato):
+    candidatos = indice.setdefault(clave, [])
+    if candidato not in candidatos:
+        candidatos.append(candidato)
+
+
+def _construir_indice():
+    """Construye los índices de alias exactos, sin mayúsculas y en singular de todas las magnitudes."""
+    global _indice_exacto, _indice, _indice_singular
+
+    indice_exacto = {}
+    indice = {}
+    indice_singular = {}
+    for nombre_magnitud, magnitud in cargar_magnitudes().items():
+        simbolos = SIMBOLOS.get(nombre_magnitud, {})
+        for codigo, nombre_unidad in enumerate(magnitud.unidades):
+            for alias in (nombre_unidad,) + simbolos.get(nombre_unidad, ()):
+                exacto = _normalizar(alias)
+                clave = exacto.casefold()
+                _agregar(indice_exacto, exacto, (nombre_magnitud, codigo))
+                _agregar(indice, clave, (exacto, (nombre_magnitud, codigo)))
+                for singular in [clave] + _singulares(clave):
+                    _agregar(indice_singular, singular, (exacto, (nombre_magnitud, codigo)))
+
+    _indice_exacto = {clave: tuple(candidatos) for clave, candidatos in indice_exacto.items()}
+    _indice = {clave: tuple(candidatos) for clave, candidatos in indice.items()}
+    _indice_singular = {clave: tuple(candidatos) for clave, candidatos in indice_singular.items()}
+
+
+def _cambia_prefijo(texto, alias):
+    """Indica si leer texto como alias cambiaría la mayúscula de un prefijo SI o de un símbolo de una letra (ej: "ML" como "ml")."""
+    return texto[:1] != alias[:1] and alias[:1] in _PREFIJOS_AMBIGUOS and (alias[1:] == "" or alias[1:] in _indice_exacto)
+
+
+def _sin_mayusculas(texto, exacto, coincidencias, magnitud):
+    """
+    Filtra las coincidencias sin distinguir mayúsculas, (alias, candidato), de un texto.
+
+    Raises:
+        ValueError: Si todas cambiarían un prefijo (ej: "ML", que no es "ml")
+    """
+    if magnitud is not None:
+        coincidencias = [(alias, candidato) for alias, candidato in coincidencias if candidato[0] == magnitud]
+    encontrados = []
+    for alias, candidato in coincidencias:
+        if not _cambia_prefijo(exacto, alias) and candidato not in encontrados:
+            encontrados.append(candidato)
+    if coincidencias and not encontrados:
+        posibles = ", ".join(sorted({alias for alias, _ in coincidencias}))
+        raise ValueError(
+            f"Unidad '{texto}' ambigua: en los símbolos, mayúsculas y minúsculas cambian el "
+            f"significado (m metro / M molar, ml mililitro / ML megalitro). "
+            f"Símbolos parecidos reconocidos: {posibles}."
+        )
+    return tuple(encontrados)
+
+
+def _describir(candidatos):
+    return ", ".join(
+        f"{obtener_magnitud(nombre_magnitud).unidades[codigo]} ({nombre_magnitud})"
+        for nombre_magnitud, codigo in candidatos
+    )
+
+
+@lru_cache(maxsize=4096)
+def interpretar_unidad(texto, magnitud=None):
+    """
+    Traduce un nombre, símbolo o número de menú de unidad a (magnitud, código).
+
+    Acepta acentos, superíndices (m³, cm²), plurales ("kilómetros", "lbs") y
+    símbolos ("km/h", "°F", "mmol/L", "% m/v"). Los símbolos se buscan primero
+    tal cual ("M" es molar y "m" metro); después se ignoran mayúsculas y minúsculas
+    ("KILÓMETROS", "PSI"), salvo si eso cambia un prefijo ("ML" no es "ml"). Los
+    números de menú solo se aceptan si se indica la magnitud.
+
+    Args:
+        texto: Unidad a interpretar
+        magnitud: Nombre de la magnitud para restringir la búsqueda (opcional)
+
+    Returns:
+        tuple: (nombre_magnitud, codigo), con codigo el índice 0-based en Magnitud.unidades
+
+    Raises:
+        ValueError: Si la unidad no se reconoce o si es ambigua (ej: "g/L", que puede
+            ser densidad o concentración, "ton", que puede ser métrica o corta, o
+            "MM", que puede ser milímetros o milimolar)
+    """
+    if magnitud is not None:
+        codigo = obtener_magnitud(magnitud).codigos.get(texto)
+        if codigo is not None:
+            return magnitud, codigo
+
+    if _indice is None:
+        _construir_indice()
+
+    exacto = _normalizar(texto)
+    normalizado = exacto.casefold()
+    candidatos = _indice_exacto.get(exacto, ())
+    if magnitud is not None:
+        candidatos = tuple(candidato for candidato in candidatos if candidato[0] == magnitud)
+
+    if not candidatos:
+        # Sin distinguir mayúsculas y después en singular, salvo si eso cambia un prefijo
+        candidatos = _sin_mayusculas(texto, exacto, _indice.get(normalizado, ()), magnitud)
+    if not candidatos:
+        coincidencias = []
+        for forma in [normalizado] + _singulares(normalizado):
+            coincidencias += [par for par in _indice_singular.get(forma, ()) if par not in coincidencias]
+        candidatos = _sin_mayusculas(texto, exacto, coincidencias, magnitud)
+
+    if not candidatos:
+        if magnitud is not None:
+            raise ValueError(f"Unidad '{texto}' no reconocida para la magnitud {magnitud}.")
+        raise ValueError(f"Unidad '{texto}' no reconocida.")
+    if len(candidatos) > 1:
+        raise ValueError(
+            f"Unidad '{texto}' ambigua: puede ser {_describir(candidatos)}. "
+            f"Indique la magnitud o use un nombre más específico."
+        )
+    return candidatos[0]
@@ -1,41 +1,62 @@
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo de números a nombres
+UNIDADES = {
+    "1": "m_s",
+    "2": "km_h",
+    "3": "mph",
+    "4": "ft_s",
+    "5": "nudos"
+}
+
+# 2. Factores hacia m/s (unidad base)
+FACTORES_POR_M_S = {
+    "m_s": 1.0,
+    "km_h": 3.6,
+    "mph": 2.23694,
+    "ft_s": 3.28084,
+    "nudos": 1.94384
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+VELOCIDAD = registrar_magnitud("velocidad", UNIDADES, FACTORES_POR_M_S)
+
+
 def convertir_velocidad(unidad_inicial, unidad_final, cantidad):
-    # 1. Mapeo de números a nombres
-    unidades = {
-        "1": "m_s",
-        "2": "km_h",
-        "3": "mph",
-        "4": "ft_s",
-        "5": "nudos"
-    }
-    
-    # 2. Factores hacia m/s (unidad base)
-    factores_por_m_s = {
-        "m_s": 1.0,
-        "km_h": 3.6,
-        "mph": 2.23694,
-        "ft_s": 3.28084,
-        "nudos": 1.94384
-    }
-    
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-    
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_m_s:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_m_s:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-    
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-    
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_m_s[unidad_inicial]
-    factor_destino = factores_por_m_s[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-    
-    return cantidad * factor_conversion
\ No newline at end of file
+    return convertir_lineal(VELOCIDAD, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_velocidad_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de velocidades con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-5) o nombre de unidad
+        unidad_final: Número de unidad final (1-5) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(VELOCIDAD, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_velocidad_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de velocidades con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-5), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-5) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(VELOCIDAD, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
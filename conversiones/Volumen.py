@@ -1,26 +1,27 @@
-def convertir_volumen(unidad_inicial, unidad_final, cantidad):
-    # 1. Mapeo opcional de números a nombres
-    unidades = {
-        "1": "litros",
-        "2": "mililitros",
-        "3": "centimetros_cubicos",
-        "4": "metros_cubicos",
-        "5": "galones",
-        "6": "onzas_liquidas",
-        "7": "pintas",
-        "8": "cuartos",
-        "9": "decilitros",
-        "10": "hectolitros",
-        "11": "microlitros",
-        "12": "nanolitros",
-        "13": "barriles",
-        "14": "pies_cubicos",
-        "15": "pulgadas_cubicas",
-        "16": "yardas_cubicas"
-    }
-
-    # 2. Factores hacia litros
-    factores_por_litro = {
+from conversiones.Registro import registrar_magnitud, convertir_lineal, convertir_lineal_lote, convertir_lineal_mixto
+
+# 1. Mapeo opcional de números a nombres
+UNIDADES = {
+    "1": "litros",
+    "2": "mililitros",
+    "3": "centimetros_cubicos",
+    "4": "metros_cubicos",
+    "5": "galones",
+    "6": "onzas_liquidas",
+    "7": "pintas",
+    "8": "cuartos",
+    "9": "decilitros",
+    "10": "hectolitros",
+    "11": "microlitros",
+    "12": "nanolitros",
+    "13": "barriles",
+    "14": "pies_cubicos",
+    "15": "pulgadas_cubicas",
+    "16": "yardas_cubicas"
+}
+
+# 2. Factores hacia litros
+FACTORES_POR_LITRO = {
     "litros": 1.0,
     "mililitros": 1000.0,
     "centimetros_cubicos": 1000.0,
@@ -37,27 +38,47 @@ def convertir_volumen(unidad_inicial, unidad_final, cantidad):
     "pies_cubicos": 0.0353147,
     "pulgadas_cubicas": 61.0237,
     "yardas_cubicas": 0.00130795
-    }
-
-    # 3. Convertir números a nombres de unidad si es necesario
-    if unidad_inicial in unidades:
-        unidad_inicial = unidades[unidad_inicial]
-    if unidad_final in unidades:
-        unidad_final = unidades[unidad_final]
-
-    # 4. Validaciones
-    if unidad_inicial not in factores_por_litro:
-        raise ValueError(f"Unidad inicial '{unidad_inicial}' no válida.")
-    if unidad_final not in factores_por_litro:
-        raise ValueError(f"Unidad final '{unidad_final}' no válida.")
-
-    # 5. Si las unidades son iguales, devolver la cantidad sin cambio
-    if unidad_inicial == unidad_final:
-        return cantidad
-
-    # 6. Cálculo con conversión dinámica
-    factor_origen = factores_por_litro[unidad_inicial]
-    factor_destino = factores_por_litro[unidad_final]
-    factor_conversion = factor_destino / factor_origen
-
-    return cantidad * factor_conversion
+}
+
+# 3. Tablas precalculadas (alias y factores) compartidas por todas las llamadas
+VOLUMEN = registrar_magnitud("volumen", UNIDADES, FACTORES_POR_LITRO)
+
+
+def convertir_volumen(unidad_inicial, unidad_final, cantidad):
+    return convertir_lineal(VOLUMEN, unidad_inicial, unidad_final, cantidad)
+
+
+def convertir_volumen_lote(unidad_inicial, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de volúmenes con una sola multiplicación vectorizada.
+
+    Args:
+        unidad_inicial: Número de unidad inicial (1-16) o nombre de unidad
+        unidad_final: Número de unidad final (1-16) o nombre de unidad
+        cantidades: ndarray, búfer (array.array, memoryview...) o secuencia de valores
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_lote(VOLUMEN, unidad_inicial, unidad_final, cantidades, out, en_sitio, dtype)
+
+
+def convertir_volumen_mixto(unidades_iniciales, unidad_final, cantidades, out=None, en_sitio=False, dtype="float64"):
+    """
+    Convierte un arreglo de volúmenes con una unidad inicial distinta por fila.
+
+    Args:
+        unidades_iniciales: Unidad de cada fila: números (1-16), enteros o texto, o nombres
+        unidad_final: Número de unidad final (1-16) o nombre de unidad
+        cantidades: ndarray, búfer o secuencia de valores, paralela a unidades_iniciales
+        out: Búfer donde escribir el resultado, del mismo tipo que dtype (opcional)
+        en_sitio: Si es True, sobrescribe cantidades con el resultado
+        dtype: "float64" (por defecto) o "float32"
+
+    Returns:
+        numpy.ndarray: Valores convertidos (del tipo dtype), sobre out si se indicó
+    """
+    return convertir_lineal_mixto(VOLUMEN, unidades_iniciales, unidad_final, cantidades, out, en_sitio, dtype)
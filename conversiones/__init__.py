@@ -0,0 +1,51 @@
+# conversiones - Paquete de conversiones de unidades
+#
+# Las funciones públicas también están disponibles como atributos del paquete
+# (ej: conversiones.convertir_presion). Su módulo se importa la primera vez que
+# se usan, así que importar el paquete no carga ninguna magnitud.
+
+from importlib import import_module
+
+_FUNCIONES_POR_MODULO = {
+    "conversiones.Volumen": ("convertir_volumen", "convertir_volumen_lote", "convertir_volumen_mixto"),
+    "conversiones.Temperatura": ("convertir_temperatura", "convertir_temperatura_lote", "convertir_temperatura_mixto"),
+    "conversiones.Concentracion": (
+        "convertir_concentracion", "convertir_concentracion_lote", "compilar_concentracion",
+        "necesita_parametros_adicionales", "calcular_fracciones_mezcla_binaria",
+        "calcular_fracciones_mezcla_binaria_lote", "convertir_fraccion_masa_a_molar",
+        "convertir_fraccion_molar_a_masa", "convertir_composicion_masa_a_molar",
+        "convertir_composicion_molar_a_masa",
+    ),
+    "conversiones.Densidad": ("convertir_densidad", "convertir_densidad_lote", "convertir_densidad_mixto"),
+    "conversiones.Velocidad": ("convertir_velocidad", "convertir_velocidad_lote", "convertir_velocidad_mixto"),
+    "conversiones.Masa": ("convertir_masa", "convertir_masa_lote", "convertir_masa_mixto"),
+    "conversiones.Energia": ("convertir_energia", "convertir_energia_lote", "convertir_energia_mixto"),
+    "conversiones.Presion": ("convertir_presion", "convertir_presion_lote", "convertir_presion_mixto"),
+    "conversiones.Longitud": ("convertir_longitud", "convertir_longitud_lote", "convertir_longitud_mixto"),
+    "conversiones.Area": ("convertir_area", "convertir_area_lote", "convertir_area_mixto"),
+    "conversiones.Convertidores": (
+        "obtener_convertidor", "convertir", "convertir_lote", "convertir_a_todas", "formatear_tabla",
+        "informe_precision",
+    ),
+    "conversiones.Unidades": ("interpretar_unidad", "normalizar_unidad"),
+    "conversiones.Especializadas": ("funcion_par", "generar_fuente"),
+}
+
+_MODULO_DE = {
+    funcion: modulo
+    for modulo, funciones in _FUNCIONES_POR_MODULO.items()
+    for funcion in funciones
+}
+
+
+def __getattr__(nombre):
+    modulo = _MODULO_DE.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module 'conversiones' has no attribute '{nombre}'")
+    valor = getattr(import_module(modulo), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULO_DE))
@@ -0,0 +1,93 @@
+# Conversión de archivos desde la línea de comandos
+#
+# Un error a mitad de la conversión, o una salida que es el propio archivo de
+# entrada, no puede dejar el destino vacío ni a medias.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Conversor_de_unidades import main
+
+CONTENIDO = "p,q\n1,2\n3,x\n"
+
+
+def escribir_csv(carpeta):
+    ruta = carpeta / "s.csv"
+    ruta.write_text(CONTENIDO, encoding="utf-8")
+    return ruta
+
+
+def test_columna_inexistente_no_borra_la_entrada(tmp_path, monkeypatch):
+    escribir_csv(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    assert main(["csv", "presion", "1", "4", "s.csv", "./s.csv", "-c", "r", "--encabezado"]) == 1
+    assert (tmp_path / "s.csv").read_text(encoding="utf-8") == CONTENIDO
+    assert os.listdir(tmp_path) == ["s.csv"]
+
+
+def test_error_a_mitad_no_deja_salida(tmp_path):
+    entrada = escribir_csv(tmp_path)
+    salida = tmp_path / "salida.csv"
+    assert main(["csv", "presion", "1", "4", str(entrada), str(salida), "-c", "q", "--encabezado"]) == 1
+    assert not salida.exists()
+    assert os.listdir(tmp_path) == ["s.csv"]
+
+
+def test_salida_igual_a_la_entrada(tmp_path):
+    entrada = escribir_csv(tmp_path)
+    assert main(["csv", "presion", "1", "1", str(entrada), str(entrada), "-c", "p", "--encabezado"]) == 0
+    assert entrada.read_text(encoding="utf-8") == "p,q\n1.0,2\n3.0,x\n"
+
+
+@pytest.mark.parametrize("opciones", [["--dtype", "foo"], ["--bloque", "0"], ["--bloque", "-5"]])
+def test_opciones_de_binario_no_validas(tmp_path, opciones):
+    with pytest.raises(SystemExit) as salida:
+        main(["binario", "presion", "1", "2", str(tmp_path / "x.bin"), str(tmp_path / "y.bin"), *opciones])
+    assert salida.value.code == 2
+
+
+def test_binario_tipo_no_admitido(tmp_path):
+    np = pytest.importorskip("numpy")
+    from conversiones.Archivos import convertir_binario
+
+    entrada = tmp_path / "x.bin"
+    np.zeros(4).tofile(entrada)
+    with pytest.raises(ValueError, match="no admitido"):
+        convertir_binario(str(entrada), lambda valores: valores, str(tmp_path / "y.bin"), dtype="int8")
+    with pytest.raises(ValueError, match="bloque"):
+        convertir_binario(str(entrada), lambda valores: valores, str(tmp_path / "y.bin"), tamano_bloque=0)
+    assert os.listdir(tmp_path) == ["x.bin"]
+
+
+@pytest.mark.parametrize("magnitud, inicial, final", [("presion", "Pa", "psi"), ("Presión", "pascales", "psi")])
+def test_csv_admite_simbolos(tmp_path, magnitud, inicial, final):
+    from conversiones.Convertidores import convertir
+
+    entrada = escribir_csv(tmp_path)
+    salida = tmp_path / "salida.csv"
+    assert main(["csv", magnitud, inicial, final, str(entrada), str(salida), "-c", "p", "--encabezado"]) == 0
+    filas = salida.read_text(encoding="utf-8").splitlines()
+    assert [float(fila.split(",")[0]) for fila in filas[1:]] == [
+        convertir("presion", "Pa", "psi", 1), convertir("presion", "Pa", "psi", 3)
+    ]
+
+
+def test_binario_admite_simbolos(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    entrada = tmp_path / "x.bin"
+    salida = tmp_path / "y.bin"
+    np.array([0.0, 100.0]).tofile(entrada)
+    assert main(["binario", "temperatura", "°C", "°F", str(entrada), str(salida)]) == 0
+    assert np.fromfile(salida).tolist() == [32.0, 212.0]
+
+
+def test_csv_bloque_no_valido(tmp_path):
+    entrada = escribir_csv(tmp_path)
+    with pytest.raises(SystemExit) as salida:
+        main(["csv", "presion", "1", "4", str(entrada), "-", "-c", "p", "--bloque", "0"])
+    assert salida.value.code == 2
@@ -0,0 +1,43 @@
+# Caché de resultados desde la API de biblioteca
+#
+# convertir() consulta la caché cuando está activada, y la clave distingue el
+# tipo y el signo del valor (0.0 y -0.0 no comparten resultado).
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.Cache import activar_cache, desactivar_cache, estadisticas_cache
+from conversiones.Convertidores import convertir
+
+
+@pytest.fixture
+def cache():
+    activar_cache(16)
+    yield
+    desactivar_cache()
+
+
+def test_convertir_usa_la_cache(cache):
+    assert convertir("presion", "atm", "psi", 1.0) == convertir("presion", "atm", "psi", 1.0)
+    assert convertir("concentracion", "M", "mM", 1.0, masa_molar=58.44) == 1000.0
+    assert convertir("concentracion", "M", "mM", 1.0, masa_molar=58.44) == 1000.0
+    estadisticas = estadisticas_cache()
+    assert (estadisticas["aciertos"], estadisticas["fallos"]) == (2, 2)
+
+
+def test_la_clave_conserva_el_signo_de_cero(cache):
+    assert math.copysign(1.0, convertir("presion", "Pa", "kPa", 0.0)) == 1.0
+    assert math.copysign(1.0, convertir("presion", "Pa", "kPa", -0.0)) == -1.0
+    assert math.copysign(1.0, convertir("temperatura", "celsius", "celsius", -0.0)) == -1.0
+    assert estadisticas_cache()["aciertos"] == 0
+
+
+def test_sin_cache_no_guarda_nada():
+    desactivar_cache()
+    assert convertir("presion", "atm", "psi", 1.0) == convertir("presion", "atm", "psi", 1.0)
+    assert estadisticas_cache() is None
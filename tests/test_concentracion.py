@@ -0,0 +1,161 @@
+# Equivalencia de las conversiones de concentración con las fórmulas originales
+#
+# La referencia son las funciones a_g_l y desde_g_l originales, que pasan por g/L
+# multiplicando y dividiendo en un orden concreto. Los planes compilados y los
+# lotes deben reproducir exactamente los mismos floats.
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.Concentracion import CONCENTRACION, FRACCIONES, compilar_concentracion, convertir_concentracion
+from conversiones.Convertidores import convertir, obtener_convertidor
+
+UNIDADES = [unidad for unidad in CONCENTRACION.unidades if unidad not in FRACCIONES]
+PARES = [(inicial, final) for inicial in UNIDADES for final in UNIDADES]
+
+VALORES = [0.0, -0.0, 1.0, 2.0, 0.1, 0.3, 0.5, 7.0, 12.5, 30.0, 123.456, 1e-9, 1e6, -1.0]
+PARAMETROS = [(58.44, 1.02), (180.16, 1.0), (18.015, 0.997), (342.3, 1.33)]
+
+
+def a_g_l(valor, unidad, mm, dens):
+    if unidad in ("g_l", "kg_m3"):
+        return valor
+    elif unidad == "ppm":
+        return valor / 1000
+    elif unidad == "ppb":
+        return valor / 1_000_000
+    elif unidad == "porcentaje_mv":
+        return valor * 10
+    elif unidad == "porcentaje_mm":
+        return valor * dens * 10
+    elif unidad == "molaridad":
+        return valor * mm
+    elif unidad == "milimolar":
+        return valor * mm / 1000
+    elif unidad == "micromolar":
+        return valor * mm / 1_000_000
+    elif unidad == "molalidad":
+        return valor * mm * dens / (1 + valor * mm / 1000)
+
+
+def desde_g_l(valor, unidad, mm, dens):
+    if unidad in ("g_l", "kg_m3"):
+        return valor
+    elif unidad == "ppm":
+        return valor * 1000
+    elif unidad == "ppb":
+        return valor * 1_000_000
+    elif unidad == "porcentaje_mv":
+        return valor / 10
+    elif unidad == "porcentaje_mm":
+        return valor / (dens * 10)
+    elif unidad == "molaridad":
+        return valor / mm
+    elif unidad == "milimolar":
+        return valor * 1000 / mm
+    elif unidad == "micromolar":
+        return valor * 1_000_000 / mm
+    elif unidad == "molalidad":
+        denominador = mm * dens - valor * mm / 1000
+        if denominador <= 0:
+            raise ValueError("Concentración demasiado alta para conversión a molalidad")
+        return valor / denominador * 1000
+
+
+def convertir_original(inicial, final, valor, mm, dens):
+    """Fórmulas originales; None si la conversión no es posible."""
+    if inicial == final:
+        return valor
+    try:
+        return desde_g_l(a_g_l(valor, inicial, mm, dens), final, mm, dens)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def casos(inicial, final):
+    return [
+        (valor, mm, dens, convertir_original(inicial, final, valor, mm, dens))
+        for valor in VALORES for mm, dens in PARAMETROS
+    ]
+
+
+def mismos_bits(obtenido, esperado):
+    return (obtenido == esperado and type(obtenido) is type(esperado)
+            and math.copysign(1.0, obtenido) == math.copysign(1.0, esperado))
+
+
+@pytest.mark.parametrize("inicial, final", PARES)
+def test_escalar_y_plan_iguales_al_original(inicial, final):
+    for valor, mm, dens, esperado in casos(inicial, final):
+        if esperado is None:
+            with pytest.raises(ValueError):
+                convertir_concentracion(inicial, final, valor, masa_molar=mm, densidad=dens)
+            continue
+        assert mismos_bits(convertir_concentracion(inicial, final, valor, masa_molar=mm, densidad=dens), esperado)
+        convertidor = obtener_convertidor("concentracion", inicial, final, masa_molar=mm, densidad=dens)
+        assert mismos_bits(convertidor(valor), esperado)
+
+
+@pytest.mark.parametrize("inicial, final", PARES)
+def test_lote_igual_al_original(inicial, final):
+    np = pytest.importorskip("numpy")
+    from conversiones.Concentracion import convertir_concentracion_lote
+
+    for mm, dens in PARAMETROS:
+        esperados = [convertir_original(inicial, final, valor, mm, dens) for valor in VALORES]
+        resultado, validos = convertir_concentracion_lote(inicial, final, np.array(VALORES),
+                                                          masa_molar=mm, densidad=dens)
+        for obtenido, valido, esperado in zip(resultado.tolist(), validos, esperados):
+            if esperado is None:
+                assert not valido and math.isnan(obtenido)
+            else:
+                assert valido and obtenido == esperado
+                assert math.copysign(1.0, obtenido) == math.copysign(1.0, esperado)
+
+
+def test_milimolar_exacto():
+    assert convertir("concentracion", "M", "mM", 1.0, masa_molar=58.44) == 1000.0
+    assert repr(convertir_concentracion("molaridad", "milimolar", 1.0, masa_molar=58.44)) == "1000.0"
+
+
+def test_parametros_por_fila_en_plan():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="convertir_concentracion_lote"):
+        compilar_concentracion("molaridad", "g_l", masa_molar=np.array([58.44, 180.16]))
+    with pytest.raises(ValueError, match="convertir_concentracion_lote"):
+        convertir_concentracion("molalidad", "g_l", 1.0, masa_molar=58.44, densidad=[1.0, 1.1])
+
+
+@pytest.mark.parametrize("inicial, final, mm, dens", [
+    ("molalidad", "g_l", 1000.0, 1.0),      # denominador 1 + m·M/1000 nulo en la primera fila
+    ("g_l", "molalidad", 58.44, 1.0),       # concentración demasiado alta en la primera fila
+    ("g_l", "molaridad", 0.0, None),        # masa molar nula: división por cero
+])
+def test_plan_con_arreglos_igual_al_lote(inicial, final, mm, dens):
+    np = pytest.importorskip("numpy")
+    from conversiones.Concentracion import convertir_concentracion_lote
+
+    cantidades = np.array([-1.0 if inicial == "molalidad" else 1e9, 0.5, 30.0])
+    plan = compilar_concentracion(inicial, final, masa_molar=mm, densidad=dens)
+    with np.errstate(all="raise"):
+        obtenido = plan(cantidades)
+    esperado, validos = convertir_concentracion_lote(inicial, final, cantidades, masa_molar=mm, densidad=dens)
+    assert np.isnan(obtenido[0]) and not validos[0]
+    np.testing.assert_array_equal(obtenido, esperado)
+
+
+@pytest.mark.parametrize("tipo", ["masa", "molar"])
+def test_fracciones_lote_conservan_la_forma(tipo):
+    np = pytest.importorskip("numpy")
+    from conversiones.Concentracion import calcular_fracciones_mezcla_binaria_lote
+
+    escalares = calcular_fracciones_mezcla_binaria_lote(0.25, 18.015, 46.07, tipo)
+    assert [fraccion.shape for fraccion in escalares] == [()] * 4
+    matriz = calcular_fracciones_mezcla_binaria_lote(np.full((2, 3), 0.25), 18.015, [[46.07]] * 2, tipo)
+    assert [fraccion.shape for fraccion in matriz] == [(2, 3)] * 4
+    assert all(np.all(fila == escalar) for fila, escalar in zip(matriz, escalares))
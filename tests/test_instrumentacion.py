@@ -0,0 +1,34 @@
+# Activación y desactivación de la instrumentación
+#
+# Desactivada, ninguna ruta de acceso a las funciones convertir_* puede seguir
+# pasando por las versiones medidas.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import conversiones
+from conversiones import Presion
+from conversiones.Instrumentacion import (activar_instrumentacion, desactivar_instrumentacion, instantanea,
+                                          reiniciar_metricas)
+
+
+def test_desactivar_restaura_los_nombres_del_paquete():
+    original = Presion.convertir_presion
+    vars(conversiones).pop("convertir_presion", None)
+    reiniciar_metricas()
+
+    activar_instrumentacion()
+    try:
+        # Primer acceso con la instrumentación activa: el paquete guarda la versión medida
+        assert conversiones.convertir_presion("1", "2", 1.0) == 0.001
+        assert instantanea()["presion"]["pascales->kilopascales"]["llamadas"] == 1
+    finally:
+        desactivar_instrumentacion()
+
+    assert conversiones.convertir_presion is original
+    assert Presion.convertir_presion is original
+    conversiones.convertir_presion("1", "2", 1.0)
+    assert instantanea()["presion"]["pascales->kilopascales"]["llamadas"] == 1
+    reiniciar_metricas()
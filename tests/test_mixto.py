@@ -0,0 +1,33 @@
+# Numeración de las unidades en las conversiones con unidad inicial por fila
+#
+# Los enteros son números de menú (1-based), igual que "1", "2"... en texto,
+# la CLI y el protocolo binario.
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.Presion import convertir_presion, convertir_presion_mixto
+from conversiones.Temperatura import convertir_temperatura, convertir_temperatura_mixto
+
+CANTIDADES = np.array([1.0, 2.0, 3.0, 4.0])
+
+
+def test_enteros_y_texto_son_numeros_de_menu():
+    esperado = [convertir_presion(unidad, "1", valor) for unidad, valor in zip("6136", CANTIDADES)]
+    assert list(convertir_presion_mixto([6, 1, 3, 6], "1", CANTIDADES)) == esperado
+    assert list(convertir_presion_mixto(["6", "1", "3", "6"], "1", CANTIDADES)) == esperado
+
+    esperado = [convertir_temperatura(unidad, "3", valor) for unidad, valor in zip("1248", CANTIDADES)]
+    assert list(convertir_temperatura_mixto(np.array([1, 2, 4, 8]), "3", CANTIDADES)) == esperado
+
+
+@pytest.mark.parametrize("numero", [0, 12])
+def test_numero_fuera_de_rango(numero):
+    with pytest.raises(ValueError, match="fuera de rango 1-11"):
+        convertir_presion_mixto([1, numero, 1, 1], "1", CANTIDADES)
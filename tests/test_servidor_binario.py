@@ -0,0 +1,56 @@
+# Ciclo de vida del socket del servidor binario
+#
+# El servidor solo reemplaza y borra sockets, y al cerrarse solo borra el suyo.
+
+import asyncio
+import os
+import socket
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("numpy")
+if not hasattr(socket, "AF_UNIX"):
+    pytest.skip("Requiere sockets Unix", allow_module_level=True)
+
+from conversiones.ServidorBinario import desempaquetar_respuesta, empaquetar_peticion, servir
+
+
+def test_no_borra_un_archivo_normal(tmp_path):
+    ruta = tmp_path / "datos.txt"
+    ruta.write_text("no es un socket")
+    with pytest.raises(ValueError, match="no es un socket"):
+        asyncio.run(servir(str(ruta)))
+    assert ruta.read_text() == "no es un socket"
+
+
+def test_atiende_y_borra_solo_su_socket(tmp_path):
+    ruta = str(tmp_path / "conversor.sock")
+
+    async def sesion(reemplazar):
+        tarea = asyncio.create_task(servir(ruta))
+        while not os.path.exists(ruta):
+            await asyncio.sleep(0.01)
+        lector, escritor = await asyncio.open_unix_connection(ruta)
+        escritor.write(empaquetar_peticion(7, 8, 1, 2, [1.0, 2.0]))
+        longitud = int.from_bytes(await lector.readexactly(4), "little")
+        respuesta = desempaquetar_respuesta(await lector.readexactly(longitud))
+        escritor.close()
+        if reemplazar:
+            # Otro proceso ocupa la ruta mientras el servidor sigue abierto
+            os.unlink(ruta)
+            with open(ruta, "w") as archivo:
+                archivo.write("otro")
+        tarea.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarea
+        return respuesta[0], list(respuesta[1])
+
+    assert asyncio.run(sesion(False)) == (7, [0.001, 0.002])
+    assert not os.path.exists(ruta)
+
+    asyncio.run(sesion(True))
+    with open(ruta) as archivo:
+        assert archivo.read() == "otro"
@@ -0,0 +1,67 @@
+# Respuestas del servicio HTTP
+#
+# Toda petición con JSON válido recibe una respuesta JSON válida: los errores de
+# conversión son un 400 y los resultados no finitos se devuelven como null.
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.ServidorHTTP import _respuesta, procesar_peticion
+
+ENTERO_ENORME = "1" + "0" * 400
+
+
+def peticion(ruta, cuerpo):
+    """Procesa la petición y vuelve a leer el JSON enviado, rechazando Infinity y NaN."""
+    if not isinstance(cuerpo, str):
+        cuerpo = json.dumps(cuerpo)
+    estado, respuesta = procesar_peticion("POST", ruta, cuerpo.encode("utf-8"))
+    contenido = _respuesta(estado, respuesta, False).split(b"\r\n\r\n", 1)[1]
+    return estado, json.loads(contenido, parse_constant=lambda constante: pytest.fail(constante))
+
+
+def test_convertir():
+    assert peticion("/convertir", {"magnitud": "presion", "desde": "1", "hasta": "2", "valor": 2}) == (
+        200, {"resultado": 0.002}
+    )
+
+
+@pytest.mark.parametrize("ruta, cuerpo", [
+    ("/convertir", '{"magnitud": "concentracion", "desde": "2", "hasta": "9", "valor": -1, '
+                   '"masa_molar": 1000, "densidad": 1}'),
+    ("/convertir", '{"magnitud": "presion", "desde": "1", "hasta": "2", "valor": ' + ENTERO_ENORME + '}'),
+    ("/lote", '{"magnitud": "presion", "desde": "1", "hasta": "2", "valores": [1, ' + ENTERO_ENORME + ']}'),
+    ("/lote", '{"magnitud": "presion", "desde": "1", "hasta": "2", "valores": [1, [2]]}'),
+    ("/lote", '{"magnitud": "presion", "desde": "1", "hasta": "2", "valores": [null]}'),
+    ("/convertir", '{"magnitud": "presion", "desde": "1", "hasta": "2"}'),
+    ("/convertir", '[1, 2]'),
+])
+def test_errores_de_conversion_son_400(ruta, cuerpo):
+    estado, respuesta = peticion(ruta, cuerpo)
+    assert estado == 400
+    assert respuesta["error"]
+
+
+def test_resultados_no_finitos_son_null():
+    assert peticion("/convertir", {"magnitud": "presion", "desde": "1", "hasta": "2", "valor": "1e400"}) == (
+        200, {"resultado": None}
+    )
+    assert peticion("/lote", {"magnitud": "presion", "desde": "1", "hasta": "2", "valores": [1, "1e400", 2.5]}) == (
+        200, {"resultados": [0.001, None, 0.0025]}
+    )
+
+
+def test_lote_de_concentracion_con_filas_invalidas():
+    cuerpo = {"magnitud": "concentracion", "desde": "2", "hasta": "9", "valores": [-1, 1],
+              "masa_molar": 1000, "densidad": 1}
+    assert peticion("/lote", cuerpo) == (200, {"resultados": [None, 500.0]})
+
+
+def test_rutas_desconocidas():
+    assert procesar_peticion("GET", "/nada", b"")[0] == 404
+    assert procesar_peticion("GET", "/convertir", b"")[0] == 405
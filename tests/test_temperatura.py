@@ -0,0 +1,146 @@
+# Equivalencia de las conversiones de temperatura con las fórmulas originales
+#
+# Uso (desde la raíz del repositorio):
+#     python -m pytest tests
+#
+# La referencia es la función convertir_temperatura original, con sus fórmulas
+# paso a paso por Celsius. Todas las rutas (escalar, convertidor compilado,
+# funciones generadas, lotes y mixto) deben dar exactamente los mismos bits,
+# incluido el signo de los ceros.
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.Convertidores import convertir_a_todas, obtener_convertidor
+from conversiones.Especializadas import funcion_par
+from conversiones.Temperatura import TEMPERATURA, convertir_temperatura
+
+UNIDADES = TEMPERATURA.unidades
+PARES = [(inicial, final) for inicial in UNIDADES for final in UNIDADES]
+
+# Puntos de referencia de todas las escalas, extremos y valores sin representación exacta
+VALORES = [
+    0.0, -0.0, 1.0, -1.0, 0.1, 0.2, 0.3, 7.5, 32.0, 33.0, 37.0, 60.0, 80.0, 100.0, 150.0,
+    212.0, 273.15, 491.67, 671.67, -40.0, -90.14, -273.15, -459.67, 1234.5678,
+    1e-300, -1e-300, 1e300, math.inf, -math.inf, math.nan,
+] + [(-500.0 + 5500.0 * i / 97) for i in range(98)]
+
+
+def convertir_temperatura_original(unidad_inicial, unidad_final, cantidad):
+    """Fórmulas originales, sin precalcular: la referencia de las pruebas."""
+    if unidad_inicial == unidad_final:
+        return cantidad
+
+    def a_celsius(temp, unidad):
+        if unidad == "celsius":
+            return temp
+        elif unidad == "fahrenheit":
+            return (temp - 32) * 5/9
+        elif unidad == "kelvin":
+            return temp - 273.15
+        elif unidad == "rankine":
+            return (temp - 491.67) * 5/9
+        elif unidad == "reaumur":
+            return temp * 5/4
+        elif unidad == "delisle":
+            return 100 - temp * 2/3
+        elif unidad == "newton":
+            return temp * 100/33
+        elif unidad == "romer":
+            return (temp - 7.5) * 40/21
+
+    def desde_celsius(temp, unidad):
+        if unidad == "celsius":
+            return temp
+        elif unidad == "fahrenheit":
+            return temp * 9/5 + 32
+        elif unidad == "kelvin":
+            return temp + 273.15
+        elif unidad == "rankine":
+            return temp * 9/5 + 491.67
+        elif unidad == "reaumur":
+            return temp * 4/5
+        elif unidad == "delisle":
+            return (100 - temp) * 3/2
+        elif unidad == "newton":
+            return temp * 33/100
+        elif unidad == "romer":
+            return temp * 21/40 + 7.5
+
+    return desde_celsius(a_celsius(cantidad, unidad_inicial), unidad_final)
+
+
+def mismos_bits(obtenido, esperado):
+    obtenido = float(obtenido)
+    if math.isnan(esperado):
+        return math.isnan(obtenido)
+    return obtenido == esperado and math.copysign(1.0, obtenido) == math.copysign(1.0, esperado)
+
+
+def diferencias(funcion, inicial, final):
+    return [
+        (valor, funcion(valor), convertir_temperatura_original(inicial, final, valor))
+        for valor in VALORES
+        if not mismos_bits(funcion(valor), convertir_temperatura_original(inicial, final, valor))
+    ]
+
+
+@pytest.mark.parametrize("inicial, final", PARES)
+def test_escalar_igual_al_original(inicial, final):
+    assert diferencias(lambda valor: convertir_temperatura(inicial, final, valor), inicial, final) == []
+
+
+@pytest.mark.parametrize("inicial, final", PARES)
+def test_convertidor_compilado_igual_al_original(inicial, final):
+    assert diferencias(obtener_convertidor("temperatura", inicial, final), inicial, final) == []
+
+
+@pytest.mark.parametrize("inicial, final", PARES)
+def test_funcion_generada_igual_al_original(inicial, final):
+    assert diferencias(funcion_par("temperatura", inicial, final), inicial, final) == []
+
+
+@pytest.mark.parametrize("inicial, final", PARES)
+def test_lotes_iguales_al_original(inicial, final):
+    np = pytest.importorskip("numpy")
+    from conversiones.Temperatura import convertir_temperatura_lote, convertir_temperatura_mixto
+
+    esperados = [convertir_temperatura_original(inicial, final, valor) for valor in VALORES]
+    cantidades = np.array(VALORES)
+    lote = convertir_temperatura_lote(inicial, final, cantidades)
+    mixto = convertir_temperatura_mixto([inicial] * len(VALORES), final, cantidades)
+    assert [valor for valor, x, y in zip(VALORES, lote, esperados) if not mismos_bits(x, y)] == []
+    assert [valor for valor, x, y in zip(VALORES, mixto, esperados) if not mismos_bits(x, y)] == []
+
+
+@pytest.mark.parametrize("final", UNIDADES)
+def test_mixto_con_escalas_alternadas_igual_al_original(final):
+    np = pytest.importorskip("numpy")
+    from conversiones.Temperatura import convertir_temperatura_mixto
+
+    filas = [(inicial, valor) for valor in VALORES for inicial in UNIDADES]
+    cantidades = np.array([valor for _, valor in filas])
+    mixto = convertir_temperatura_mixto([inicial for inicial, _ in filas], final, cantidades, en_sitio=True)
+    assert [
+        (inicial, valor) for (inicial, valor), obtenido in zip(filas, mixto)
+        if not mismos_bits(obtenido, convertir_temperatura_original(inicial, final, valor))
+    ] == []
+
+
+def test_puntos_de_referencia_exactos():
+    assert convertir_temperatura("rankine", "celsius", 491.67) == 0.0
+    assert convertir_temperatura("fahrenheit", "celsius", 32.0) == 0.0
+    assert convertir_temperatura("kelvin", "celsius", 273.15) == 0.0
+    assert math.copysign(1.0, convertir_temperatura("celsius", "delisle", 100.0)) == 1.0
+
+
+def test_tabla_todas_las_unidades_exacta():
+    pytest.importorskip("numpy")
+    unidades, matriz = convertir_a_todas("temperatura", "fahrenheit", [212.0])
+    for unidad, fila in zip(unidades, matriz):
+        assert mismos_bits(fila[0], convertir_temperatura_original("fahrenheit", unidad, 212.0))
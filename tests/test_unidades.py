@@ -0,0 +1,42 @@
+# Mayúsculas y minúsculas en los símbolos de unidad
+#
+# Los símbolos se buscan primero tal cual; ignorar mayúsculas no puede cambiar
+# un prefijo (ML no es ml) ni una unidad de una letra (M molar, m metro).
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversiones.Unidades import interpretar_unidad
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("m", ("longitud", 0)),
+    ("M", ("concentracion", 0)),
+    ("mm", ("longitud", 2)),
+    ("mM", ("concentracion", 4)),
+    ("mL", ("volumen", 1)),
+    ("L", ("volumen", 0)),
+    ("µm", ("longitud", 8)),
+    ("µM", ("concentracion", 5)),
+    ("KILÓMETROS", ("longitud", 3)),
+    ("PSI", ("presion", 5)),
+    ("KM/H", ("velocidad", 1)),
+])
+def test_simbolos_respetan_mayusculas(texto, esperado):
+    assert interpretar_unidad(texto) == esperado
+
+
+@pytest.mark.parametrize("texto, magnitud", [
+    ("ML", None),
+    ("MLs", None),
+    ("MM", None),
+    ("M", "longitud"),
+    ("m", "concentracion"),
+])
+def test_cambio_de_prefijo_es_ambiguo(texto, magnitud):
+    with pytest.raises(ValueError, match="ambigua"):
+        interpretar_unidad(texto, magnitud)